@@ -0,0 +1,82 @@
+"""add project_task_stats counters maintained by triggers
+
+Revision ID: 5e2b9c41d8a3
+Revises: 8192fd19b7d5
+Create Date: 2026-10-17 14:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e2b9c41d8a3"
+down_revision: Union[str, None] = "8192fd19b7d5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_APPLY_FUNCTION = """
+CREATE OR REPLACE FUNCTION project_task_stats_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        UPDATE project_task_stats SET task_count = task_count - 1
+        WHERE project_id = OLD.project_id AND status = OLD.status;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        INSERT INTO project_task_stats AS stats (project_id, status, task_count)
+        VALUES (NEW.project_id, NEW.status, 1)
+        ON CONFLICT (project_id, status) DO UPDATE SET task_count = stats.task_count + 1;
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_task_stats",
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("task_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("project_id", "status"),
+    )
+    op.create_index(
+        "ix_tasks_project_open_due",
+        "tasks",
+        ["project_id", "due_date"],
+        unique=False,
+        postgresql_where=sa.text("status <> 'done'"),
+    )
+
+    # Lock out task writes between the backfill and the triggers going live,
+    # otherwise a concurrent insert would be missed by both.
+    op.execute("LOCK TABLE tasks IN SHARE MODE")
+    op.execute(
+        "INSERT INTO project_task_stats (project_id, status, task_count) "
+        "SELECT project_id, status, count(*) FROM tasks GROUP BY project_id, status"
+    )
+    op.execute(_APPLY_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER tasks_stats_insert_delete AFTER INSERT OR DELETE ON tasks "
+        "FOR EACH ROW EXECUTE FUNCTION project_task_stats_apply()"
+    )
+    op.execute(
+        "CREATE TRIGGER tasks_stats_update AFTER UPDATE OF project_id, status ON tasks "
+        "FOR EACH ROW "
+        "WHEN (OLD.project_id IS DISTINCT FROM NEW.project_id OR OLD.status IS DISTINCT FROM NEW.status) "
+        "EXECUTE FUNCTION project_task_stats_apply()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS tasks_stats_update ON tasks")
+    op.execute("DROP TRIGGER IF EXISTS tasks_stats_insert_delete ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS project_task_stats_apply()")
+    op.drop_index("ix_tasks_project_open_due", table_name="tasks")
+    op.drop_table("project_task_stats")
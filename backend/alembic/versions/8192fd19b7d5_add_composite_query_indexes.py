@@ -0,0 +1,58 @@
+"""add composite indexes for list and access queries
+
+Revision ID: 8192fd19b7d5
+Revises: c3a1f0d2b7e4
+Create Date: 2026-10-17 12:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8192fd19b7d5"
+down_revision: Union[str, None] = "c3a1f0d2b7e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns, extra kwargs)
+_INDEXES = (
+    ("ix_team_members_user_team", "team_members", ["user_id", "team_id"], {"postgresql_include": ["role"]}),
+    ("ix_team_members_team_joined", "team_members", ["team_id", "joined_at", "id"], {}),
+    ("ix_projects_team_created", "projects", ["team_id", "created_at", "id"], {}),
+    ("ix_tasks_project_created", "tasks", ["project_id", "created_at", "id"], {}),
+    ("ix_tasks_project_status_created", "tasks", ["project_id", "status", "created_at", "id"], {}),
+    ("ix_tasks_assignee_created", "tasks", ["assigned_user_id", "created_at", "id"], {}),
+    ("ix_tasks_assignee_due", "tasks", ["assigned_user_id", "due_date", sa.text("created_at DESC")], {}),
+)
+
+# Single-column indexes that are now a leading prefix of a composite index above.
+_SUPERSEDED = (
+    ("ix_projects_team_id", "projects", ["team_id"]),
+    ("ix_tasks_project_id", "tasks", ["project_id"]),
+    ("ix_tasks_assigned_user_id", "tasks", ["assigned_user_id"]),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the tables writable while the indexes build; it cannot
+    # run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        for name, table, columns, kwargs in _INDEXES:
+            op.create_index(
+                name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True, **kwargs
+            )
+        for name, table, _columns in _SUPERSEDED:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in _SUPERSEDED:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        for name, table, _columns, _kwargs in reversed(_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
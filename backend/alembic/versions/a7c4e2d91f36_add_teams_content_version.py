@@ -0,0 +1,32 @@
+"""add teams content_version
+
+Revision ID: a7c4e2d91f36
+Revises: 5e2b9c41d8a3
+Create Date: 2026-10-17 16:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c4e2d91f36"
+down_revision: Union[str, None] = "5e2b9c41d8a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Bumped by the application when a transaction writes the team's projects
+    # or tasks (app.services.team_service.bump_content_version).
+    op.add_column(
+        "teams",
+        sa.Column("content_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("teams", "content_version")
@@ -0,0 +1,30 @@
+"""add users membership_version
+
+Revision ID: c3a1f0d2b7e4
+Revises: 9b7d7a5f21c4
+Create Date: 2026-10-17 09:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a1f0d2b7e4"
+down_revision: Union[str, None] = "9b7d7a5f21c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("membership_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "membership_version")
@@ -0,0 +1,37 @@
+"""add tasks search_vector with gin index
+
+Revision ID: d5f18b3a6c20
+Revises: a7c4e2d91f36
+Create Date: 2026-10-17 18:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d5f18b3a6c20"
+down_revision: Union[str, None] = "a7c4e2d91f36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A stored generated column rewrites the table once; afterwards PostgreSQL
+    # keeps it in step with title and description on every write.
+    op.execute(
+        """
+        ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A')
+            || setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        ) STORED
+        """
+    )
+    op.execute("CREATE INDEX ix_tasks_search_vector ON tasks USING gin (search_vector)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_tasks_search_vector")
+    op.execute("ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,40 @@
+"""add case-folded prefix indexes on users username and email
+
+Revision ID: e81c4f7a2b95
+Revises: d5f18b3a6c20
+Create Date: 2026-10-17 19:00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e81c4f7a2b95"
+down_revision: Union[str, None] = "d5f18b3a6c20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# lower(column) in the "C" collation sorts by bytes, so a prefix is one index range.
+_INDEXES = (
+    ("ix_users_lower_username_prefix", 'lower(username) COLLATE "C"'),
+    ("ix_users_lower_email_prefix", 'lower(email) COLLATE "C"'),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, expression in _INDEXES:
+            op.create_index(
+                name, "users", [sa.text(expression)], unique=False, postgresql_concurrently=True, if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _expression in reversed(_INDEXES):
+            op.drop_index(name, table_name="users", postgresql_concurrently=True, if_exists=True)
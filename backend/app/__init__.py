@@ -0,0 +1,4 @@
+import time
+
+# Reference point for the import-time figure in the startup report.
+IMPORT_STARTED = time.perf_counter()
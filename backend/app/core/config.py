@@ -15,11 +15,59 @@ class Settings(BaseSettings):
     APP_ENV: Literal["development", "production", "test"] = "development"
 
     DATABASE_URL: str
+    ASYNC_DATABASE_URL: str | None = None
+    DB_STACK: Literal["sync", "async"] = "sync"
+    DATABASE_REPLICA_URLS: str = ""
+    REPLICA_RETRY_AFTER_SECONDS: float = 30.0
+    READ_YOUR_WRITES_SECONDS: int = 5
     REQUIRE_POSTGRES: bool = True
+
+    DB_CHECK_CONNECTION_ON_STARTUP: bool = True
+    DB_CREATE_ALL_ON_STARTUP: bool = True
+    DB_PATCH_LEGACY_SCHEMA: bool = False
+
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_USE_LIFO: bool = False
+    DB_COMPILED_CACHE_SIZE: int = 500
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 256
+
+    QUERY_STATS_ENABLED: bool = True
+    QUERY_BUDGET_DEFAULT: int = 0
+    QUERY_BUDGETS: str = ""
+    QUERY_BUDGET_ENFORCE: bool | None = None
+    QUERY_REPEAT_THRESHOLD: int = 3
+
+    ADMIN_METRICS_TOKEN: str | None = None
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
 
+    TOKEN_MEMBERSHIP_CLAIMS: bool = True
+    TOKEN_MEMBERSHIP_CLAIMS_MAX_TEAMS: int = 50
+
+    TOKEN_CACHE_MAX_ENTRIES: int = 4096
+
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10_000
+
+    MEMBERSHIP_CACHE_TTL_SECONDS: int = 30
+    MEMBERSHIP_CACHE_MAX_ENTRIES: int = 50_000
+
+    USER_LOOKUP_CACHE_SECONDS: float = 10.0
+    USER_LOOKUP_CACHE_MAX_ENTRIES: int = 4096
+
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+    PASSWORD_HASH_MAX_WAIT_SECONDS: float = 5.0
+
+    EVENT_BROKER: Literal["memory", "postgres"] = "memory"
+    EVENT_SUBSCRIBER_QUEUE_SIZE: int = 256
+    EVENT_HEARTBEAT_SECONDS: float = 15.0
+
     FRONTEND_ORIGINS: str = "http://localhost:5173,http://127.0.0.1:5173"
 
     model_config = SettingsConfigDict(
@@ -32,6 +80,27 @@ class Settings(BaseSettings):
     def cors_origins(self) -> list[str]:
         return [origin.strip() for origin in self.FRONTEND_ORIGINS.split(",") if origin.strip()]
 
+    @property
+    def replica_urls(self) -> list[str]:
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+
+    @property
+    def query_budgets(self) -> dict[str, int]:
+        """Parse QUERY_BUDGETS, e.g. "GET /tasks/=4,PATCH /tasks/{task_id}/status=2"."""
+        budgets: dict[str, int] = {}
+        for entry in self.QUERY_BUDGETS.split(","):
+            route, separator, limit = entry.rpartition("=")
+            if separator and route.strip():
+                method, _, path = route.strip().partition(" ")
+                budgets[f"{method.upper()} {path.strip()}"] = int(limit)
+        return budgets
+
+    @property
+    def enforce_query_budgets(self) -> bool:
+        if self.QUERY_BUDGET_ENFORCE is None:
+            return self.APP_ENV == "test"
+        return self.QUERY_BUDGET_ENFORCE
+
     @field_validator("SECRET_KEY")
     @classmethod
     def validate_secret_key(cls, value: str) -> str:
@@ -39,5 +108,19 @@ class Settings(BaseSettings):
             raise ValueError("SECRET_KEY must be at least 16 characters long")
         return value
 
+    @field_validator("BCRYPT_ROUNDS")
+    @classmethod
+    def validate_bcrypt_rounds(cls, value: int) -> int:
+        if not 4 <= value <= 31:
+            raise ValueError("BCRYPT_ROUNDS must be between 4 and 31")
+        return value
+
+    @field_validator("PASSWORD_HASH_WORKERS", "PASSWORD_HASH_MAX_QUEUE")
+    @classmethod
+    def validate_positive(cls, value: int) -> int:
+        if value < 1:
+            raise ValueError("Value must be at least 1")
+        return value
+
 
 settings = Settings()
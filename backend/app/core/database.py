@@ -1,24 +1,56 @@
 from __future__ import annotations
 
-from sqlalchemy import create_engine, inspect, text
-from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import declarative_base, sessionmaker
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, inspect, make_url, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from .config import settings
+from .metrics import register_metrics_source
+from .pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool, instrument_pool, pool_stats
+from .replicas import ReplicaSet, RoutingSession, wants_primary_read
 
 
 def _engine_connect_args(database_url: str) -> dict[str, object]:
     if database_url.startswith("sqlite"):
         return {"check_same_thread": False}
+    if database_url.startswith("postgresql+asyncpg"):
+        # asyncpg prepares statements server-side and keeps them per connection.
+        return {"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE}
     return {}
 
 
+def _pool_options(database_url: str, *, is_async: bool = False) -> dict[str, object]:
+    # SQLite keeps SQLAlchemy's default pooling; its in-memory mode cannot use a QueuePool.
+    if database_url.startswith("sqlite"):
+        return {}
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+    }
+
+
 def _create_engine(database_url: str):
-    return create_engine(
+    database_engine = create_engine(
         database_url,
         pool_pre_ping=True,
+        query_cache_size=settings.DB_COMPILED_CACHE_SIZE,
         connect_args=_engine_connect_args(database_url),
+        **_pool_options(database_url),
     )
+    instrument_pool(database_engine.pool)
+    return database_engine
 
 
 def _assert_connection(database_engine, database_url: str) -> None:
@@ -32,25 +64,161 @@ def _assert_connection(database_engine, database_url: str) -> None:
         ) from exc
 
 
-def _build_engine():
+def _validate_database_url() -> None:
     if settings.REQUIRE_POSTGRES and not settings.DATABASE_URL.startswith("postgresql"):
         raise RuntimeError(
             "Invalid DATABASE_URL: PostgreSQL is required (expected URL starting with 'postgresql')."
         )
 
-    primary_engine = _create_engine(settings.DATABASE_URL)
-    _assert_connection(primary_engine, settings.DATABASE_URL)
-    return primary_engine
+
+def _async_database_url(database_url: str) -> str:
+    url = make_url(database_url)
+    backend_name = url.get_backend_name()
+    if backend_name == "postgresql":
+        return url.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+    if backend_name == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    raise RuntimeError(f"No async driver configured for database backend '{backend_name}'.")
+
+
+def _create_async_engine(database_url: str):
+    database_engine = create_async_engine(
+        database_url,
+        pool_pre_ping=True,
+        query_cache_size=settings.DB_COMPILED_CACHE_SIZE,
+        connect_args=_engine_connect_args(database_url),
+        **_pool_options(database_url, is_async=True),
+    )
+    instrument_pool(database_engine.sync_engine.pool)
+    return database_engine
+
+
+class _DatabaseState:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.engine: Engine | None = None
+        self.async_engine: AsyncEngine | None = None
+        self.replica_set: ReplicaSet | None = None
+        self.async_replica_engines: dict[Engine, AsyncEngine] = {}
+
+
+_state = _DatabaseState()
+
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False)
+AsyncSessionLocal = async_sessionmaker(sync_session_class=RoutingSession, autoflush=False)
+
+
+def init_engines() -> Engine:
+    """Build the engines on first use. Creating an engine does not open a connection."""
+    if _state.engine is not None:
+        return _state.engine
+
+    with _state.lock:
+        if _state.engine is not None:
+            return _state.engine
+
+        _validate_database_url()
+        primary_engine = _create_engine(settings.DATABASE_URL)
+        replica_set = ReplicaSet(
+            [_create_engine(url) for url in settings.replica_urls],
+            retry_after_seconds=settings.REPLICA_RETRY_AFTER_SECONDS,
+        )
+
+        # The async stack runs the same service functions through AsyncSession.run_sync,
+        # so business logic stays in one place while I/O happens on the event loop.
+        if settings.DB_STACK == "async":
+            _state.async_engine = _create_async_engine(
+                settings.ASYNC_DATABASE_URL or _async_database_url(settings.DATABASE_URL)
+            )
+            _state.async_replica_engines = {
+                replica_engine: _create_async_engine(_async_database_url(url))
+                for url, replica_engine in zip(settings.replica_urls, replica_set.engines)
+            }
+            AsyncSessionLocal.configure(bind=_state.async_engine)
+
+        SessionLocal.configure(bind=primary_engine)
+        _state.replica_set = replica_set
+        _state.engine = primary_engine
+        return primary_engine
+
+
+def get_engine() -> Engine:
+    return init_engines()
+
+
+def get_replica_set() -> ReplicaSet:
+    init_engines()
+    return _state.replica_set
+
+
+def check_database_connection() -> None:
+    _assert_connection(get_engine(), settings.DATABASE_URL)
 
 
-engine = _build_engine()
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+async def dispose_engines() -> None:
+    with _state.lock:
+        primary_engine, _state.engine = _state.engine, None
+        async_engine, _state.async_engine = _state.async_engine, None
+        replica_set, _state.replica_set = _state.replica_set, None
+        async_replica_engines, _state.async_replica_engines = _state.async_replica_engines, {}
+
+    for async_database_engine in [async_engine, *async_replica_engines.values()]:
+        if async_database_engine is not None:
+            await async_database_engine.dispose()
+    for database_engine in [primary_engine, *(replica_set.engines if replica_set else [])]:
+        if database_engine is not None:
+            database_engine.dispose()
+
+
+def _collect_pool_metrics() -> dict[str, object]:
+    if _state.engine is None:
+        return {}
+    pools = {"primary": pool_stats(_state.engine.pool)}
+    if _state.async_engine is not None:
+        pools["async"] = pool_stats(_state.async_engine.sync_engine.pool)
+    for index, replica_engine in enumerate(_state.replica_set.engines):
+        pools[f"replica_{index}"] = pool_stats(replica_engine.pool)
+    return pools
+
+
+def _collect_replica_metrics() -> dict[str, object]:
+    return _state.replica_set.stats() if _state.replica_set is not None else {}
+
+
+register_metrics_source("db_pools", _collect_pool_metrics)
+register_metrics_source("read_replicas", _collect_replica_metrics)
 
 Base = declarative_base()
 
 
+def is_unique_violation(exc: IntegrityError) -> bool:
+    """True when an IntegrityError comes from a UNIQUE constraint rather than a FK or NOT NULL."""
+    original = exc.orig
+    sqlstate = getattr(original, "pgcode", None) or getattr(original, "sqlstate", None)
+    if sqlstate is not None:
+        return sqlstate == "23505"
+    return "UNIQUE constraint failed" in str(original)
+
+
+# Serializes startup DDL across workers that boot at the same time.
+_SCHEMA_ADVISORY_LOCK_KEY = 0x7A5C_0001
+
+
+def prepare_schema(*, create_all: bool, patch_legacy_schema: bool) -> None:
+    """Opt-in startup DDL; production deployments should rely on `alembic upgrade head`."""
+    if create_all:
+        engine = get_engine()
+        with engine.begin() as connection:
+            if engine.url.get_backend_name() == "postgresql":
+                connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _SCHEMA_ADVISORY_LOCK_KEY})
+            Base.metadata.create_all(bind=connection)
+    if patch_legacy_schema:
+        ensure_legacy_task_schema()
+
+
 def ensure_legacy_task_schema() -> None:
     """Patch common legacy task-table drift for local/dev environments."""
+    engine = get_engine()
     if engine.url.get_backend_name() != "postgresql":
         return
 
@@ -78,7 +246,9 @@ def ensure_legacy_task_schema() -> None:
             connection.execute(text(statement))
 
         connection.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_status ON tasks (status)"))
-        connection.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_assigned_user_id ON tasks (assigned_user_id)"))
+        connection.execute(
+            text("CREATE INDEX IF NOT EXISTS ix_tasks_assignee_created ON tasks (assigned_user_id, created_at, id)")
+        )
         connection.execute(
             text(
                 """
@@ -105,8 +275,57 @@ $$;
 
 
 def get_db():
+    init_engines()
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+class ThreadpoolSession:
+    """A sync Session behind AsyncSession's `run_sync`, for `async def` routes on the sync stack.
+
+    Each call runs on the request threadpool, so a thread is held only for the
+    database work and not while the route awaits something else.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.sync_session = session
+
+    async def run_sync(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        return await run_in_threadpool(fn, self.sync_session, *args, **kwargs)
+
+
+async def get_async_db():
+    init_engines()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_read_db(request: Request, db: Session = Depends(get_db)) -> Session:
+    """Request session whose reads go to a replica, unless the client just wrote."""
+    if not wants_primary_read(request):
+        replica_engine = get_replica_set().pick()
+        if replica_engine is not None:
+            db.info["replica_bind"] = replica_engine
+    return db
+
+
+def open_read_session(request: Request) -> Session:
+    """A standalone read session for a streamed response body.
+
+    Streamed bodies outlive the request's session dependency, so the stream
+    owns this session and must close it. Reads route like `get_read_db`, on
+    both stacks.
+    """
+    init_engines()
+    return get_read_db(request, SessionLocal())
+
+
+async def get_async_read_db(request: Request, db: AsyncSession = Depends(get_async_db)) -> AsyncSession:
+    if not wants_primary_read(request):
+        replica_engine = get_replica_set().pick()
+        if replica_engine is not None:
+            db.info["replica_bind"] = _state.async_replica_engines[replica_engine].sync_engine
+    return db
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import hashlib
+
+from fastapi import Request, Response
+
+
+def weak_etag(request: Request, *versions: object) -> str:
+    """A weak ETag for this URL (path and query string) at the given data versions.
+
+    `versions` must include everything the response depends on besides the
+    URL, such as the caller's id and the change markers of the data it reads.
+    """
+    key = repr((request.url.path, request.url.query, versions)).encode()
+    return f'W/"{hashlib.blake2b(key, digest_size=12).hexdigest()}"'
+
+
+def etag_headers(etag: str) -> dict[str, str]:
+    # no-cache lets browsers keep the body but revalidate it on every use.
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Weak comparison of `If-None-Match` against `etag`."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=etag_headers(etag))
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import select
+import threading
+from collections import defaultdict
+from collections.abc import AsyncIterator
+
+import orjson
+from sqlalchemy import event, func
+from sqlalchemy import select as sql_select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import get_engine
+from app.core.metrics import register_metrics_source
+from app.core.replicas import RoutingSession
+from app.core.responses import dump_json
+
+logger = logging.getLogger("app.events")
+
+EVENT_CHANNEL = "task_events"
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more.
+NOTIFY_PAYLOAD_LIMIT = 7900
+_PENDING_KEY = "pending_events"
+_RESYNC = dump_json({"type": "resync"}).decode()
+_CLOSED = object()
+
+
+def record_event(db: Session, project_id: int, event_type: str, data: dict) -> None:
+    """Queue a change event for the project's subscribers, published when `db` commits.
+
+    Events recorded in a transaction that rolls back are dropped.
+    """
+    message = dump_json({"type": event_type, "project_id": project_id, "data": data}).decode()
+    db.info.setdefault(_PENDING_KEY, []).append((project_id, message))
+
+
+class _Subscription:
+    """One SSE client: a bounded queue fed from any thread via its event loop."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+    def deliver(self, message) -> None:
+        self.loop.call_soon_threadsafe(self._put, message)
+
+    def _put(self, message) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # A client this far behind cannot catch up from deltas; tell it to
+            # re-list instead of buffering without bound.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(_RESYNC)
+            self.queue.put_nowait(_CLOSED)
+
+
+class EventBroker:
+    """Fans committed task events out to the SSE subscribers of each project.
+
+    This base class delivers in-process, which is enough for a single worker.
+    Subclasses decide how committed events travel between workers.
+    """
+
+    name = "memory"
+
+    def __init__(self, *, queue_size: int) -> None:
+        self.queue_size = queue_size
+        self._subscribers: dict[int, set[_Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self.published = 0
+        self.delivered = 0
+
+    def before_commit(self, session: Session, events: list[tuple[int, str]]) -> None:
+        pass
+
+    def after_commit(self, events: list[tuple[int, str]]) -> None:
+        for project_id, message in events:
+            self.dispatch(project_id, message)
+
+    def dispatch(self, project_id: int, message: str) -> None:
+        """Hand one event to this worker's subscribers; safe from any thread."""
+        with self._lock:
+            self.published += 1
+            subscribers = list(self._subscribers.get(project_id, ()))
+            self.delivered += len(subscribers)
+        for subscription in subscribers:
+            subscription.deliver(message)
+
+    def subscribe(self, project_id: int) -> _Subscription:
+        subscription = _Subscription(self.queue_size)
+        with self._lock:
+            self._subscribers[project_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, project_id: int, subscription: _Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(project_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[project_id]
+
+    async def stream(self, project_id: int, *, heartbeat_seconds: float) -> AsyncIterator[bytes]:
+        """Server-sent events for one project until the client goes away."""
+        subscription = self.subscribe(project_id)
+        try:
+            yield b": connected\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(subscription.queue.get(), heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield b": ping\n\n"
+                    continue
+                if message is _CLOSED:
+                    return
+                yield f"data: {message}\n\n".encode()
+        finally:
+            self.unsubscribe(project_id, subscription)
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "broker": self.name,
+                "projects": len(self._subscribers),
+                "subscribers": sum(len(subscribers) for subscribers in self._subscribers.values()),
+                "published": self.published,
+                "delivered": self.delivered,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            subscribers = [subscription for group in self._subscribers.values() for subscription in group]
+        for subscription in subscribers:
+            subscription.deliver(_CLOSED)
+
+
+class PostgresEventBroker(EventBroker):
+    """Relays events between workers with PostgreSQL LISTEN/NOTIFY.
+
+    Events are sent with `pg_notify` inside the writing transaction, so they
+    reach other workers exactly when it commits, in commit order. Each worker
+    listens on one dedicated connection, opened on its first subscriber, and
+    dispatches what arrives to its local subscribers; its own events come back
+    the same way.
+    """
+
+    name = "postgres"
+
+    def __init__(self, *, queue_size: int) -> None:
+        super().__init__(queue_size=queue_size)
+        self._listener: threading.Thread | None = None
+        self._stopping = threading.Event()
+
+    def before_commit(self, session: Session, events: list[tuple[int, str]]) -> None:
+        for project_id, message in events:
+            if len(message.encode()) > NOTIFY_PAYLOAD_LIMIT:
+                message = dump_json({"type": "resync", "project_id": project_id}).decode()
+            # Bind to the primary explicitly: a read-routed session would send a SELECT to a replica.
+            session.execute(
+                sql_select(func.pg_notify(EVENT_CHANNEL, message)),
+                bind_arguments={"bind": session.bind},
+            )
+
+    def after_commit(self, events: list[tuple[int, str]]) -> None:
+        pass
+
+    def subscribe(self, project_id: int) -> _Subscription:
+        self._start_listener()
+        return super().subscribe(project_id)
+
+    def _start_listener(self) -> None:
+        with self._lock:
+            if self._listener is not None and self._listener.is_alive():
+                return
+            self._stopping.clear()
+            self._listener = threading.Thread(target=self._listen, name="event-listener", daemon=True)
+            self._listener.start()
+
+    def _listen(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                connection = get_engine().raw_connection()
+                # Keep the LISTEN connection out of the request pool.
+                connection.detach()
+                driver_connection = connection.driver_connection
+                driver_connection.autocommit = True
+                with driver_connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {EVENT_CHANNEL}")
+                try:
+                    while not self._stopping.is_set():
+                        if select.select([driver_connection], [], [], 1.0) == ([], [], []):
+                            continue
+                        driver_connection.poll()
+                        while driver_connection.notifies:
+                            payload = driver_connection.notifies.pop(0).payload
+                            self.dispatch(orjson.loads(payload)["project_id"], payload)
+                finally:
+                    connection.close()
+            except Exception:
+                logger.exception("Event listener connection failed; retrying")
+                self._stopping.wait(1.0)
+
+    def shutdown(self) -> None:
+        self._stopping.set()
+        super().shutdown()
+
+
+def _create_broker() -> EventBroker:
+    if settings.EVENT_BROKER == "postgres":
+        return PostgresEventBroker(queue_size=settings.EVENT_SUBSCRIBER_QUEUE_SIZE)
+    return EventBroker(queue_size=settings.EVENT_SUBSCRIBER_QUEUE_SIZE)
+
+
+event_broker = _create_broker()
+register_metrics_source("events", event_broker.stats)
+
+
+@event.listens_for(RoutingSession, "before_commit")
+def _send_pending_events(session: Session) -> None:
+    events = session.info.get(_PENDING_KEY)
+    if events:
+        event_broker.before_commit(session, events)
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _publish_pending_events(session: Session) -> None:
+    events = session.info.pop(_PENDING_KEY, None)
+    if events:
+        event_broker.after_commit(events)
+
+
+@event.listens_for(RoutingSession, "after_soft_rollback")
+def _drop_pending_events(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -38,5 +38,10 @@ class NotFoundException(AppException):
 
 
 class ConflictException(AppException):
-    def __init__(self, message: str = "Conflict") -> None:
-        super().__init__(409, message)
+    def __init__(self, message: str = "Conflict", *, errors: list[dict[str, Any]] | None = None) -> None:
+        super().__init__(409, message, errors=errors)
+
+
+class ServiceUnavailableException(AppException):
+    def __init__(self, message: str = "Service temporarily unavailable") -> None:
+        super().__init__(503, message)
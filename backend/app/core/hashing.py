@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import TypeVar
+
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableException
+
+T = TypeVar("T")
+
+
+class HashingExecutor:
+    """Bounded worker pool that keeps bcrypt work off the request threadpool.
+
+    Callers are rejected immediately once `max_queue` jobs are waiting, and a
+    queued job is abandoned if no worker picks it up within `max_wait_seconds`.
+    """
+
+    def __init__(self, *, workers: int, max_queue: int, max_wait_seconds: float) -> None:
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_wait_seconds = max_wait_seconds
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._submitted = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._peak_queue_depth = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+            return self._executor
+
+    def _admit(self) -> None:
+        with self._lock:
+            if self._queued >= self.max_queue:
+                self._rejected += 1
+                raise ServiceUnavailableException("Authentication service is busy, please retry shortly")
+            self._queued += 1
+            self._submitted += 1
+            self._peak_queue_depth = max(self._peak_queue_depth, self._queued)
+
+    def submit(self, fn: Callable[..., T], *args) -> tuple[Future[T], threading.Event]:
+        self._admit()
+        started = threading.Event()
+        enqueued_at = time.perf_counter()
+
+        def run() -> T:
+            waited = time.perf_counter() - enqueued_at
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+            started.set()
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+
+        try:
+            future = self._get_executor().submit(run)
+        except RuntimeError:
+            with self._lock:
+                self._queued -= 1
+            raise
+        return future, started
+
+    def _abandon(self, future: Future) -> bool:
+        if not future.cancel():
+            return False
+        with self._lock:
+            self._queued -= 1
+            self._timed_out += 1
+        return True
+
+    def run(self, fn: Callable[..., T], *args) -> T:
+        future, started = self.submit(fn, *args)
+        if not started.wait(self.max_wait_seconds) and self._abandon(future):
+            raise ServiceUnavailableException("Authentication service is busy, please retry shortly")
+        try:
+            return future.result()
+        except CancelledError as exc:
+            raise ServiceUnavailableException("Authentication service is busy, please retry shortly") from exc
+
+    async def run_async(self, fn: Callable[..., T], *args) -> T:
+        future, started = self.submit(fn, *args)
+        wrapped = asyncio.wrap_future(future)
+        done, _ = await asyncio.wait({wrapped}, timeout=self.max_wait_seconds)
+        if not done and not started.is_set() and self._abandon(future):
+            raise ServiceUnavailableException("Authentication service is busy, please retry shortly")
+        return await wrapped
+
+    def stats(self) -> dict[str, float | int]:
+        with self._lock:
+            started = self._completed + self._running
+            return {
+                "workers": self.workers,
+                "queue_depth": self._queued,
+                "peak_queue_depth": self._peak_queue_depth,
+                "in_flight": self._running,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+                "avg_wait_ms": round(self._total_wait / started * 1000, 3) if started else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 3),
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = HashingExecutor(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    max_wait_seconds=settings.PASSWORD_HASH_MAX_WAIT_SECONDS,
+)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+_sources: dict[str, Callable[[], Any]] = {}
+
+
+def register_metrics_source(name: str, collector: Callable[[], Any]) -> None:
+    _sources[name] = collector
+
+
+def collect_metrics() -> dict[str, Any]:
+    return {name: collector() for name, collector in sorted(_sources.items())}
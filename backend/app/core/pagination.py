@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from fastapi import Query
+from sqlalchemy import DateTime, Select, func, tuple_
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import BadRequestException
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class PageParams(NamedTuple):
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: str | None = None
+
+
+class Page(NamedTuple):
+    items: list
+    next_cursor: str | None
+    limit: int
+
+
+def page_params(
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None, description="Opaque `next_cursor` from the previous page"),
+) -> PageParams:
+    return PageParams(limit=limit, cursor=cursor)
+
+
+def encode_cursor(sort_value: datetime | float, row_id: int) -> str:
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_type: type = datetime) -> tuple[datetime | float, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, row_id = json.loads(raw)
+        if sort_type is datetime:
+            return datetime.fromisoformat(sort_value), int(row_id)
+        return float(sort_value), int(row_id)
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise BadRequestException("Invalid pagination cursor") from exc
+
+
+def _comparable(db: Session, column, value):
+    # SQLite stores server-default timestamps as "YYYY-MM-DD HH:MM:SS" text while
+    # bound datetimes carry microseconds, so compare both sides as julian days.
+    if db.get_bind().dialect.name == "sqlite" and isinstance(column.type, DateTime):
+        return func.julianday(column), func.julianday(value)
+    return column, value
+
+
+def paginate(
+    db: Session,
+    stmt: Select,
+    *,
+    sort_column,
+    id_column,
+    page: PageParams,
+    descending: bool = True,
+    row_key: Callable[[Any], tuple[datetime | float, int]],
+    sort_type: type = datetime,
+) -> Page:
+    """Run `stmt` as one keyset page ordered by (sort_column, id_column).
+
+    Rows after the cursor are selected with a row-value comparison, so every
+    page costs the same index range scan however deep the client scrolls.
+    `sort_type` is the type of the sort values in cursors: `datetime` or `float`.
+    """
+    if page.cursor is not None:
+        sort_value, row_id = decode_cursor(page.cursor, sort_type)
+        column, value = _comparable(db, sort_column, sort_value)
+        key, bound = tuple_(column, id_column), tuple_(value, row_id)
+        stmt = stmt.where(key < bound if descending else key > bound)
+
+    ordering = (sort_column.desc(), id_column.desc()) if descending else (sort_column.asc(), id_column.asc())
+    rows = db.execute(stmt.order_by(*ordering).limit(page.limit + 1)).all()
+
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        next_cursor = encode_cursor(*row_key(rows[-1]))
+    return Page(items=rows, next_cursor=next_cursor, limit=page.limit)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class PoolMetrics:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+        self.invalidations = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.peak_in_use = 0
+        self.peak_overflow = 0
+
+    def record_wait(self, waited: float, pool: QueuePool) -> None:
+        with self._lock:
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+            self.peak_in_use = max(self.peak_in_use, pool.checkedout())
+            self.peak_overflow = max(self.peak_overflow, pool.overflow())
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> dict[str, float | int]:
+        with self._lock:
+            waits = self.checkouts or 1
+            return {
+                "connections_opened": self.connections_opened,
+                "invalidations": self.invalidations,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "timeouts": self.timeouts,
+                "avg_checkout_wait_ms": round(self.total_wait / waits * 1000, 3),
+                "max_checkout_wait_ms": round(self.max_wait * 1000, 3),
+                "peak_in_use": self.peak_in_use,
+                "peak_overflow": self.peak_overflow,
+            }
+
+
+class _InstrumentedPoolMixin:
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_wait(time.perf_counter() - started, self)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_pool(pool: Pool) -> PoolMetrics:
+    metrics = getattr(pool, "metrics", None)
+    if metrics is None:
+        metrics = pool.metrics = PoolMetrics()
+
+    # Pool-level listeners are carried over when the pool is recreated.
+    @event.listens_for(pool, "connect")
+    def _on_connect(_dbapi_connection, _connection_record) -> None:
+        metrics.increment("connections_opened")
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(_dbapi_connection, _connection_record, _connection_proxy) -> None:
+        metrics.increment("checkouts")
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(_dbapi_connection, _connection_record) -> None:
+        metrics.increment("checkins")
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(_dbapi_connection, _connection_record, _exception) -> None:
+        metrics.increment("invalidations")
+
+    return metrics
+
+
+def pool_stats(pool: Pool) -> dict[str, Any]:
+    stats: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "in_use": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "timeout_seconds": pool.timeout(),
+            }
+        )
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(metrics.snapshot())
+    return stats
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("app.queries")
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+class RequestQueryStats:
+    """SQL statements issued while serving one request."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+
+# The middleware sets this per request. Sync dependencies run in the threadpool
+# and AsyncSession work runs in a greenlet; both inherit the context, so the
+# engine hooks below record into the same object.
+_current_stats: ContextVar[RequestQueryStats | None] = ContextVar("request_query_stats", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current_stats.get()
+    started = conn.info.get("query_started_at")
+    if stats is None or not started:
+        return
+    stats.record(statement, time.perf_counter() - started.pop())
+
+
+class QueryTotals:
+    """Process-wide counters per route, exposed through /admin/metrics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._routes: dict[str, dict[str, float | int]] = {}
+
+    def record(self, route: str, stats: RequestQueryStats, *, over_budget: bool, repeated: bool) -> None:
+        with self._lock:
+            totals = self._routes.setdefault(
+                route,
+                {"requests": 0, "statements": 0, "max_statements": 0, "db_ms": 0.0, "over_budget": 0, "repeated": 0},
+            )
+            totals["requests"] += 1
+            totals["statements"] += stats.count
+            totals["max_statements"] = max(totals["max_statements"], stats.count)
+            totals["db_ms"] += stats.seconds * 1000
+            totals["over_budget"] += int(over_budget)
+            totals["repeated"] += int(repeated)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                route: {
+                    **totals,
+                    "avg_statements": round(totals["statements"] / totals["requests"], 2),
+                    "db_ms": round(totals["db_ms"], 3),
+                }
+                for route, totals in sorted(self._routes.items())
+            }
+
+
+query_totals = QueryTotals()
+
+
+def _route_key(scope: Scope) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None) or scope.get("path", "")
+    return f"{scope.get('method', '')} {path}"
+
+
+class QueryStatsMiddleware:
+    """Counts SQL per request and reports it as Server-Timing plus one log line.
+
+    `budgets` maps "METHOD /route/{param}" to a statement limit; `default_budget`
+    applies elsewhere (0 disables). A request over budget is logged, or fails
+    with QueryBudgetExceeded when `enforce` is set. Any statement repeated
+    `repeat_threshold` times is flagged as a likely N+1.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        budgets: dict[str, int],
+        default_budget: int = 0,
+        repeat_threshold: int = 3,
+        enforce: bool = False,
+    ) -> None:
+        self.app = app
+        self.budgets = budgets
+        self.default_budget = default_budget
+        self.repeat_threshold = repeat_threshold
+        self.enforce = enforce
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current_stats.set(stats)
+        status_code = 500
+        reported = False
+
+        async def send_with_stats(message: Message) -> None:
+            nonlocal status_code, reported
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                reported = True
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries"')
+                self._report(scope, stats, status_code)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current_stats.reset(token)
+            if not reported:
+                self._report(scope, stats, status_code)
+
+    def _report(self, scope: Scope, stats: RequestQueryStats, status_code: int) -> None:
+        route = _route_key(scope)
+        budget = self.budgets.get(route, self.default_budget)
+        over_budget = budget > 0 and stats.count > budget
+        repeated = stats.repeated(self.repeat_threshold) if self.repeat_threshold > 0 else []
+        query_totals.record(route, stats, over_budget=over_budget, repeated=bool(repeated))
+
+        logger.info(
+            "request route=%r status=%d queries=%d db_ms=%.1f",
+            route,
+            status_code,
+            stats.count,
+            stats.seconds * 1000,
+        )
+        for statement, count in repeated:
+            logger.warning(
+                "possible_n_plus_one route=%r repeats=%d statement=%r",
+                route,
+                count,
+                " ".join(statement.split())[:200],
+            )
+        if over_budget:
+            message = f"{route} issued {stats.count} SQL statements (budget {budget})"
+            if self.enforce:
+                raise QueryBudgetExceeded(message)
+            logger.warning("query_budget_exceeded %s", message)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from typing import Any
+
+from fastapi import FastAPI, Request
+from sqlalchemy import Delete, Insert, Update, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from .config import settings
+
+READ_PRIMARY_COOKIE = "read_primary"
+READ_CONSISTENCY_HEADER = "x-read-consistency"
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class RoutingSession(Session):
+    """Session that sends reads to `info["replica_bind"]` when a route opted in.
+
+    Flushes and explicit INSERT/UPDATE/DELETE statements always go to the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw: Any):
+        replica_bind = self.info.get("replica_bind")
+        if replica_bind is not None and not self._flushing and not isinstance(clause, (Insert, Update, Delete)):
+            return replica_bind
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+class ReplicaSet:
+    """Round-robin over replica engines, skipping replicas that recently dropped connections."""
+
+    def __init__(self, engines: list[Engine], *, retry_after_seconds: float) -> None:
+        self.engines = engines
+        self.retry_after_seconds = retry_after_seconds
+        self._cycle = itertools.cycle(range(len(engines)))
+        self._down_until = [0.0] * len(engines)
+        self._lock = threading.Lock()
+        self.picks = [0] * len(engines)
+        self.fallbacks = 0
+
+        for index, replica_engine in enumerate(engines):
+            event.listen(replica_engine, "handle_error", self._error_handler(index))
+
+    def _error_handler(self, index: int):
+        def on_error(context) -> None:
+            if context.is_disconnect:
+                self.mark_down(index)
+
+        return on_error
+
+    def mark_down(self, index: int) -> None:
+        with self._lock:
+            self._down_until[index] = time.monotonic() + self.retry_after_seconds
+
+    def pick(self) -> Engine | None:
+        if not self.engines:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self.engines)):
+                index = next(self._cycle)
+                if self._down_until[index] <= now:
+                    self.picks[index] += 1
+                    return self.engines[index]
+            self.fallbacks += 1
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "replicas": [
+                    {
+                        "url": replica_engine.url.render_as_string(hide_password=True),
+                        "picks": self.picks[index],
+                        "healthy": self._down_until[index] <= now,
+                    }
+                    for index, replica_engine in enumerate(self.engines)
+                ],
+                "primary_fallbacks": self.fallbacks,
+            }
+
+
+def wants_primary_read(request: Request) -> bool:
+    return (
+        READ_PRIMARY_COOKIE in request.cookies
+        or request.headers.get(READ_CONSISTENCY_HEADER, "").lower() == "primary"
+    )
+
+
+def register_read_your_writes(app: FastAPI) -> None:
+    """Pin a client's reads to the primary for a short window after it writes."""
+
+    @app.middleware("http")
+    async def read_your_writes_middleware(request: Request, call_next):
+        response = await call_next(request)
+        if request.method not in _SAFE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                READ_PRIMARY_COOKIE,
+                "1",
+                max_age=settings.READ_YOUR_WRITES_SECONDS,
+                httponly=True,
+                samesite="lax",
+            )
+        return response
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+
+from app.core.pagination import Page
+
+# Match pydantic's JSON output: UTC datetimes end in "Z", enums as their values.
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+def dump_json(content: Any) -> bytes:
+    return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+
+def page_response(message: str, page: Page, headers: dict[str, str] | None = None) -> Response:
+    """Encode a `PaginatedResponse` envelope straight to JSON.
+
+    For list endpoints whose service already returns plain dicts shaped like
+    the response model: the route's `response_model` still documents the
+    schema, but the rows skip model construction and FastAPI's re-validation.
+    """
+    body = {
+        "success": True,
+        "message": message,
+        "data": page.items,
+        "limit": page.limit,
+        "next_cursor": page.next_cursor,
+    }
+    return Response(dump_json(body), media_type="application/json", headers=headers)
@@ -1,53 +1,155 @@
 from __future__ import annotations
 
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
+from typing import Any, NamedTuple
 
 import bcrypt
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
 
+from app.core.cache import TTLCache
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import get_async_db, get_db
 from app.core.exceptions import BadRequestException, UnauthorizedException
+from app.core.hashing import password_hasher
+from app.core.metrics import register_metrics_source
 from app.models.user import User
+from app.repositories.users import USER_BY_ID
 
 security_scheme = HTTPBearer(auto_error=False)
 
+_PRINCIPAL_COLUMNS = (
+    "id",
+    "username",
+    "email",
+    "first_name",
+    "last_name",
+    "hashed_password",
+    "is_active",
+    "membership_version",
+    "created_at",
+    "updated_at",
+)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    if not hashed_password:
-        return False
+
+class TeamMembership(NamedTuple):
+    team_id: int
+    user_id: int
+    role: str
+
+
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+verified_token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_MAX_ENTRIES)
+
+register_metrics_source("principal_cache", principal_cache.stats)
+register_metrics_source("verified_token_cache", verified_token_cache.stats)
+register_metrics_source("password_hasher", password_hasher.stats)
+
+
+def _checkpw(plain_password: str, hashed_password: str) -> bool:
     try:
         return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
     except ValueError:
         return False
 
 
+def _hashpw(password_bytes: bytes) -> str:
+    return bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)).decode("utf-8")
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    if not hashed_password:
+        return False
+    return password_hasher.run(_checkpw, plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     password_bytes = password.encode("utf-8")
     if len(password_bytes) > 72:
         raise BadRequestException("Password is too long")
-    return bcrypt.hashpw(password_bytes, bcrypt.gensalt()).decode("utf-8")
+    return password_hasher.run(_hashpw, password_bytes)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    if not hashed_password:
+        return False
+    return await password_hasher.run_async(_checkpw, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    password_bytes = password.encode("utf-8")
+    if len(password_bytes) > 72:
+        raise BadRequestException("Password is too long")
+    return await password_hasher.run_async(_hashpw, password_bytes)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    # bcrypt hashes look like "$2b$12$<salt+digest>"; the second field is the cost.
+    parts = hashed_password.split("$")
+    try:
+        return int(parts[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
 
 
-def create_access_token(user_id: int) -> str:
+def create_access_token(
+    user_id: int,
+    *,
+    team_roles: dict[int, str] | None = None,
+    membership_version: int | None = None,
+) -> str:
     expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     expire_at = datetime.now(timezone.utc) + expires_delta
-    payload = {
+    payload: dict[str, Any] = {
         "sub": str(user_id),
         "exp": expire_at,
     }
+    if (
+        settings.TOKEN_MEMBERSHIP_CLAIMS
+        and team_roles is not None
+        and membership_version is not None
+        and len(team_roles) <= settings.TOKEN_MEMBERSHIP_CLAIMS_MAX_TEAMS
+    ):
+        payload["teams"] = {str(team_id): role for team_id, role in team_roles.items()}
+        payload["mv"] = membership_version
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
-def decode_access_token(token: str) -> int | None:
+def _decode_token_payload(token: str) -> dict[str, Any] | None:
+    digest = hashlib.sha256(token.encode("utf-8")).digest()
+    cached = verified_token_cache.get(digest)
+    if cached is not None:
+        payload, expires_at = cached
+        # Same rule as python-jose: the token is expired once `exp` is in the past.
+        if expires_at < int(time.time()):
+            verified_token_cache.invalidate(digest)
+            return None
+        return payload
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
     except JWTError:
         return None
 
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, int):
+        remaining = expires_at - time.time() + 1
+        if remaining > 0:
+            verified_token_cache.set(digest, (payload, expires_at), ttl_seconds=remaining)
+    return payload
+
+
+def _subject_user_id(payload: dict[str, Any]) -> int | None:
     sub = payload.get("sub")
     if not sub:
         return None
@@ -58,19 +160,99 @@ def decode_access_token(token: str) -> int | None:
         return None
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials | None = Depends(security_scheme),
-    db: Session = Depends(get_db),
-) -> User:
+def decode_access_token(token: str) -> int | None:
+    payload = _decode_token_payload(token)
+    if payload is None:
+        return None
+    return _subject_user_id(payload)
+
+
+def _membership_claims(payload: dict[str, Any], user: User) -> dict[int, str] | None:
+    # `user` may come from principal_cache, which only the writing process
+    # invalidates: other workers honour revoked claims for up to
+    # PRINCIPAL_CACHE_TTL_SECONDS, the same bound membership_cache has.
+    teams = payload.get("teams")
+    if not isinstance(teams, dict) or payload.get("mv") != user.membership_version:
+        return None
+    try:
+        return {int(team_id): str(role) for team_id, role in teams.items()}
+    except (TypeError, ValueError):
+        return None
+
+
+def get_claimed_membership(db: Session, team_id: int, user_id: int) -> TeamMembership | None:
+    """Return the caller's membership from verified, still-current token claims, if any."""
+    claims = db.info.get("membership_claims")
+    if claims is None or claims[0] != user_id:
+        return None
+    role = claims[1].get(team_id)
+    if role is None:
+        return None
+    return TeamMembership(team_id=team_id, user_id=user_id, role=role)
+
+
+def invalidate_principal(user_id: int) -> None:
+    principal_cache.invalidate(user_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_principal_on_write(_mapper, _connection, target: User) -> None:
+    invalidate_principal(target.id)
+    # Drop the entry again once the change is visible to other sessions, so a
+    # concurrent lookup between flush and commit cannot re-cache stale state.
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault("stale_principals", set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _flush_stale_principals(session: Session) -> None:
+    for user_id in session.info.pop("stale_principals", ()):
+        invalidate_principal(user_id)
+
+
+def _load_principal(db: Session, user_id: int) -> User | None:
+    snapshot = principal_cache.get(user_id)
+    if snapshot is not None:
+        return User(**snapshot)
+
+    user = db.execute(USER_BY_ID, {"user_id": user_id}).scalar_one_or_none()
+    if user is not None:
+        principal_cache.set(user_id, {column: getattr(user, column) for column in _PRINCIPAL_COLUMNS})
+    return user
+
+
+def _resolve_current_user(db: Session, credentials: HTTPAuthorizationCredentials | None) -> User:
     if credentials is None:
         raise UnauthorizedException("Missing authorization token")
 
-    user_id = decode_access_token(credentials.credentials)
+    payload = _decode_token_payload(credentials.credentials)
+    user_id = _subject_user_id(payload) if payload is not None else None
     if user_id is None:
         raise UnauthorizedException("Invalid or expired access token")
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = _load_principal(db, user_id)
     if not user or not user.is_active:
         raise UnauthorizedException("User is inactive or does not exist")
 
+    # Claims are only trusted while the user's membership version is unchanged.
+    team_roles = _membership_claims(payload, user)
+    if team_roles is not None:
+        db.info["membership_claims"] = (user.id, team_roles)
+
     return user
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(security_scheme),
+    db: Session = Depends(get_db),
+) -> User:
+    return _resolve_current_user(db, credentials)
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials | None = Depends(security_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    return await db.run_sync(_resolve_current_user, credentials)
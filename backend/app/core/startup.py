@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger("app.startup")
+
+
+class StartupReport:
+    def __init__(self) -> None:
+        self.import_seconds: float | None = None
+        self.lifespan_seconds: float | None = None
+        self.first_request_seconds: float | None = None
+        self.first_request_path: str | None = None
+        self.ready_at: float | None = None
+
+    def record_import(self, seconds: float) -> None:
+        self.import_seconds = seconds
+
+    def record_lifespan(self, seconds: float) -> None:
+        self.lifespan_seconds = seconds
+        self.ready_at = time.perf_counter()
+        logger.info(
+            "startup import_ms=%.1f lifespan_ms=%.1f",
+            (self.import_seconds or 0.0) * 1000,
+            seconds * 1000,
+        )
+
+    def record_first_request(self, path: str, seconds: float) -> None:
+        self.first_request_seconds = seconds
+        self.first_request_path = path
+        logger.info("first_request path=%s latency_ms=%.1f", path, seconds * 1000)
+
+    def stats(self) -> dict[str, Any]:
+        def to_ms(value: float | None) -> float | None:
+            return round(value * 1000, 3) if value is not None else None
+
+        return {
+            "import_ms": to_ms(self.import_seconds),
+            "lifespan_startup_ms": to_ms(self.lifespan_seconds),
+            "first_request_ms": to_ms(self.first_request_seconds),
+            "first_request_path": self.first_request_path,
+        }
+
+
+startup_report = StartupReport()
+
+
+class FirstRequestTimerMiddleware:
+    """Times the first HTTP request a worker serves, which pays for lazy connection setup."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._pending = True
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._pending or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        self._pending = False
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            startup_report.record_first_request(scope.get("path", ""), time.perf_counter() - started)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, Iterable
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+
+
+def wants_ndjson(request: Request, stream: bool = False) -> bool:
+    """True for `?stream=1` or an `Accept: application/x-ndjson` request."""
+    return stream or NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def streaming_response(
+    chunks: Iterable[bytes] | AsyncIterable[bytes],
+    *,
+    media_type: str,
+    filename: str | None = None,
+) -> StreamingResponse:
+    """Stream `chunks` as the body; with `filename`, as a download attachment."""
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'} if filename else None
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
+
+
+def event_stream_response(events: AsyncIterable[bytes]) -> StreamingResponse:
+    """Serve server-sent events, asking proxies not to buffer or cache them."""
+    return StreamingResponse(
+        events,
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,19 +1,54 @@
 from __future__ import annotations
 
+import time
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 
+from app import IMPORT_STARTED
 from app.core.config import settings
-from app.core.database import Base, engine, ensure_legacy_task_schema
+from app.core.database import check_database_connection, dispose_engines, get_engine, prepare_schema
 from app.core.error_handlers import register_error_handlers
-from app.routes import auth, projects, tasks, teams
+from app.core.events import event_broker
+from app.core.hashing import password_hasher
+from app.core.metrics import register_metrics_source
+from app.core.query_stats import QueryStatsMiddleware, query_totals
+from app.core.replicas import register_read_your_writes
+from app.core.startup import FirstRequestTimerMiddleware, startup_report
+from app.routes import admin, aio, auth, projects, tasks, teams, users
 from app.schemas.common import ApiResponse
 
 # Ensure models are imported so metadata is complete.
 from app import models  # noqa: F401
 
-app = FastAPI(title=settings.APP_NAME)
+
+def _startup_database() -> None:
+    if settings.DB_CHECK_CONNECTION_ON_STARTUP:
+        check_database_connection()
+    # Keep create_all for local DX; production should use Alembic migrations.
+    prepare_schema(
+        create_all=settings.DB_CREATE_ALL_ON_STARTUP,
+        patch_legacy_schema=settings.DB_PATCH_LEGACY_SCHEMA,
+    )
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    started = time.perf_counter()
+    await run_in_threadpool(_startup_database)
+    startup_report.record_lifespan(time.perf_counter() - started)
+    try:
+        yield
+    finally:
+        event_broker.shutdown()
+        password_hasher.shutdown()
+        await dispose_engines()
+
+
+app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
 
 dev_local_origin_regex = r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$" if settings.APP_ENV != "production" else None
 
@@ -28,18 +63,32 @@ app.add_middleware(
 
 register_error_handlers(app)
 
-# Keep create_all for local DX; production should use Alembic migrations.
-Base.metadata.create_all(bind=engine)
-ensure_legacy_task_schema()
+if settings.replica_urls:
+    register_read_your_writes(app)
+
+if settings.DB_STACK == "async":
+    route_modules = (aio.auth, aio.teams, aio.projects, aio.tasks, aio.users)
+else:
+    route_modules = (auth, teams, projects, tasks, users)
 
-app.include_router(auth.router)
-app.include_router(teams.router)
-app.include_router(projects.router)
-app.include_router(tasks.router)
+for route_module in route_modules:
+    app.include_router(route_module.router)
+app.include_router(admin.router)
+if settings.QUERY_STATS_ENABLED:
+    app.add_middleware(
+        QueryStatsMiddleware,
+        budgets=settings.query_budgets,
+        default_budget=settings.QUERY_BUDGET_DEFAULT,
+        repeat_threshold=settings.QUERY_REPEAT_THRESHOLD,
+        enforce=settings.enforce_query_budgets,
+    )
+    register_metrics_source("queries", query_totals.stats)
+app.add_middleware(FirstRequestTimerMiddleware)
 
 
 @app.get("/health", response_model=ApiResponse[dict[str, str]])
 def health_check():
+    engine = get_engine()
     url = engine.url
     with engine.connect() as connection:
         db_identity = connection.execute(
@@ -56,3 +105,7 @@ def health_check():
             "database_user": str(db_identity["database_user"]),
         },
     )
+
+
+register_metrics_source("startup", startup_report.stats)
+startup_report.record_import(time.perf_counter() - IMPORT_STARTED)
@@ -1,6 +1,8 @@
 from .project import Project
+from .project_task_stats import ProjectTaskStats
 from .task import Task
+from . import task_search  # noqa: F401  (registers the full-text search DDL)
 from .team import Team, team_members
 from .user import User
 
-__all__ = ["User", "Team", "Project", "Task", "team_members"]
+__all__ = ["User", "Team", "Project", "ProjectTaskStats", "Task", "team_members"]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -9,10 +9,13 @@ from app.core.database import Base
 
 class Project(Base):
     __tablename__ = "projects"
-    __table_args__ = (UniqueConstraint("team_id", "name", name="uq_projects_team_name"),)
+    __table_args__ = (
+        UniqueConstraint("team_id", "name", name="uq_projects_team_name"),
+        Index("ix_projects_team_created", "team_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), index=True, nullable=False)
+    team_id = Column(Integer, ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(120), nullable=False)
     description = Column(Text, nullable=True)
     created_by = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
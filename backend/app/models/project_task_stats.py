@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from sqlalchemy import DDL, Column, ForeignKey, Integer, String, event, func, insert, select
+
+from app.core.database import Base
+from app.models.task import Task
+
+
+class ProjectTaskStats(Base):
+    """Task count per (project, status), maintained by triggers on `tasks`.
+
+    Every insert, delete and status/project change of a task adjusts the
+    matching rows in the same transaction, so reads never count tasks.
+    `scripts/reconcile_task_stats.py` rebuilds the table if it ever drifts.
+    """
+
+    __tablename__ = "project_task_stats"
+
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    status = Column(String(20), primary_key=True)
+    task_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+
+POSTGRES_TRIGGER_DDL = (
+    """
+CREATE OR REPLACE FUNCTION project_task_stats_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        UPDATE project_task_stats SET task_count = task_count - 1
+        WHERE project_id = OLD.project_id AND status = OLD.status;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        INSERT INTO project_task_stats AS stats (project_id, status, task_count)
+        VALUES (NEW.project_id, NEW.status, 1)
+        ON CONFLICT (project_id, status) DO UPDATE SET task_count = stats.task_count + 1;
+    END IF;
+    RETURN NULL;
+END
+$$
+    """,
+    # CREATE TRIGGER blocks writes to tasks, so startup only runs it when missing.
+    """
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_trigger WHERE tgrelid = 'tasks'::regclass AND tgname = 'tasks_stats_insert_delete'
+    ) THEN
+        CREATE TRIGGER tasks_stats_insert_delete AFTER INSERT OR DELETE ON tasks
+        FOR EACH ROW EXECUTE FUNCTION project_task_stats_apply();
+    END IF;
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_trigger WHERE tgrelid = 'tasks'::regclass AND tgname = 'tasks_stats_update'
+    ) THEN
+        CREATE TRIGGER tasks_stats_update AFTER UPDATE OF project_id, status ON tasks
+        FOR EACH ROW
+        WHEN (OLD.project_id IS DISTINCT FROM NEW.project_id OR OLD.status IS DISTINCT FROM NEW.status)
+        EXECUTE FUNCTION project_task_stats_apply();
+    END IF;
+END
+$$
+    """,
+)
+
+SQLITE_TRIGGER_DDL = (
+    """
+CREATE TRIGGER IF NOT EXISTS tasks_stats_insert AFTER INSERT ON tasks
+BEGIN
+    INSERT INTO project_task_stats (project_id, status, task_count)
+    VALUES (NEW.project_id, NEW.status, 1)
+    ON CONFLICT (project_id, status) DO UPDATE SET task_count = task_count + 1;
+END
+    """,
+    """
+CREATE TRIGGER IF NOT EXISTS tasks_stats_delete AFTER DELETE ON tasks
+BEGIN
+    UPDATE project_task_stats SET task_count = task_count - 1
+    WHERE project_id = OLD.project_id AND status = OLD.status;
+END
+    """,
+    """
+CREATE TRIGGER IF NOT EXISTS tasks_stats_update AFTER UPDATE OF project_id, status ON tasks
+WHEN OLD.project_id IS NOT NEW.project_id OR OLD.status IS NOT NEW.status
+BEGIN
+    UPDATE project_task_stats SET task_count = task_count - 1
+    WHERE project_id = OLD.project_id AND status = OLD.status;
+    INSERT INTO project_task_stats (project_id, status, task_count)
+    VALUES (NEW.project_id, NEW.status, 1)
+    ON CONFLICT (project_id, status) DO UPDATE SET task_count = task_count + 1;
+END
+    """,
+)
+
+# Metadata-level so both tables exist first. The DDL is idempotent and cheap
+# when the triggers exist, because create_all runs on every startup when
+# DB_CREATE_ALL_ON_STARTUP is set.
+for _statement in POSTGRES_TRIGGER_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in SQLITE_TRIGGER_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    Base.metadata,
+    "after_drop",
+    DDL("DROP FUNCTION IF EXISTS project_task_stats_apply()").execute_if(dialect="postgresql"),
+)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _backfill_task_stats(target, connection, tables=(), **kw) -> None:
+    # `tables` lists only what this create_all created. A new stats table next
+    # to existing tasks starts from their counts; the triggers above are already
+    # in place in this transaction and keep it current from here on.
+    if ProjectTaskStats.__table__ not in tables:
+        return
+    if connection.dialect.name == "postgresql":
+        connection.exec_driver_sql("LOCK TABLE tasks IN SHARE MODE")
+    connection.execute(
+        insert(ProjectTaskStats).from_select(
+            ["project_id", "status", "task_count"],
+            select(Task.project_id, Task.status, func.count()).group_by(Task.project_id, Task.status),
+        )
+    )
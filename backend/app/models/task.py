@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -9,13 +9,20 @@ from app.core.database import Base
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Board listing: tasks of a project, optionally by status, newest first.
+        Index("ix_tasks_project_created", "project_id", "created_at", "id"),
+        Index("ix_tasks_project_status_created", "project_id", "status", "created_at", "id"),
+        # Assignee filter on the board.
+        Index("ix_tasks_assignee_created", "assigned_user_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), index=True, nullable=False)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
     status = Column(String(20), nullable=False, index=True, default="todo", server_default="todo")
-    assigned_user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    assigned_user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     due_date = Column(DateTime(timezone=True), nullable=True)
     created_by = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -24,3 +31,16 @@ class Task(Base):
     project = relationship("Project", back_populates="tasks")
     creator = relationship("User", back_populates="created_tasks", foreign_keys=[created_by])
     assignee = relationship("User", back_populates="assigned_tasks", foreign_keys=[assigned_user_id])
+
+
+# "My tasks" summary order: due date (nulls last, the ASC default) then newest first.
+Index("ix_tasks_assignee_due", Task.assigned_user_id, Task.due_date, Task.created_at.desc())
+
+# Overdue counts per project only ever look at open tasks with a due date.
+Index(
+    "ix_tasks_project_open_due",
+    Task.project_id,
+    Task.due_date,
+    postgresql_where=Task.status != "done",
+    sqlite_where=Task.status != "done",
+)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from sqlalchemy import DDL, Integer, column, event, literal_column, table
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from app.core.database import Base
+
+# Full-text index over task titles and descriptions for GET /tasks/search.
+#
+# PostgreSQL: `tasks.search_vector`, a stored generated tsvector (title weighted
+# above description) with a GIN index, so the database keeps it current on
+# every write. It is deliberately not mapped on Task, so ORM loads never fetch it.
+#
+# SQLite: an external-content FTS5 table `tasks_fts` kept in sync by triggers,
+# so search also works in local and test setups.
+
+TASK_SEARCH_CONFIG = "english"
+
+task_search_vector = literal_column("tasks.search_vector", type_=TSVECTOR)
+tasks_fts = table("tasks_fts", column("rowid", Integer))
+
+# Both statements lock tasks (the column add rewrites it), so startup only runs
+# them when the catalog shows them missing; revision d5f18b3a6c20 is the usual
+# way to add them.
+POSTGRES_SEARCH_DDL = f"""
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_attribute
+        WHERE attrelid = 'tasks'::regclass AND attname = 'search_vector' AND NOT attisdropped
+    ) THEN
+        ALTER TABLE tasks ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+            setweight(to_tsvector('{TASK_SEARCH_CONFIG}', coalesce(title, '')), 'A')
+            || setweight(to_tsvector('{TASK_SEARCH_CONFIG}', coalesce(description, '')), 'B')
+        ) STORED;
+    END IF;
+    IF to_regclass('ix_tasks_search_vector') IS NULL THEN
+        CREATE INDEX ix_tasks_search_vector ON tasks USING gin (search_vector);
+    END IF;
+END
+$$
+"""
+
+SQLITE_SEARCH_DDL = (
+    """
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    title, description, content='tasks', content_rowid='id', tokenize='porter unicode61'
+)
+    """,
+    """
+CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks
+BEGIN
+    INSERT INTO tasks_fts (rowid, title, description) VALUES (NEW.id, NEW.title, NEW.description);
+END
+    """,
+    """
+CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks
+BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+    VALUES ('delete', OLD.id, OLD.title, OLD.description);
+END
+    """,
+    """
+CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks
+BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+    VALUES ('delete', OLD.id, OLD.title, OLD.description);
+    INSERT INTO tasks_fts (rowid, title, description) VALUES (NEW.id, NEW.title, NEW.description);
+END
+    """,
+)
+
+event.listen(Base.metadata, "after_create", DDL(POSTGRES_SEARCH_DDL).execute_if(dialect="postgresql"))
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_sqlite_search(target, connection, **kw) -> None:
+    if connection.dialect.name != "sqlite":
+        return
+    existed = connection.exec_driver_sql("SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'").first()
+    for statement in SQLITE_SEARCH_DDL:
+        connection.exec_driver_sql(statement)
+    if not existed:
+        # Index the tasks that were there before the search table.
+        connection.exec_driver_sql("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+
+
+event.listen(Base.metadata, "after_drop", DDL("DROP TABLE IF EXISTS tasks_fts").execute_if(dialect="sqlite"))
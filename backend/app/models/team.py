@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Table, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Table, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -15,6 +15,9 @@ team_members = Table(
     Column("role", String(20), nullable=False, default="member", server_default="member"),
     Column("joined_at", DateTime(timezone=True), server_default=func.now(), nullable=False),
     UniqueConstraint("team_id", "user_id", name="uq_team_members_team_user"),
+    # Every access check and "my teams/tasks" query starts from the user.
+    Index("ix_team_members_user_team", "user_id", "team_id", postgresql_include=["role"]),
+    Index("ix_team_members_team_joined", "team_id", "joined_at", "id"),
 )
 
 
@@ -27,6 +30,10 @@ class Team(Base):
     created_by = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Bumped once per transaction that writes the team's projects or tasks
+    # (team_service.bump_content_version); list endpoints derive their ETags
+    # from it (see app/core/etag.py).
+    content_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     creator = relationship("User", back_populates="created_teams")
     members = relationship("User", secondary=team_members, back_populates="teams")
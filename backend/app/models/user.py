@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -17,6 +17,7 @@ class User(Base):
     last_name = Column(String(80), nullable=False)
     hashed_password = Column(String(255), nullable=False)
     is_active = Column(Boolean, nullable=False, default=True, server_default="true")
+    membership_version = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -25,3 +26,11 @@ class User(Base):
     created_projects = relationship("Project", back_populates="creator")
     created_tasks = relationship("Task", back_populates="creator", foreign_keys="Task.created_by")
     assigned_tasks = relationship("Task", back_populates="assignee", foreign_keys="Task.assigned_user_id")
+
+
+# Prefix lookups (GET /users/lookup) compare case-folded names in byte order,
+# so a prefix becomes one index range. PostgreSQL needs the "C" collation for
+# that; SQLite's default BINARY collation already is byte order.
+for _column in (User.username, User.email):
+    Index(f"ix_users_lower_{_column.key}_prefix", func.lower(_column).collate("C")).ddl_if(dialect="postgresql")
+    Index(f"ix_users_lower_{_column.key}", func.lower(_column)).ddl_if(dialect="sqlite")
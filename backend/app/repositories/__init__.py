@@ -0,0 +1,6 @@
+"""Prebuilt statements shared by the services.
+
+Import from the submodules (`app.repositories.statements`, `app.repositories.users`):
+the package does not re-export them, because `app.core.security` needs the user
+lookups while `app.models` may still be partially imported.
+"""
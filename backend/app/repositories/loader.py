@@ -0,0 +1,119 @@
+"""Request-scoped memo of the access lookups, keyed like their statements.
+
+Services ask the session's loader (`get_loader(db)`) instead of executing the
+access statements directly, so a request that checks the same project, task or
+membership twice pays for one query, and batch callers fetch only the keys not
+already loaded. The memo is dropped whenever the session commits or rolls back,
+so a write is never answered from rows read before it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.repositories.statements import (
+    PROJECT_ACCESS,
+    PROJECTS_ACCESS,
+    TASK_ACCESS,
+    TASKS_ACCESS,
+    TEAM_MEMBER_USER,
+    TEAM_MEMBERSHIP,
+)
+
+_LOADER_KEY = "request_loader"
+
+
+class RequestLoader:
+    def __init__(self, db: Session) -> None:
+        self._db = db
+        self._rows: dict[tuple[str, Hashable], object] = {}
+
+    def _load(self, kind: str, key: Hashable, fetch: Callable[[], object]):
+        memo_key = (kind, key)
+        if memo_key not in self._rows:
+            self._rows[memo_key] = fetch()
+        return self._rows[memo_key]
+
+    def _load_many(self, kind: str, keys: Iterable[Hashable], fetch: Callable[[list], dict]) -> dict:
+        keys = list(dict.fromkeys(keys))
+        missing = [key for key in keys if (kind, key) not in self._rows]
+        if missing:
+            found = fetch(missing)
+            for key in missing:
+                self._rows[(kind, key)] = found.get(key)
+        return {key: row for key in keys if (row := self._rows[(kind, key)]) is not None}
+
+    def prime(self, kind: str, key: Hashable, row) -> None:
+        """Record a row fetched by another query that also answers this lookup."""
+        self._rows[(kind, key)] = row
+
+    def project_access(self, project_id: int, user_id: int):
+        """PROJECT_ACCESS: the project's columns and the user's role, or None."""
+        return self.project_accesses([project_id], user_id).get(project_id)
+
+    def project_accesses(self, project_ids: Iterable[int], user_id: int) -> dict:
+        rows = self._load_many(
+            "project_access",
+            ((project_id, user_id) for project_id in project_ids),
+            lambda keys: self._fetch_by_id(
+                PROJECT_ACCESS, PROJECTS_ACCESS, "project_id", "project_ids", keys, user_id
+            ),
+        )
+        return {project_id: row for (project_id, _user_id), row in rows.items()}
+
+    def task_access(self, task_id: int, user_id: int):
+        """TASK_ACCESS: the task's ownership fields and the user's role, or None."""
+        return self.task_accesses([task_id], user_id).get(task_id)
+
+    def task_accesses(self, task_ids: Iterable[int], user_id: int) -> dict:
+        rows = self._load_many(
+            "task_access",
+            ((task_id, user_id) for task_id in task_ids),
+            lambda keys: self._fetch_by_id(TASK_ACCESS, TASKS_ACCESS, "task_id", "task_ids", keys, user_id),
+        )
+        return {task_id: row for (task_id, _user_id), row in rows.items()}
+
+    def team_membership(self, team_id: int, user_id: int):
+        """TEAM_MEMBERSHIP: the team with the user's role (NULL if not a member), or None."""
+        return self._load(
+            "team_membership",
+            (team_id, user_id),
+            lambda: self._db.execute(TEAM_MEMBERSHIP, {"team_id": team_id, "user_id": user_id}).first(),
+        )
+
+    def team_member_user(self, team_id: int, user_id: int):
+        """TEAM_MEMBER_USER: the user's public fields and membership id in the team, or None."""
+        return self._load(
+            "team_member_user",
+            (team_id, user_id),
+            lambda: self._db.execute(TEAM_MEMBER_USER, {"team_id": team_id, "user_id": user_id}).first(),
+        )
+
+    def _fetch_by_id(self, single, batch, id_param: str, ids_param: str, keys: list, user_id: int) -> dict:
+        ids = [row_id for row_id, _user_id in keys]
+        if len(ids) == 1:
+            rows = self._db.execute(single, {id_param: ids[0], "user_id": user_id})
+        else:
+            rows = self._db.execute(batch, {ids_param: ids, "user_id": user_id})
+        return {(row.id, user_id): row for row in rows}
+
+
+def get_loader(db: Session) -> RequestLoader:
+    """The loader for `db`'s current transaction; sessions live for one request."""
+    loader = db.info.get(_LOADER_KEY)
+    if loader is None:
+        loader = db.info[_LOADER_KEY] = RequestLoader(db)
+    return loader
+
+
+@event.listens_for(Session, "after_commit")
+def _drop_loader_on_commit(session: Session) -> None:
+    session.info.pop(_LOADER_KEY, None)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_loader_on_rollback(session: Session, previous_transaction) -> None:
+    session.info.pop(_LOADER_KEY, None)
@@ -0,0 +1,158 @@
+"""Prebuilt statements for the lookups that run on nearly every request.
+
+Each statement is built once at import with `bindparam()` placeholders, so a
+call only binds values: there is no select() construction per call, and the
+compiled SQL is reused from the engine's statement cache.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import bindparam, func, literal_column, select
+
+from app.models.project import Project
+from app.models.project_task_stats import ProjectTaskStats
+from app.models.task import Task
+from app.models.team import Team, team_members
+from app.models.user import User
+from app.schemas.task import TaskStatus
+
+# One row per existing team; `role` is NULL when the user is not a member.
+TEAM_MEMBERSHIP = (
+    select(Team.id.label("team_id"), team_members.c.user_id, team_members.c.role)
+    .outerjoin(
+        team_members,
+        (team_members.c.team_id == Team.id) & (team_members.c.user_id == bindparam("user_id")),
+    )
+    .where(Team.id == bindparam("team_id"))
+)
+
+PROJECT_COLUMNS = (
+    Project.id,
+    Project.team_id,
+    Project.name,
+    Project.description,
+    Project.created_by,
+    Project.created_at,
+    Project.updated_at,
+)
+
+
+def _status_count(status: TaskStatus):
+    count = (
+        select(ProjectTaskStats.task_count)
+        .where(ProjectTaskStats.project_id == Project.id, ProjectTaskStats.status == status.value)
+        .scalar_subquery()
+    )
+    return func.coalesce(count, 0).label(f"{status.name.lower()}_tasks")
+
+
+# Per-project counts to select next to PROJECT_COLUMNS: one primary-key probe of
+# project_task_stats per status, plus an overdue count over the partial index of
+# open tasks with a due date. `now` is bound at execution time; 'done' is inlined
+# so the planner can match the partial index predicate.
+PROJECT_TASK_COUNTS = (
+    *(_status_count(status) for status in TaskStatus),
+    select(func.count())
+    .where(
+        Task.project_id == Project.id,
+        Task.status != literal_column(f"'{TaskStatus.DONE.value}'"),
+        Task.due_date < bindparam("now", callable_=lambda: datetime.now(timezone.utc), type_=Task.due_date.type),
+    )
+    .scalar_subquery()
+    .label("overdue_tasks"),
+)
+
+
+def _project_access(project_filter):
+    return (
+        select(*PROJECT_COLUMNS, team_members.c.role)
+        .outerjoin(
+            team_members,
+            (team_members.c.team_id == Project.team_id) & (team_members.c.user_id == bindparam("user_id")),
+        )
+        .where(project_filter)
+    )
+
+
+PROJECT_ACCESS = _project_access(Project.id == bindparam("project_id"))
+# Batch variant for POST /tasks/bulk.
+PROJECTS_ACCESS = _project_access(Project.id.in_(bindparam("project_ids", expanding=True)))
+
+_TASK_ACCESS_COLUMNS = (
+    Task.id,
+    Task.created_by,
+    Task.assigned_user_id,
+    Project.team_id,
+    Project.created_by.label("project_created_by"),
+    team_members.c.role,
+)
+
+
+def _task_access(task_filter):
+    return (
+        select(*_TASK_ACCESS_COLUMNS)
+        .join(Project, Project.id == Task.project_id)
+        .outerjoin(
+            team_members,
+            (team_members.c.team_id == Project.team_id) & (team_members.c.user_id == bindparam("user_id")),
+        )
+        .where(task_filter)
+    )
+
+
+TASK_ACCESS = _task_access(Task.id == bindparam("task_id"))
+# Batch variant for POST /tasks/bulk.
+TASKS_ACCESS = _task_access(Task.id.in_(bindparam("task_ids", expanding=True)))
+
+# The user's public fields plus their membership id in the team (NULL if not a member).
+TEAM_MEMBER_USER = (
+    select(User.id, User.username, User.first_name, User.last_name, team_members.c.id.label("membership_id"))
+    .outerjoin(
+        team_members,
+        (team_members.c.user_id == User.id) & (team_members.c.team_id == bindparam("team_id")),
+    )
+    .where(User.id == bindparam("user_id"))
+)
+
+# Batch variant: one row per user and membership in any of `team_ids` (team_id
+# is NULL for a user in none of them).
+TEAM_MEMBER_USERS = (
+    select(User.id, team_members.c.team_id)
+    .outerjoin(
+        team_members,
+        (team_members.c.user_id == User.id) & team_members.c.team_id.in_(bindparam("team_ids", expanding=True)),
+    )
+    .where(User.id.in_(bindparam("user_ids", expanding=True)))
+)
+
+# Change markers for conditional GETs (app/core/etag.py). The project's team
+# content_version, with the caller's role (NULL if not a member). The project
+# columns make the row a PROJECT_ACCESS answer too (see app.repositories.loader).
+PROJECT_CONTENT_VERSION = (
+    select(*PROJECT_COLUMNS, Team.content_version, team_members.c.role)
+    .select_from(Project)
+    .join(Team, Team.id == Project.team_id)
+    .outerjoin(
+        team_members,
+        (team_members.c.team_id == Project.team_id) & (team_members.c.user_id == bindparam("user_id")),
+    )
+    .where(Project.id == bindparam("project_id"))
+)
+
+# The team's content_version with the caller's role (NULL if not a member); the
+# row is a TEAM_MEMBERSHIP answer too (see app.repositories.loader).
+TEAM_CONTENT_VERSION = TEAM_MEMBERSHIP.add_columns(Team.content_version)
+
+# The user's membership_version and the sum of their teams' content_versions.
+# Both only ever grow, so the pair changes whenever a team is joined or any of
+# the user's teams is written to.
+USER_CONTENT_VERSION = (
+    select(User.membership_version, func.coalesce(func.sum(Team.content_version), 0).label("content_version"))
+    .select_from(User)
+    .outerjoin(team_members, team_members.c.user_id == User.id)
+    .outerjoin(Team, Team.id == team_members.c.team_id)
+    .where(User.id == bindparam("user_id"))
+    .group_by(User.membership_version)
+)
@@ -0,0 +1,15 @@
+"""Prebuilt user lookups.
+
+Kept apart from `statements` so `app.core.security` can import them without
+pulling in the project and task models while `app.models` is still loading.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import bindparam, select
+
+from app.models.user import User
+
+USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+
+USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
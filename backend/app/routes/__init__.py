@@ -1,3 +1,3 @@
-from . import auth, projects, tasks, teams
+from . import admin, auth, projects, tasks, teams, users
 
-__all__ = ["auth", "teams", "projects", "tasks"]
+__all__ = ["admin", "auth", "teams", "projects", "tasks", "users"]
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import hmac
+
+from fastapi import APIRouter, Header
+
+from app.core.config import settings
+from app.core.exceptions import ForbiddenException
+from app.core.metrics import collect_metrics
+from app.schemas.common import ApiResponse
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+def _require_admin_token(token: str | None) -> None:
+    # No configured token means no access, in every environment.
+    if not settings.ADMIN_METRICS_TOKEN:
+        raise ForbiddenException("Admin metrics are disabled")
+    if token is None or not hmac.compare_digest(token, settings.ADMIN_METRICS_TOKEN):
+        raise ForbiddenException("Invalid admin token")
+
+
+@router.get("/metrics", response_model=ApiResponse[dict[str, object]])
+def metrics_endpoint(x_admin_token: str | None = Header(default=None)):
+    _require_admin_token(x_admin_token)
+    return ApiResponse(message="Metrics fetched successfully", data=collect_metrics())
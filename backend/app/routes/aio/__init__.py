@@ -0,0 +1,3 @@
+from . import auth, projects, tasks, teams, users
+
+__all__ = ["auth", "teams", "projects", "tasks", "users"]
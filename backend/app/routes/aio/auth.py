@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_db
+from app.core.security import get_current_user_async
+from app.models.user import User
+from app.schemas.auth import LoginResponse
+from app.schemas.common import ApiResponse
+from app.schemas.user import UserCreate, UserResponse
+from app.services.auth_service import login_user_async, register_user_async
+
+router = APIRouter(prefix="/auth", tags=["Auth"])
+
+
+@router.post(
+    "/register",
+    response_model=ApiResponse[UserResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def register(payload: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    user = await register_user_async(
+        db,
+        username=payload.username.strip(),
+        email=payload.email,
+        first_name=payload.first_name.strip(),
+        last_name=payload.last_name.strip(),
+        password=payload.password,
+    )
+    return ApiResponse(message="User registered successfully", data=user)
+
+
+@router.post("/login", response_model=ApiResponse[LoginResponse])
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
+    result = await login_user_async(db, form_data.username.strip(), form_data.password)
+    return ApiResponse(message="Login successful", data=result)
+
+
+@router.get("/me", response_model=ApiResponse[UserResponse])
+async def me(current_user: User = Depends(get_current_user_async)):
+    return ApiResponse(message="Current user profile", data=current_user)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_async_db, get_async_read_db
+from app.core.etag import etag_headers, is_not_modified, not_modified, weak_etag
+from app.core.events import event_broker
+from app.core.pagination import PageParams, page_params
+from app.core.security import get_current_user_async
+from app.core.streaming import event_stream_response
+from app.models.user import User
+from app.schemas.common import ApiResponse, PaginatedResponse
+from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
+from app.services.project_service import (
+    create_project,
+    delete_project,
+    get_project_access,
+    get_project_list_version,
+    list_team_projects,
+    update_project,
+)
+
+router = APIRouter(tags=["Projects"])
+
+
+@router.post(
+    "/teams/{team_id}/projects",
+    response_model=ApiResponse[ProjectResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_project_endpoint(
+    team_id: int,
+    payload: ProjectCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    project = await db.run_sync(create_project, team_id=team_id, payload=payload, current_user_id=current_user.id)
+    return ApiResponse(message="Project created successfully", data=project)
+
+
+@router.get("/teams/{team_id}/projects", response_model=PaginatedResponse[list[ProjectResponse]])
+async def list_projects_endpoint(
+    team_id: int,
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    etag = weak_etag(request, current_user.id, *await db.run_sync(get_project_list_version, team_id, current_user.id))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    response.headers.update(etag_headers(etag))
+
+    projects = await db.run_sync(list_team_projects, team_id, current_user.id, page)
+    return PaginatedResponse(
+        message="Projects fetched successfully",
+        data=projects.items,
+        limit=projects.limit,
+        next_cursor=projects.next_cursor,
+    )
+
+
+@router.patch("/projects/{project_id}", response_model=ApiResponse[ProjectResponse])
+async def update_project_endpoint(
+    project_id: int,
+    payload: ProjectUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    project = await db.run_sync(update_project, project_id=project_id, payload=payload, current_user_id=current_user.id)
+    return ApiResponse(message="Project updated successfully", data=project)
+
+
+@router.delete("/projects/{project_id}", response_model=ApiResponse[None])
+async def delete_project_endpoint(
+    project_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    await db.run_sync(delete_project, project_id=project_id, current_user_id=current_user.id)
+    return ApiResponse(message="Project deleted successfully")
+
+
+@router.get("/projects/{project_id}/events", response_class=StreamingResponse)
+async def project_events_endpoint(
+    project_id: int,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    await db.run_sync(get_project_access, project_id, current_user.id)
+    return event_stream_response(
+        event_broker.stream(project_id, heartbeat_seconds=settings.EVENT_HEARTBEAT_SECONDS)
+    )
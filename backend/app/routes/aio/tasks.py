@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_db, get_async_read_db, open_read_session
+from app.core.etag import etag_headers, is_not_modified, not_modified, weak_etag
+from app.core.pagination import MAX_PAGE_SIZE, PageParams, page_params
+from app.core.responses import page_response
+from app.core.security import get_current_user_async
+from app.core.streaming import NDJSON_MEDIA_TYPE, streaming_response, wants_ndjson
+from app.models.user import User
+from app.schemas.common import ApiResponse, PaginatedResponse
+from app.schemas.task import (
+    MyTasksSummaryResponse,
+    TaskAssign,
+    TaskBulkRequest,
+    TaskBulkResponse,
+    TaskCreate,
+    TaskResponse,
+    TaskStatus,
+    TaskStatusUpdate,
+    TaskUpdate,
+)
+from app.services.task_service import (
+    assign_task,
+    bulk_task_operations,
+    create_task,
+    delete_task,
+    get_my_tasks_summary,
+    get_task_content_version,
+    list_tasks,
+    search_tasks,
+    stream_tasks,
+    update_task,
+    update_task_status,
+)
+
+router = APIRouter(prefix="/tasks", tags=["Tasks"])
+
+
+@router.get("/me/summary", response_model=ApiResponse[MyTasksSummaryResponse])
+async def my_tasks_summary_endpoint(
+    request: Request,
+    response: Response,
+    include_tasks: bool = Query(default=True, description="Set to false to return only the counts"),
+    task_limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    etag = weak_etag(request, current_user.id, *await db.run_sync(get_task_content_version, current_user.id))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    response.headers.update(etag_headers(etag))
+
+    summary = await db.run_sync(
+        get_my_tasks_summary, current_user.id, include_tasks=include_tasks, task_limit=task_limit
+    )
+    return ApiResponse(message="My task summary fetched successfully", data=summary)
+
+
+@router.post(
+    "/",
+    response_model=ApiResponse[TaskResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_task_endpoint(
+    payload: TaskCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    task = await db.run_sync(create_task, payload, current_user.id)
+    return ApiResponse(message="Task created successfully", data=task)
+
+
+@router.post("/bulk", response_model=ApiResponse[TaskBulkResponse])
+async def bulk_task_operations_endpoint(
+    payload: TaskBulkRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    result = await db.run_sync(bulk_task_operations, payload, current_user.id)
+    return ApiResponse(message="Bulk task operations processed", data=result)
+
+
+@router.get("/", response_model=PaginatedResponse[list[TaskResponse]])
+async def list_tasks_endpoint(
+    request: Request,
+    project_id: int | None = None,
+    status_filter: TaskStatus | None = Query(default=None, alias="status"),
+    assigned_user_id: int | None = None,
+    stream: bool = Query(default=False, description="Stream every matching task as NDJSON instead of a page"),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    if wants_ndjson(request, stream):
+        chunks = await run_in_threadpool(
+            stream_tasks,
+            open_read_session(request),
+            current_user_id=current_user.id,
+            project_id=project_id,
+            status=status_filter,
+            assigned_user_id=assigned_user_id,
+        )
+        return streaming_response(chunks, media_type=NDJSON_MEDIA_TYPE)
+
+    etag = weak_etag(request, current_user.id, *await db.run_sync(get_task_content_version, current_user.id, project_id))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    tasks = await db.run_sync(
+        list_tasks,
+        current_user_id=current_user.id,
+        project_id=project_id,
+        status=status_filter,
+        assigned_user_id=assigned_user_id,
+        page=page,
+    )
+    return page_response("Tasks fetched successfully", tasks, headers=etag_headers(etag))
+
+
+@router.get("/search", response_model=PaginatedResponse[list[TaskResponse]])
+async def search_tasks_endpoint(
+    request: Request,
+    q: str = Query(min_length=1, max_length=200, description="Words to find in task titles and descriptions"),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    etag = weak_etag(request, current_user.id, *await db.run_sync(get_task_content_version, current_user.id))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    tasks = await db.run_sync(search_tasks, current_user_id=current_user.id, query=q, page=page)
+    return page_response("Tasks fetched successfully", tasks, headers=etag_headers(etag))
+
+
+@router.patch("/{task_id}", response_model=ApiResponse[TaskResponse])
+async def update_task_endpoint(
+    task_id: int,
+    payload: TaskUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    task = await db.run_sync(update_task, task_id=task_id, payload=payload, current_user_id=current_user.id)
+    return ApiResponse(message="Task updated successfully", data=task)
+
+
+@router.patch("/{task_id}/status", response_model=ApiResponse[TaskResponse])
+async def update_task_status_endpoint(
+    task_id: int,
+    payload: TaskStatusUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    task = await db.run_sync(update_task_status, task_id=task_id, payload=payload, current_user_id=current_user.id)
+    return ApiResponse(message="Task status updated successfully", data=task)
+
+
+@router.patch("/{task_id}/assign", response_model=ApiResponse[TaskResponse])
+async def assign_task_endpoint(
+    task_id: int,
+    payload: TaskAssign,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    task = await db.run_sync(assign_task, task_id=task_id, payload=payload, current_user_id=current_user.id)
+    return ApiResponse(message="Task assignment updated successfully", data=task)
+
+
+@router.delete("/{task_id}", response_model=ApiResponse[None])
+async def delete_task_endpoint(
+    task_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    await db.run_sync(delete_task, task_id=task_id, current_user_id=current_user.id)
+    return ApiResponse(message="Task deleted successfully")
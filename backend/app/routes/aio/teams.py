@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, File, Query, Request, UploadFile, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_db, get_async_read_db, open_read_session
+from app.core.etag import etag_headers, is_not_modified, not_modified, weak_etag
+from app.core.pagination import PageParams, page_params
+from app.core.responses import page_response
+from app.core.security import get_current_user_async
+from app.core.streaming import streaming_response
+from app.models.user import User
+from app.schemas.common import ApiResponse, PaginatedResponse
+from app.schemas.team import (
+    TeamCreate,
+    TeamMemberCreate,
+    TeamMemberDetailResponse,
+    TeamMemberInvite,
+    TeamMemberResponse,
+    TeamResponse,
+)
+from app.schemas.transfer import TeamImportResponse, TransferEntity, TransferFormat
+from app.services.team_service import (
+    add_member,
+    create_team,
+    get_team_members,
+    get_teams_content_version,
+    get_user_teams,
+    invite_member,
+    require_team_member,
+)
+from app.services.transfer_service import import_team_data, stream_team_export
+
+router = APIRouter(prefix="/teams", tags=["Teams"])
+
+
+@router.post(
+    "/",
+    response_model=ApiResponse[TeamResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_team_endpoint(
+    payload: TeamCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    team = await db.run_sync(create_team, payload, current_user.id)
+    return ApiResponse(message="Team created successfully", data=team)
+
+
+@router.get("/", response_model=PaginatedResponse[list[TeamResponse]])
+async def list_teams_endpoint(
+    request: Request,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    etag = weak_etag(request, current_user.id, *await db.run_sync(get_teams_content_version, current_user.id))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    teams = await db.run_sync(get_user_teams, current_user.id, page)
+    return page_response("Teams fetched successfully", teams, headers=etag_headers(etag))
+
+
+@router.get("/{team_id}/members", response_model=PaginatedResponse[list[TeamMemberDetailResponse]])
+async def list_team_members_endpoint(
+    team_id: int,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    members = await db.run_sync(get_team_members, team_id, current_user.id, page)
+    return PaginatedResponse(
+        message="Team members fetched successfully",
+        data=members.items,
+        limit=members.limit,
+        next_cursor=members.next_cursor,
+    )
+
+
+@router.post(
+    "/{team_id}/members",
+    response_model=ApiResponse[TeamMemberResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def add_team_member_endpoint(
+    team_id: int,
+    payload: TeamMemberCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    member = await db.run_sync(add_member, team_id, payload, current_user.id)
+    return ApiResponse(message="Member added successfully", data=member)
+
+
+@router.post(
+    "/{team_id}/members/invite",
+    response_model=ApiResponse[TeamMemberResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def invite_team_member_endpoint(
+    team_id: int,
+    payload: TeamMemberInvite,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    member = await db.run_sync(invite_member, team_id, payload, current_user.id)
+    return ApiResponse(message="Member invited successfully", data=member)
+
+
+@router.get("/{team_id}/export", response_class=StreamingResponse)
+async def export_team_endpoint(
+    team_id: int,
+    request: Request,
+    fmt: TransferFormat = Query(default=TransferFormat.NDJSON, alias="format"),
+    entity: TransferEntity | None = None,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    await db.run_sync(require_team_member, team_id, current_user.id)
+    suffix = f"-{entity.value}" if entity is not None else ""
+    return streaming_response(
+        stream_team_export(open_read_session(request), team_id, fmt, entity),
+        media_type=fmt.media_type,
+        filename=f"team-{team_id}{suffix}.{fmt.value}",
+    )
+
+
+@router.post("/{team_id}/import", response_model=ApiResponse[TeamImportResponse])
+async def import_team_endpoint(
+    team_id: int,
+    file: UploadFile = File(...),
+    fmt: TransferFormat = Query(default=TransferFormat.NDJSON, alias="format"),
+    entity: TransferEntity | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    result = await db.run_sync(
+        import_team_data, team_id=team_id, current_user_id=current_user.id, stream=file.file, fmt=fmt, entity=entity
+    )
+    return ApiResponse(message="Team data imported successfully", data=result)
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_async_read_db
+from app.core.security import get_current_user_async
+from app.models.user import User
+from app.schemas.common import ApiResponse
+from app.schemas.user import UserLookupResponse
+from app.services.user_service import LOOKUP_DEFAULT_RESULTS, LOOKUP_MAX_RESULTS, lookup_users
+
+router = APIRouter(prefix="/users", tags=["Users"])
+
+
+@router.get("/lookup", response_model=ApiResponse[list[UserLookupResponse]])
+async def lookup_users_endpoint(
+    response: Response,
+    prefix: str = Query(min_length=1, max_length=255, description="Start of a username or email"),
+    team_id: int | None = Query(default=None, description="Only search this team's members"),
+    limit: int = Query(default=LOOKUP_DEFAULT_RESULTS, ge=1, le=LOOKUP_MAX_RESULTS),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    users = await db.run_sync(
+        lookup_users, current_user_id=current_user.id, prefix=prefix, team_id=team_id, limit=limit
+    )
+    response.headers["Cache-Control"] = f"private, max-age={int(settings.USER_LOOKUP_CACHE_SECONDS)}"
+    return ApiResponse(message="Users fetched successfully", data=users)
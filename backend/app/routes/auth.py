@@ -4,13 +4,13 @@ from fastapi import APIRouter, Depends, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import ThreadpoolSession, get_db
 from app.core.security import get_current_user
 from app.models.user import User
 from app.schemas.auth import LoginResponse
 from app.schemas.common import ApiResponse
 from app.schemas.user import UserCreate, UserResponse
-from app.services.auth_service import login_user, register_user
+from app.services.auth_service import login_user_async, register_user_async
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
@@ -20,9 +20,10 @@ router = APIRouter(prefix="/auth", tags=["Auth"])
     response_model=ApiResponse[UserResponse],
     status_code=status.HTTP_201_CREATED,
 )
-def register(payload: UserCreate, db: Session = Depends(get_db)):
-    user = register_user(
-        db,
+async def register(payload: UserCreate, db: Session = Depends(get_db)):
+    # bcrypt is awaited on the hashing executor instead of blocking a request thread.
+    user = await register_user_async(
+        ThreadpoolSession(db),
         username=payload.username.strip(),
         email=payload.email,
         first_name=payload.first_name.strip(),
@@ -33,8 +34,8 @@ def register(payload: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=ApiResponse[LoginResponse])
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    result = login_user(db, form_data.username.strip(), form_data.password)
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+    result = await login_user_async(ThreadpoolSession(db), form_data.username.strip(), form_data.password)
     return ApiResponse(message="Login successful", data=result)
 
 
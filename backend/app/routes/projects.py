@@ -1,14 +1,27 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.config import settings
+from app.core.database import get_db, get_read_db
+from app.core.etag import etag_headers, is_not_modified, not_modified, weak_etag
+from app.core.events import event_broker
+from app.core.pagination import PageParams, page_params
 from app.core.security import get_current_user
+from app.core.streaming import event_stream_response
 from app.models.user import User
-from app.schemas.common import ApiResponse
+from app.schemas.common import ApiResponse, PaginatedResponse
 from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
-from app.services.project_service import create_project, delete_project, list_team_projects, update_project
+from app.services.project_service import (
+    create_project,
+    delete_project,
+    get_project_access,
+    get_project_list_version,
+    list_team_projects,
+    update_project,
+)
 
 router = APIRouter(tags=["Projects"])
 
@@ -28,14 +41,27 @@ def create_project_endpoint(
     return ApiResponse(message="Project created successfully", data=project)
 
 
-@router.get("/teams/{team_id}/projects", response_model=ApiResponse[list[ProjectResponse]])
+@router.get("/teams/{team_id}/projects", response_model=PaginatedResponse[list[ProjectResponse]])
 def list_projects_endpoint(
     team_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    projects = list_team_projects(db, team_id, current_user.id)
-    return ApiResponse(message="Projects fetched successfully", data=projects)
+    etag = weak_etag(request, current_user.id, *get_project_list_version(db, team_id, current_user.id))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    response.headers.update(etag_headers(etag))
+
+    projects = list_team_projects(db, team_id, current_user.id, page)
+    return PaginatedResponse(
+        message="Projects fetched successfully",
+        data=projects.items,
+        limit=projects.limit,
+        next_cursor=projects.next_cursor,
+    )
 
 
 @router.patch("/projects/{project_id}", response_model=ApiResponse[ProjectResponse])
@@ -57,3 +83,15 @@ def delete_project_endpoint(
 ):
     delete_project(db, project_id=project_id, current_user_id=current_user.id)
     return ApiResponse(message="Project deleted successfully")
+
+
+@router.get("/projects/{project_id}/events", response_class=StreamingResponse)
+def project_events_endpoint(
+    project_id: int,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    get_project_access(db, project_id, current_user.id)
+    return event_stream_response(
+        event_broker.stream(project_id, heartbeat_seconds=settings.EVENT_HEARTBEAT_SECONDS)
+    )
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db, open_read_session
+from app.core.etag import etag_headers, is_not_modified, not_modified, weak_etag
+from app.core.pagination import MAX_PAGE_SIZE, PageParams, page_params
+from app.core.responses import page_response
 from app.core.security import get_current_user
+from app.core.streaming import NDJSON_MEDIA_TYPE, streaming_response, wants_ndjson
 from app.models.user import User
-from app.schemas.common import ApiResponse
+from app.schemas.common import ApiResponse, PaginatedResponse
 from app.schemas.task import (
     MyTasksSummaryResponse,
     TaskAssign,
+    TaskBulkRequest,
+    TaskBulkResponse,
     TaskCreate,
     TaskResponse,
     TaskStatus,
@@ -18,10 +24,14 @@ from app.schemas.task import (
 )
 from app.services.task_service import (
     assign_task,
+    bulk_task_operations,
     create_task,
     delete_task,
     get_my_tasks_summary,
+    get_task_content_version,
     list_tasks,
+    search_tasks,
+    stream_tasks,
     update_task,
     update_task_status,
 )
@@ -31,10 +41,19 @@ router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
 @router.get("/me/summary", response_model=ApiResponse[MyTasksSummaryResponse])
 def my_tasks_summary_endpoint(
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    include_tasks: bool = Query(default=True, description="Set to false to return only the counts"),
+    task_limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    summary = get_my_tasks_summary(db, current_user.id)
+    etag = weak_etag(request, current_user.id, *get_task_content_version(db, current_user.id))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    response.headers.update(etag_headers(etag))
+
+    summary = get_my_tasks_summary(db, current_user.id, include_tasks=include_tasks, task_limit=task_limit)
     return ApiResponse(message="My task summary fetched successfully", data=summary)
 
 
@@ -52,22 +71,66 @@ def create_task_endpoint(
     return ApiResponse(message="Task created successfully", data=task)
 
 
-@router.get("/", response_model=ApiResponse[list[TaskResponse]])
+@router.post("/bulk", response_model=ApiResponse[TaskBulkResponse])
+def bulk_task_operations_endpoint(
+    payload: TaskBulkRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    result = bulk_task_operations(db, payload, current_user.id)
+    return ApiResponse(message="Bulk task operations processed", data=result)
+
+
+@router.get("/", response_model=PaginatedResponse[list[TaskResponse]])
 def list_tasks_endpoint(
+    request: Request,
     project_id: int | None = None,
     status_filter: TaskStatus | None = Query(default=None, alias="status"),
     assigned_user_id: int | None = None,
-    db: Session = Depends(get_db),
+    stream: bool = Query(default=False, description="Stream every matching task as NDJSON instead of a page"),
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
+    if wants_ndjson(request, stream):
+        chunks = stream_tasks(
+            open_read_session(request),
+            current_user_id=current_user.id,
+            project_id=project_id,
+            status=status_filter,
+            assigned_user_id=assigned_user_id,
+        )
+        return streaming_response(chunks, media_type=NDJSON_MEDIA_TYPE)
+
+    etag = weak_etag(request, current_user.id, *get_task_content_version(db, current_user.id, project_id))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
     tasks = list_tasks(
         db,
         current_user_id=current_user.id,
         project_id=project_id,
         status=status_filter,
         assigned_user_id=assigned_user_id,
+        page=page,
     )
-    return ApiResponse(message="Tasks fetched successfully", data=tasks)
+    return page_response("Tasks fetched successfully", tasks, headers=etag_headers(etag))
+
+
+@router.get("/search", response_model=PaginatedResponse[list[TaskResponse]])
+def search_tasks_endpoint(
+    request: Request,
+    q: str = Query(min_length=1, max_length=200, description="Words to find in task titles and descriptions"),
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    etag = weak_etag(request, current_user.id, *get_task_content_version(db, current_user.id))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    tasks = search_tasks(db, current_user_id=current_user.id, query=q, page=page)
+    return page_response("Tasks fetched successfully", tasks, headers=etag_headers(etag))
 
 
 @router.patch("/{task_id}", response_model=ApiResponse[TaskResponse])
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, File, Query, Request, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db, open_read_session
+from app.core.etag import etag_headers, is_not_modified, not_modified, weak_etag
+from app.core.pagination import PageParams, page_params
+from app.core.responses import page_response
 from app.core.security import get_current_user
+from app.core.streaming import streaming_response
 from app.models.user import User
-from app.schemas.common import ApiResponse
+from app.schemas.common import ApiResponse, PaginatedResponse
 from app.schemas.team import (
     TeamCreate,
     TeamMemberCreate,
@@ -15,7 +20,17 @@ from app.schemas.team import (
     TeamMemberResponse,
     TeamResponse,
 )
-from app.services.team_service import add_member, create_team, get_team_members, get_user_teams, invite_member
+from app.schemas.transfer import TeamImportResponse, TransferEntity, TransferFormat
+from app.services.team_service import (
+    add_member,
+    create_team,
+    get_team_members,
+    get_teams_content_version,
+    get_user_teams,
+    invite_member,
+    require_team_member,
+)
+from app.services.transfer_service import import_team_data, stream_team_export
 
 router = APIRouter(prefix="/teams", tags=["Teams"])
 
@@ -34,23 +49,35 @@ def create_team_endpoint(
     return ApiResponse(message="Team created successfully", data=team)
 
 
-@router.get("/", response_model=ApiResponse[list[TeamResponse]])
+@router.get("/", response_model=PaginatedResponse[list[TeamResponse]])
 def list_teams_endpoint(
-    db: Session = Depends(get_db),
+    request: Request,
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    teams = get_user_teams(db, current_user.id)
-    return ApiResponse(message="Teams fetched successfully", data=teams)
+    etag = weak_etag(request, current_user.id, *get_teams_content_version(db, current_user.id))
+    if is_not_modified(request, etag):
+        return not_modified(etag)
 
+    teams = get_user_teams(db, current_user.id, page)
+    return page_response("Teams fetched successfully", teams, headers=etag_headers(etag))
 
-@router.get("/{team_id}/members", response_model=ApiResponse[list[TeamMemberDetailResponse]])
+
+@router.get("/{team_id}/members", response_model=PaginatedResponse[list[TeamMemberDetailResponse]])
 def list_team_members_endpoint(
     team_id: int,
-    db: Session = Depends(get_db),
+    page: PageParams = Depends(page_params),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
-    members = get_team_members(db, team_id, current_user.id)
-    return ApiResponse(message="Team members fetched successfully", data=members)
+    members = get_team_members(db, team_id, current_user.id, page)
+    return PaginatedResponse(
+        message="Team members fetched successfully",
+        data=members.items,
+        limit=members.limit,
+        next_cursor=members.next_cursor,
+    )
 
 
 @router.post(
@@ -81,3 +108,36 @@ def invite_team_member_endpoint(
 ):
     member = invite_member(db, team_id, payload, current_user.id)
     return ApiResponse(message="Member invited successfully", data=member)
+
+
+@router.get("/{team_id}/export", response_class=StreamingResponse)
+def export_team_endpoint(
+    team_id: int,
+    request: Request,
+    fmt: TransferFormat = Query(default=TransferFormat.NDJSON, alias="format"),
+    entity: TransferEntity | None = None,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    require_team_member(db, team_id, current_user.id)
+    suffix = f"-{entity.value}" if entity is not None else ""
+    return streaming_response(
+        stream_team_export(open_read_session(request), team_id, fmt, entity),
+        media_type=fmt.media_type,
+        filename=f"team-{team_id}{suffix}.{fmt.value}",
+    )
+
+
+@router.post("/{team_id}/import", response_model=ApiResponse[TeamImportResponse])
+def import_team_endpoint(
+    team_id: int,
+    file: UploadFile = File(...),
+    fmt: TransferFormat = Query(default=TransferFormat.NDJSON, alias="format"),
+    entity: TransferEntity | None = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    result = import_team_data(
+        db, team_id=team_id, current_user_id=current_user.id, stream=file.file, fmt=fmt, entity=entity
+    )
+    return ApiResponse(message="Team data imported successfully", data=result)
@@ -15,6 +15,11 @@ class ApiResponse(BaseModel, Generic[T]):
     model_config = ConfigDict(from_attributes=True)
 
 
+class PaginatedResponse(ApiResponse[T], Generic[T]):
+    limit: int
+    next_cursor: str | None = None
+
+
 class ErrorDetail(BaseModel):
     field: str | None = None
     message: str
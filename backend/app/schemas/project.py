@@ -4,6 +4,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.task import TaskStatus
+
 
 class ProjectBase(BaseModel):
     name: str = Field(min_length=2, max_length=120)
@@ -26,5 +28,7 @@ class ProjectResponse(ProjectBase):
     created_at: datetime
     updated_at: datetime | None = None
     can_delete: bool = False
+    task_counts: dict[TaskStatus, int] = Field(default_factory=dict)
+    overdue_tasks: int = 0
 
     model_config = ConfigDict(from_attributes=True)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -58,3 +59,53 @@ class MyTasksSummaryResponse(BaseModel):
     tasks: list[TaskResponse]
     status_counts: dict[TaskStatus, int]
     total_projects: int
+
+
+MAX_BULK_OPERATIONS = 200
+
+
+class TaskBulkCreate(TaskCreate):
+    op: Literal["create"]
+
+
+class TaskBulkStatus(TaskStatusUpdate):
+    op: Literal["status"]
+    task_id: int
+
+
+class TaskBulkAssign(TaskAssign):
+    op: Literal["assign"]
+    task_id: int
+
+
+class TaskBulkDelete(BaseModel):
+    op: Literal["delete"]
+    task_id: int
+
+
+TaskBulkOperation = Annotated[
+    TaskBulkCreate | TaskBulkStatus | TaskBulkAssign | TaskBulkDelete,
+    Field(discriminator="op"),
+]
+
+
+class TaskBulkRequest(BaseModel):
+    operations: list[TaskBulkOperation] = Field(min_length=1, max_length=MAX_BULK_OPERATIONS)
+    # Reject the whole batch if any operation fails validation, instead of
+    # applying the valid ones.
+    atomic: bool = False
+
+
+class TaskBulkResult(BaseModel):
+    index: int
+    op: str
+    status_code: int
+    task_id: int | None = None
+    task: TaskResponse | None = None
+    error: str | None = None
+
+
+class TaskBulkResponse(BaseModel):
+    results: list[TaskBulkResult]
+    applied: int
+    failed: int
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.core.streaming import NDJSON_MEDIA_TYPE
+from app.schemas.task import TaskStatus
+from app.schemas.team import TeamRole
+
+
+class TransferFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        return NDJSON_MEDIA_TYPE if self is TransferFormat.NDJSON else "text/csv"
+
+
+class TransferEntity(str, Enum):
+    MEMBERS = "members"
+    PROJECTS = "projects"
+    TASKS = "tasks"
+
+
+# One exported/imported record per entity. Users are referenced by username and
+# projects by name, so an export can be loaded into another team or instance.
+class _TransferRecord(BaseModel):
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
+
+class MemberRecord(_TransferRecord):
+    username: str = Field(min_length=1, max_length=40)
+    role: TeamRole = TeamRole.MEMBER
+    joined_at: datetime | None = None
+
+
+class ProjectRecord(_TransferRecord):
+    name: str = Field(min_length=2, max_length=120)
+    description: str | None = Field(default=None, max_length=2000)
+    created_by: str | None = None
+    created_at: datetime | None = None
+
+
+class TaskRecord(_TransferRecord):
+    project: str = Field(min_length=2, max_length=120)
+    title: str = Field(min_length=2, max_length=200)
+    description: str | None = Field(default=None, max_length=4000)
+    status: TaskStatus = TaskStatus.TODO
+    assignee: str | None = None
+    due_date: datetime | None = None
+    created_by: str | None = None
+    created_at: datetime | None = None
+
+
+class TeamImportCounts(BaseModel):
+    read: int = 0
+    inserted: int = 0
+    skipped: int = 0
+
+
+class TeamImportResponse(BaseModel):
+    members: TeamImportCounts
+    projects: TeamImportCounts
+    tasks: TeamImportCounts
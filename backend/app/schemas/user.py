@@ -23,3 +23,10 @@ class UserResponse(UserBase):
     updated_at: datetime | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class UserLookupResponse(BaseModel):
+    id: int
+    username: str
+    first_name: str
+    last_name: str
@@ -1,11 +1,11 @@
-from .auth_service import login_user, register_user
+from .auth_service import login_user_async, register_user_async
 from .project_service import create_project, delete_project, list_team_projects, update_project
 from .task_service import assign_task, create_task, delete_task, get_my_tasks_summary, list_tasks, update_task, update_task_status
 from .team_service import add_member, create_team, get_team_members, get_user_teams, invite_member
 
 __all__ = [
-    "login_user",
-    "register_user",
+    "login_user_async",
+    "register_user_async",
     "create_project",
     "delete_project",
     "list_team_projects",
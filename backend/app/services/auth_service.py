@@ -1,22 +1,27 @@
 from __future__ import annotations
 
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.exceptions import BadRequestException, UnauthorizedException
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.core.exceptions import BadRequestException, ServiceUnavailableException, UnauthorizedException
+from app.core.security import (
+    create_access_token,
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password_async,
+)
 from app.models.user import User
+from app.repositories.users import USER_BY_USERNAME
 from app.schemas.auth import LoginResponse, TokenResponse
+from app.services.team_service import get_team_roles
 
+logger = logging.getLogger("app.auth")
 
-def register_user(
-    db: Session,
-    *,
-    username: str,
-    email: str,
-    first_name: str,
-    last_name: str,
-    password: str,
-) -> User:
+
+def _ensure_registration_available(db: Session, username: str, email: str) -> None:
     existing_username = db.query(User).filter(User.username == username).first()
     if existing_username:
         raise BadRequestException("Username already registered")
@@ -25,12 +30,22 @@ def register_user(
     if existing_email:
         raise BadRequestException("Email already registered")
 
+
+def _insert_user(
+    db: Session,
+    *,
+    username: str,
+    email: str,
+    first_name: str,
+    last_name: str,
+    hashed_password: str,
+) -> User:
     user = User(
         username=username,
         email=email,
         first_name=first_name,
         last_name=last_name,
-        hashed_password=get_password_hash(password),
+        hashed_password=hashed_password,
     )
     db.add(user)
     db.commit()
@@ -38,20 +53,79 @@ def register_user(
     return user
 
 
-def authenticate_user(db: Session, username: str, password: str) -> User:
-    user = db.query(User).filter(User.username == username).first()
-    if not user or not verify_password(password, user.hashed_password):
-        raise UnauthorizedException("Incorrect username or password")
-    if not user.is_active:
-        raise UnauthorizedException("User is inactive")
-    return user
+def _get_user_by_username(db: Session, username: str) -> User | None:
+    return db.execute(USER_BY_USERNAME, {"username": username}).scalar_one_or_none()
 
 
-def login_user(db: Session, username: str, password: str) -> LoginResponse:
-    user = authenticate_user(db, username, password)
-    token = create_access_token(user.id)
+# Re-hashing is best effort: the password is already verified, so a busy hasher
+# or a failed write leaves the old hash in place rather than failing the login.
+def _store_password_hash(db: Session, user: User, hashed_password: str) -> None:
+    user_id = user.id
+    try:
+        user.hashed_password = hashed_password
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        logger.warning("password rehash not stored for user %s", user_id, exc_info=True)
+
+
+def _build_login_response(db: Session, user: User) -> LoginResponse:
+    token = create_access_token(
+        user.id,
+        team_roles=get_team_roles(db, user.id),
+        membership_version=user.membership_version,
+    )
 
     return LoginResponse(
         token=TokenResponse(access_token=token),
         user=user,
     )
+
+
+# Both stacks register and log in through these: database work runs through
+# `run_sync` (an AsyncSession, or a ThreadpoolSession on the sync stack), while
+# bcrypt is awaited on the hashing executor so it never blocks the event loop or
+# holds a request thread.
+
+
+async def register_user_async(
+    db: AsyncSession,
+    *,
+    username: str,
+    email: str,
+    first_name: str,
+    last_name: str,
+    password: str,
+) -> User:
+    await db.run_sync(_ensure_registration_available, username, email)
+    hashed_password = await get_password_hash_async(password)
+    return await db.run_sync(
+        _insert_user,
+        username=username,
+        email=email,
+        first_name=first_name,
+        last_name=last_name,
+        hashed_password=hashed_password,
+    )
+
+
+async def authenticate_user_async(db: AsyncSession, username: str, password: str) -> User:
+    user = await db.run_sync(_get_user_by_username, username)
+    if not user or not await verify_password_async(password, user.hashed_password):
+        raise UnauthorizedException("Incorrect username or password")
+    if not user.is_active:
+        raise UnauthorizedException("User is inactive")
+
+    if password_needs_rehash(user.hashed_password):
+        try:
+            hashed_password = await get_password_hash_async(password)
+        except ServiceUnavailableException:
+            logger.info("password rehash skipped for user %s: hasher busy", user.id)
+        else:
+            await db.run_sync(_store_password_hash, user, hashed_password)
+    return user
+
+
+async def login_user_async(db: AsyncSession, username: str, password: str) -> LoginResponse:
+    user = await authenticate_user_async(db, username, password)
+    return await db.run_sync(_build_login_response, user)
@@ -1,27 +1,59 @@
 from __future__ import annotations
 
-from sqlalchemy.exc import SQLAlchemyError
+import time
+
+from sqlalchemy import delete, exists, func, insert, select, text, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.core.database import is_unique_violation
 from app.core.exceptions import BadRequestException, ForbiddenException, NotFoundException
+from app.core.pagination import Page, PageParams, paginate
 from app.models.project import Project
+from app.models.project_task_stats import ProjectTaskStats
+from app.models.task import Task
+from app.models.team import team_members
+from app.repositories.loader import get_loader
+from app.repositories.statements import PROJECT_COLUMNS, PROJECT_TASK_COUNTS, TEAM_CONTENT_VERSION
 from app.schemas.project import ProjectCreate, ProjectResponse, ProjectUpdate
-from app.services.team_service import require_team_member
+from app.schemas.task import TaskStatus
+from app.services.team_service import bump_content_version, require_team_member
+
 
+def get_project_access(db: Session, project_id: int, user_id: int):
+    """Load a project together with the caller's team role in one query.
 
-def get_project_or_404(db: Session, project_id: int) -> Project:
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+    Raises 404 for a missing project and 403 when the caller is not in its team.
+    """
+    row = get_loader(db).project_access(project_id, user_id)
+    if not row:
         raise NotFoundException("Project not found")
-    return project
+    if row.role is None:
+        raise ForbiddenException("Only team members can access this team")
+    return row
+
+
+def _is_team_member(team_id_column, user_id: int):
+    return exists().where((team_members.c.team_id == team_id_column) & (team_members.c.user_id == user_id))
 
 
-def _project_to_response(project: Project, current_user_id: int) -> ProjectResponse:
+def _project_to_response(project, current_user_id: int) -> ProjectResponse:
+    """Build the response from PROJECT_COLUMNS plus, where selected, PROJECT_TASK_COUNTS."""
     return ProjectResponse.model_validate(project).model_copy(
-        update={"can_delete": project.created_by == current_user_id}
+        update={
+            "can_delete": project.created_by == current_user_id,
+            "task_counts": {status: getattr(project, f"{status.name.lower()}_tasks", 0) for status in TaskStatus},
+        }
     )
 
 
+def _raise_for_duplicate_name(db: Session, exc: IntegrityError) -> None:
+    db.rollback()
+    if is_unique_violation(exc):
+        raise BadRequestException("Project name already exists in this team") from exc
+    raise exc
+
+
 def create_project(
     db: Session,
     *,
@@ -31,27 +63,21 @@ def create_project(
 ) -> ProjectResponse:
     require_team_member(db, team_id, current_user_id)
 
-    existing = (
-        db.query(Project)
-        .filter(
-            Project.team_id == team_id,
-            Project.name == payload.name.strip(),
-        )
-        .first()
-    )
-    if existing:
-        raise BadRequestException("Project name already exists in this team")
-
-    project = Project(
-        team_id=team_id,
-        name=payload.name.strip(),
-        description=payload.description.strip() if payload.description else None,
-        created_by=current_user_id,
-    )
     try:
-        db.add(project)
+        project = db.execute(
+            insert(Project)
+            .values(
+                team_id=team_id,
+                name=payload.name.strip(),
+                description=payload.description.strip() if payload.description else None,
+                created_by=current_user_id,
+            )
+            .returning(*PROJECT_COLUMNS)
+        ).one()
+        bump_content_version(db, [team_id])
         db.commit()
-        db.refresh(project)
+    except IntegrityError as exc:
+        _raise_for_duplicate_name(db, exc)
     except SQLAlchemyError:
         db.rollback()
         raise
@@ -59,15 +85,39 @@ def create_project(
     return _project_to_response(project, current_user_id)
 
 
-def list_team_projects(db: Session, team_id: int, current_user_id: int) -> list[ProjectResponse]:
+# overdue_tasks changes with the clock rather than with writes, so project list
+# markers also roll over this often.
+PROJECT_LIST_VERSION_SECONDS = 60
+
+
+def get_project_list_version(db: Session, team_id: int, current_user_id: int) -> tuple:
+    """A change marker for the team's project list, raising like `require_team_member`."""
+    row = db.execute(TEAM_CONTENT_VERSION, {"team_id": team_id, "user_id": current_user_id}).first()
+    if not row:
+        raise NotFoundException("Team not found")
+    # The row also answers the membership check the list itself makes.
+    get_loader(db).prime("team_membership", (team_id, current_user_id), row)
+    if row.role is None:
+        raise ForbiddenException("Only team members can access this team")
+    return (row.content_version, int(time.time() // PROJECT_LIST_VERSION_SECONDS))
+
+
+def list_team_projects(
+    db: Session,
+    team_id: int,
+    current_user_id: int,
+    page: PageParams = PageParams(),
+) -> Page:
     require_team_member(db, team_id, current_user_id)
-    projects = (
-        db.query(Project)
-        .filter(Project.team_id == team_id)
-        .order_by(Project.created_at.desc(), Project.id.desc())
-        .all()
+    result = paginate(
+        db,
+        select(*PROJECT_COLUMNS, *PROJECT_TASK_COUNTS).where(Project.team_id == team_id),
+        sort_column=Project.created_at,
+        id_column=Project.id,
+        page=page,
+        row_key=lambda row: (row.created_at, row.id),
     )
-    return [_project_to_response(project, current_user_id) for project in projects]
+    return result._replace(items=[_project_to_response(row, current_user_id) for row in result.items])
 
 
 def update_project(
@@ -77,31 +127,39 @@ def update_project(
     payload: ProjectUpdate,
     current_user_id: int,
 ) -> ProjectResponse:
-    project = get_project_or_404(db, project_id)
-    require_team_member(db, project.team_id, current_user_id)
-
+    values: dict[str, object] = {}
     if payload.name is not None:
-        name = payload.name.strip()
-        existing = (
-            db.query(Project)
-            .filter(
-                Project.team_id == project.team_id,
-                Project.name == name,
-                Project.id != project.id,
-            )
-            .first()
-        )
-        if existing:
-            raise BadRequestException("Project name already exists in this team")
-        project.name = name
-
+        values["name"] = payload.name.strip()
     if payload.description is not None:
-        description = payload.description.strip()
-        project.description = description or None
+        values["description"] = payload.description.strip() or None
+
+    if not values:
+        project = db.execute(
+            select(*PROJECT_COLUMNS, *PROJECT_TASK_COUNTS).where(
+                Project.id == project_id, _is_team_member(Project.team_id, current_user_id)
+            )
+        ).first()
+        if project is None:
+            get_project_access(db, project_id, current_user_id)
+            raise NotFoundException("Project not found")
+        return _project_to_response(project, current_user_id)
 
     try:
+        project = db.execute(
+            update(Project)
+            .where(Project.id == project_id, _is_team_member(Project.team_id, current_user_id))
+            .values(**values)
+            .returning(*PROJECT_COLUMNS, *PROJECT_TASK_COUNTS)
+            .execution_options(synchronize_session=False)
+        ).first()
+        if project is None:
+            db.rollback()
+            get_project_access(db, project_id, current_user_id)
+            raise NotFoundException("Project not found")
+        bump_content_version(db, [project.team_id])
         db.commit()
-        db.refresh(project)
+    except IntegrityError as exc:
+        _raise_for_duplicate_name(db, exc)
     except SQLAlchemyError:
         db.rollback()
         raise
@@ -109,15 +167,80 @@ def update_project(
 
 
 def delete_project(db: Session, *, project_id: int, current_user_id: int) -> None:
-    project = get_project_or_404(db, project_id)
-    require_team_member(db, project.team_id, current_user_id)
+    try:
+        deleted = db.execute(
+            delete(Project)
+            .where(
+                Project.id == project_id,
+                Project.created_by == current_user_id,
+                _is_team_member(Project.team_id, current_user_id),
+            )
+            .returning(Project.id, Project.team_id)
+            .execution_options(synchronize_session=False)
+        ).first()
+        if deleted is None:
+            db.rollback()
+            get_project_access(db, project_id, current_user_id)
+            raise ForbiddenException("Only project owner can delete this project")
+        # Postgres cascades this through the foreign key; SQLite only does so
+        # with PRAGMA foreign_keys enabled, so clear the tasks explicitly.
+        db.execute(
+            delete(Task).where(Task.project_id == project_id).execution_options(synchronize_session=False)
+        )
+        db.execute(
+            delete(ProjectTaskStats)
+            .where(ProjectTaskStats.project_id == project_id)
+            .execution_options(synchronize_session=False)
+        )
+        bump_content_version(db, [deleted.team_id])
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        raise
+
 
-    if project.created_by != current_user_id:
-        raise ForbiddenException("Only project owner can delete this project")
+def reconcile_task_stats(db: Session, *, project_id: int | None = None, dry_run: bool = False) -> list[tuple]:
+    """Recount project_task_stats from the tasks table and repair any drift.
 
+    Returns one (project_id, status, stored, actual) tuple per row that was
+    wrong. Task writes are blocked on PostgreSQL while the recount runs so the
+    triggers cannot race it.
+    """
     try:
-        db.delete(project)
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(text("LOCK TABLE tasks IN SHARE MODE"))
+
+        actual_stmt = select(Task.project_id, Task.status, func.count()).group_by(Task.project_id, Task.status)
+        stored_stmt = select(ProjectTaskStats.project_id, ProjectTaskStats.status, ProjectTaskStats.task_count)
+        if project_id is not None:
+            actual_stmt = actual_stmt.where(Task.project_id == project_id)
+            stored_stmt = stored_stmt.where(ProjectTaskStats.project_id == project_id)
+        actual = {(row[0], row[1]): row[2] for row in db.execute(actual_stmt)}
+        stored = {(row[0], row[1]): row[2] for row in db.execute(stored_stmt)}
+
+        drift = [
+            (key[0], key[1], stored.get(key), actual.get(key, 0))
+            for key in sorted(actual.keys() | stored.keys())
+            if stored.get(key) != actual.get(key, 0)
+        ]
+        if dry_run:
+            db.rollback()
+            return drift
+
+        for row_project_id, status, stored_count, actual_count in drift:
+            if stored_count is None:
+                db.execute(
+                    insert(ProjectTaskStats).values(project_id=row_project_id, status=status, task_count=actual_count)
+                )
+            else:
+                db.execute(
+                    update(ProjectTaskStats)
+                    .where(ProjectTaskStats.project_id == row_project_id, ProjectTaskStats.status == status)
+                    .values(task_count=actual_count)
+                    .execution_options(synchronize_session=False)
+                )
         db.commit()
     except SQLAlchemyError:
         db.rollback()
         raise
+    return drift
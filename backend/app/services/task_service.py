@@ -1,24 +1,46 @@
 from __future__ import annotations
 
-from sqlalchemy import func, select
+import re
+from collections.abc import Iterator
+
+from sqlalchemy import Float, case, cast, delete, exists, func, insert, literal_column, or_, select, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from app.core.exceptions import ForbiddenException, NotFoundException
+from app.core.events import record_event
+from app.core.exceptions import (
+    AppException,
+    BadRequestException,
+    ConflictException,
+    ForbiddenException,
+    NotFoundException,
+)
+from app.core.pagination import Page, PageParams, paginate
+from app.core.responses import dump_json
 from app.models.project import Project
 from app.models.task import Task
+from app.models.task_search import TASK_SEARCH_CONFIG, task_search_vector, tasks_fts
 from app.models.team import team_members
 from app.models.user import User
+from app.repositories.loader import get_loader
+from app.repositories.statements import PROJECT_CONTENT_VERSION, TEAM_MEMBER_USERS
 from app.schemas.task import (
     MyTasksSummaryResponse,
     TaskAssign,
+    TaskBulkRequest,
+    TaskBulkResponse,
+    TaskBulkResult,
     TaskCreate,
     TaskResponse,
     TaskStatus,
     TaskStatusUpdate,
     TaskUpdate,
 )
-from app.services.project_service import get_project_or_404
-from app.services.team_service import ensure_user_in_team, require_team_member
+from app.services.project_service import get_project_access
+from app.services.team_service import bump_content_version, ensure_user_in_team, get_teams_content_version
+
+# Rows fetched from the server-side cursor per streamed chunk.
+STREAM_BATCH_SIZE = 200
 
 
 def _serialize_task(
@@ -47,79 +69,217 @@ def _serialize_task(
     )
 
 
-def _get_task_or_404(db: Session, task_id: int) -> Task:
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
-        raise NotFoundException("Task not found")
-    return task
+def _serialize_task_row(row, current_user_id: int) -> TaskResponse:
+    return TaskResponse(
+        id=row.id,
+        project_id=row.project_id,
+        project_name=row.project_name,
+        title=row.title,
+        description=row.description,
+        status=TaskStatus(row.status),
+        due_date=row.due_date,
+        assigned_user_id=row.assigned_user_id,
+        assigned_username=row.assigned_username,
+        assigned_first_name=row.assigned_first_name,
+        assigned_last_name=row.assigned_last_name,
+        created_by=row.created_by,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        can_update=row.assigned_user_id == current_user_id,
+    )
+
+
+def _assignee_column(column):
+    return select(column).where(User.id == Task.assigned_user_id).scalar_subquery()
+
+
+_project_team_id = select(Project.team_id).where(Project.id == Task.project_id).scalar_subquery()
+
+# Everything a TaskResponse needs (plus the team, for bump_content_version), usable both in SELECT and in UPDATE ... RETURNING
+# so a mutation and its response cost a single statement.
+_TASK_RESPONSE_COLUMNS = (
+    Task.id,
+    Task.project_id,
+    select(Project.name).where(Project.id == Task.project_id).scalar_subquery().label("project_name"),
+    _project_team_id.label("team_id"),
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.due_date,
+    Task.assigned_user_id,
+    _assignee_column(User.username).label("assigned_username"),
+    _assignee_column(User.first_name).label("assigned_first_name"),
+    _assignee_column(User.last_name).label("assigned_last_name"),
+    Task.created_by,
+    Task.created_at,
+    Task.updated_at,
+)
+
+
+# Fields carried by each change event on GET /projects/{project_id}/events;
+# clients patch their copy of the task with them. task.created carries the
+# whole task, task.deleted only its ids.
+_TASK_EVENT_FIELDS = {
+    "task.updated": {"id", "project_id", "title", "description", "due_date", "updated_at"},
+    "task.status": {"id", "project_id", "status", "updated_at"},
+    "task.assigned": {
+        "id",
+        "project_id",
+        "assigned_user_id",
+        "assigned_username",
+        "assigned_first_name",
+        "assigned_last_name",
+        "updated_at",
+    },
+}
+
 
+def _record_task_event(db: Session, event_type: str, task: TaskResponse) -> None:
+    """Queue `task`'s change for the project's subscribers; call before the commit."""
+    fields = _TASK_EVENT_FIELDS.get(event_type)
+    data = task.model_dump(include=fields) if fields else task.model_dump(exclude={"can_update"})
+    record_event(db, task.project_id, event_type, data)
 
-def _get_assigned_user(db: Session, assigned_user_id: int | None) -> User | None:
-    if assigned_user_id is None:
-        return None
-    return db.query(User).filter(User.id == assigned_user_id).first()
 
+def _record_task_deleted(db: Session, task_id: int, project_id: int) -> None:
+    record_event(db, project_id, "task.deleted", {"id": task_id, "project_id": project_id})
 
-def _can_manage_task_assignment(db: Session, task: Task, current_user_id: int) -> bool:
-    project = get_project_or_404(db, task.project_id)
-    membership = require_team_member(db, project.team_id, current_user_id)
 
+def _get_task_access(db: Session, task_id: int, current_user_id: int):
+    """Load the task's ownership fields and the caller's team role in one query."""
+    row = get_loader(db).task_access(task_id, current_user_id)
+    if not row:
+        raise NotFoundException("Task not found")
+    return row
+
+
+def _require_task_member(access) -> None:
+    if access.role is None:
+        raise ForbiddenException("Only team members can access this team")
+
+
+def _can_manage_task(access, current_user_id: int) -> bool:
     return bool(
-        project.created_by == current_user_id
-        or membership.role == "owner"
-        or task.created_by == current_user_id
+        access.project_created_by == current_user_id
+        or access.role == "owner"
+        or access.created_by == current_user_id
+    )
+
+
+def _update_assigned_task(
+    db: Session,
+    task_id: int,
+    current_user_id: int,
+    values: dict,
+    denied_message: str,
+    event_type: str,
+) -> TaskResponse:
+    """Apply `values` only if the caller is the assignee, returning the updated task."""
+    stmt = (
+        update(Task)
+        .where(Task.id == task_id, Task.assigned_user_id == current_user_id)
+        .values(**values)
+        .returning(*_TASK_RESPONSE_COLUMNS)
+        .execution_options(synchronize_session=False)
     )
+    if not values:
+        stmt = select(*_TASK_RESPONSE_COLUMNS).where(Task.id == task_id, Task.assigned_user_id == current_user_id)
+
+    try:
+        row = db.execute(stmt).first()
+        if row is None:
+            db.rollback()
+            _get_task_access(db, task_id, current_user_id)
+            raise ForbiddenException(denied_message)
+        task = _serialize_task_row(row, current_user_id)
+        if values:
+            _record_task_event(db, event_type, task)
+            bump_content_version(db, [row.team_id])
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        raise
+    return task
 
 
 def create_task(db: Session, payload: TaskCreate, current_user_id: int) -> TaskResponse:
-    project = get_project_or_404(db, payload.project_id)
-    require_team_member(db, project.team_id, current_user_id)
+    project = get_project_access(db, payload.project_id, current_user_id)
 
+    assignee = None
     if payload.assigned_user_id is not None:
-        ensure_user_in_team(db, project.team_id, payload.assigned_user_id)
-
-    task = Task(
-        project_id=project.id,
-        title=payload.title.strip(),
-        description=payload.description.strip() if payload.description else None,
-        status=TaskStatus.TODO.value,
-        assigned_user_id=payload.assigned_user_id,
-        due_date=payload.due_date,
-        created_by=current_user_id,
-    )
-    db.add(task)
-    db.commit()
-    db.refresh(task)
-
-    assigned_user = _get_assigned_user(db, task.assigned_user_id)
-    return _serialize_task(
-        task,
-        project_name=project.name,
-        assigned_user=assigned_user,
-        current_user_id=current_user_id,
-    )
+        assignee = ensure_user_in_team(db, project.team_id, payload.assigned_user_id)
+
+    try:
+        task = db.execute(
+            insert(Task)
+            .values(
+                project_id=project.id,
+                title=payload.title.strip(),
+                description=payload.description.strip() if payload.description else None,
+                status=TaskStatus.TODO.value,
+                assigned_user_id=payload.assigned_user_id,
+                due_date=payload.due_date,
+                created_by=current_user_id,
+            )
+            .returning(Task)
+        ).scalar_one()
+        # Serialize before commit expires the instance, so no refresh is needed.
+        response = _serialize_task(
+            task,
+            project_name=project.name,
+            assigned_user=assignee,
+            current_user_id=current_user_id,
+        )
+        _record_task_event(db, "task.created", response)
+        bump_content_version(db, [project.team_id])
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        raise
+
+    return response
+
+
+# Column projection of the list query, labelled like TaskResponse so rows map
+# straight to response dicts without ORM hydration.
+_TASK_LIST_COLUMNS = (
+    Task.id,
+    Task.project_id,
+    Project.name.label("project_name"),
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.due_date,
+    Task.assigned_user_id,
+    User.username.label("assigned_username"),
+    User.first_name.label("assigned_first_name"),
+    User.last_name.label("assigned_last_name"),
+    Task.created_by,
+    Task.created_at,
+    Task.updated_at,
+)
 
 
-def list_tasks(
-    db: Session,
-    *,
+def _task_row_dict(row, current_user_id: int) -> dict:
+    """A `_TASK_LIST_COLUMNS` row as a TaskResponse-shaped dict, ready to encode."""
+    item = row._asdict()
+    item["can_update"] = row.assigned_user_id == current_user_id
+    return item
+
+
+def _task_list_query(
     current_user_id: int,
     project_id: int | None,
     status: TaskStatus | None,
     assigned_user_id: int | None,
-) -> list[TaskResponse]:
-    if project_id is not None:
-        project = get_project_or_404(db, project_id)
-        require_team_member(db, project.team_id, current_user_id)
-
+):
     stmt = (
-        select(Task, Project.name, User)
+        select(*_TASK_LIST_COLUMNS)
         .select_from(Task)
         .join(Project, Task.project_id == Project.id)
         .join(team_members, team_members.c.team_id == Project.team_id)
         .outerjoin(User, Task.assigned_user_id == User.id)
         .where(team_members.c.user_id == current_user_id)
-        .order_by(Task.created_at.desc(), Task.id.desc())
     )
 
     if project_id is not None:
@@ -131,44 +291,163 @@ def list_tasks(
     if assigned_user_id is not None:
         stmt = stmt.where(Task.assigned_user_id == assigned_user_id)
 
-    rows = db.execute(stmt).all()
-    return [
-        _serialize_task(
-            row[0],
-            project_name=row[1],
-            assigned_user=row[2],
-            current_user_id=current_user_id,
-        )
-        for row in rows
-    ]
+    return stmt
 
 
-def update_task(db: Session, *, task_id: int, payload: TaskUpdate, current_user_id: int) -> TaskResponse:
-    task = _get_task_or_404(db, task_id)
+def get_task_content_version(db: Session, current_user_id: int, project_id: int | None = None) -> tuple:
+    """A change marker for the caller's task lists and summary, in one indexed query.
 
-    if task.assigned_user_id != current_user_id:
-        raise ForbiddenException("Only assigned user can update this task")
+    Scoped to one project's team when `project_id` is given, raising like
+    `get_project_access`; otherwise it covers all of the caller's teams.
+    """
+    if project_id is None:
+        return get_teams_content_version(db, current_user_id)
 
+    row = db.execute(PROJECT_CONTENT_VERSION, {"project_id": project_id, "user_id": current_user_id}).first()
+    if not row:
+        raise NotFoundException("Project not found")
+    # The row also answers the project access check the list itself makes.
+    get_loader(db).prime("project_access", (project_id, current_user_id), row)
+    if row.role is None:
+        raise ForbiddenException("Only team members can access this team")
+    return (row.content_version,)
+
+
+def list_tasks(
+    db: Session,
+    *,
+    current_user_id: int,
+    project_id: int | None,
+    status: TaskStatus | None,
+    assigned_user_id: int | None,
+    page: PageParams = PageParams(),
+) -> Page:
+    """One page of the caller's tasks as TaskResponse-shaped dicts (see `page_response`)."""
+    if project_id is not None:
+        get_project_access(db, project_id, current_user_id)
+
+    result = paginate(
+        db,
+        _task_list_query(current_user_id, project_id, status, assigned_user_id),
+        sort_column=Task.created_at,
+        id_column=Task.id,
+        page=page,
+        row_key=lambda row: (row.created_at, row.id),
+    )
+    return result._replace(items=[_task_row_dict(row, current_user_id) for row in result.items])
+
+
+def stream_tasks(
+    db: Session,
+    *,
+    current_user_id: int,
+    project_id: int | None,
+    status: TaskStatus | None,
+    assigned_user_id: int | None,
+) -> Iterator[bytes]:
+    """Return an iterator over every matching task as NDJSON, newest first.
+
+    Takes ownership of `db`, a standalone session (`open_read_session`), since a
+    streamed body outlives the request's session dependency. Access is checked
+    before returning so errors still become a normal error response; rows then
+    come from a server-side cursor one batch per chunk, keeping memory flat.
+    """
+    try:
+        if project_id is not None:
+            get_project_access(db, project_id, current_user_id)
+    except BaseException:
+        db.close()
+        raise
+
+    stmt = (
+        _task_list_query(current_user_id, project_id, status, assigned_user_id)
+        .order_by(Task.created_at.desc(), Task.id.desc())
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
+    )
+    return _task_chunks(db, stmt, current_user_id)
+
+
+def _task_chunks(db: Session, stmt, current_user_id: int) -> Iterator[bytes]:
+    try:
+        for rows in db.execute(stmt).partitions():
+            yield b"".join(dump_json(_task_row_dict(row, current_user_id)) + b"\n" for row in rows)
+    finally:
+        db.close()
+
+
+def _search_terms(db: Session, query: str):
+    """The match condition and relevance expression of `query` for this dialect.
+
+    Returns None when the query has nothing to search for.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        terms = re.findall(r"\w+", query)
+        if not terms:
+            return None
+        # Quoted terms, implicitly ANDed, so input is never parsed as FTS5 syntax.
+        match = " ".join(f'"{term}"' for term in terms)
+        fts = literal_column("tasks_fts")
+        # bm25 is lower for better matches; title hits count twice.
+        return fts.op("MATCH")(match), -func.bm25(fts, 2.0, 1.0)
+
+    tsquery = func.websearch_to_tsquery(TASK_SEARCH_CONFIG, query)
+    # ts_rank is a float4; widened to float8 its cursor value round-trips exactly.
+    rank = cast(func.ts_rank(task_search_vector, tsquery), Float(precision=53))
+    return task_search_vector.op("@@")(tsquery), rank
+
+
+def search_tasks(db: Session, *, current_user_id: int, query: str, page: PageParams = PageParams()) -> Page:
+    """One page of the caller's tasks matching `query`, most relevant first.
+
+    Titles and descriptions are matched through the full-text index (see
+    app.models.task_search), limited to the caller's teams, and keyset-paginated
+    on (rank, id). Items are TaskResponse-shaped dicts like `list_tasks`.
+    """
+    search = _search_terms(db, query)
+    if search is None:
+        return Page(items=[], next_cursor=None, limit=page.limit)
+    condition, rank = search
+
+    stmt = select(*_TASK_LIST_COLUMNS, rank.label("rank")).select_from(Task)
+    if db.get_bind().dialect.name == "sqlite":
+        stmt = stmt.join(tasks_fts, tasks_fts.c.rowid == Task.id)
+    stmt = (
+        stmt.join(Project, Task.project_id == Project.id)
+        .join(team_members, team_members.c.team_id == Project.team_id)
+        .outerjoin(User, Task.assigned_user_id == User.id)
+        .where(team_members.c.user_id == current_user_id, condition)
+    )
+
+    result = paginate(
+        db,
+        stmt,
+        sort_column=rank,
+        id_column=Task.id,
+        page=page,
+        row_key=lambda row: (row.rank, row.id),
+        sort_type=float,
+    )
+    items = []
+    for row in result.items:
+        item = _task_row_dict(row, current_user_id)
+        del item["rank"]
+        items.append(item)
+    return result._replace(items=items)
+
+
+def update_task(db: Session, *, task_id: int, payload: TaskUpdate, current_user_id: int) -> TaskResponse:
+    values: dict[str, object] = {}
     if payload.title is not None:
-        task.title = payload.title.strip()
+        values["title"] = payload.title.strip()
 
     if payload.description is not None:
-        description = payload.description.strip()
-        task.description = description or None
+        values["description"] = payload.description.strip() or None
 
     if payload.due_date is not None:
-        task.due_date = payload.due_date
-
-    db.commit()
-    db.refresh(task)
-
-    project = get_project_or_404(db, task.project_id)
-    assigned_user = _get_assigned_user(db, task.assigned_user_id)
-    return _serialize_task(
-        task,
-        project_name=project.name,
-        assigned_user=assigned_user,
-        current_user_id=current_user_id,
+        values["due_date"] = payload.due_date
+
+    return _update_assigned_task(
+        db, task_id, current_user_id, values, "Only assigned user can update this task", "task.updated"
     )
 
 
@@ -179,100 +458,356 @@ def update_task_status(
     payload: TaskStatusUpdate,
     current_user_id: int,
 ) -> TaskResponse:
-    task = _get_task_or_404(db, task_id)
-
-    if task.assigned_user_id != current_user_id:
-        raise ForbiddenException("Only assigned user can update task status")
-
-    task.status = payload.status.value
-    db.commit()
-    db.refresh(task)
-
-    project = get_project_or_404(db, task.project_id)
-    assigned_user = _get_assigned_user(db, task.assigned_user_id)
-    return _serialize_task(
-        task,
-        project_name=project.name,
-        assigned_user=assigned_user,
-        current_user_id=current_user_id,
+    return _update_assigned_task(
+        db,
+        task_id,
+        current_user_id,
+        {"status": payload.status.value},
+        "Only assigned user can update task status",
+        "task.status",
     )
 
 
 def assign_task(db: Session, *, task_id: int, payload: TaskAssign, current_user_id: int) -> TaskResponse:
-    task = _get_task_or_404(db, task_id)
-    project = get_project_or_404(db, task.project_id)
+    access = _get_task_access(db, task_id, current_user_id)
+    _require_task_member(access)
 
-    if not _can_manage_task_assignment(db, task, current_user_id):
+    if not _can_manage_task(access, current_user_id):
         raise ForbiddenException("Only team owner or project owner can assign task")
 
     if payload.assigned_user_id is not None:
-        ensure_user_in_team(db, project.team_id, payload.assigned_user_id)
-
-    task.assigned_user_id = payload.assigned_user_id
-    db.commit()
-    db.refresh(task)
-
-    assigned_user = _get_assigned_user(db, task.assigned_user_id)
-    return _serialize_task(
-        task,
-        project_name=project.name,
-        assigned_user=assigned_user,
-        current_user_id=current_user_id,
-    )
+        ensure_user_in_team(db, access.team_id, payload.assigned_user_id)
+
+    try:
+        row = db.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(assigned_user_id=payload.assigned_user_id)
+            .returning(*_TASK_RESPONSE_COLUMNS)
+            .execution_options(synchronize_session=False)
+        ).first()
+        if row is None:
+            db.rollback()
+            raise NotFoundException("Task not found")
+        task = _serialize_task_row(row, current_user_id)
+        _record_task_event(db, "task.assigned", task)
+        bump_content_version(db, [row.team_id])
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        raise
+
+    return task
 
 
 def delete_task(db: Session, *, task_id: int, current_user_id: int) -> None:
-    task = _get_task_or_404(db, task_id)
-    project = get_project_or_404(db, task.project_id)
-    membership = require_team_member(db, project.team_id, current_user_id)
-
-    can_delete = (
-        task.created_by == current_user_id
-        or project.created_by == current_user_id
-        or membership.role == "owner"
+    caller_is_team_owner = exists().where(
+        (team_members.c.team_id == Project.team_id)
+        & (team_members.c.user_id == current_user_id)
+        & (team_members.c.role == "owner")
+    )
+    caller_is_member = exists().where(
+        (team_members.c.team_id == Project.team_id) & (team_members.c.user_id == current_user_id)
+    )
+    allowed = (
+        select(Project.id)
+        .where(
+            Project.id == Task.project_id,
+            caller_is_member,
+            or_(
+                Task.created_by == current_user_id,
+                Project.created_by == current_user_id,
+                caller_is_team_owner,
+            ),
+        )
+        .exists()
     )
-    if not can_delete:
+
+    try:
+        deleted = db.execute(
+            delete(Task)
+            .where(Task.id == task_id, allowed)
+            .returning(Task.id, Task.project_id, _project_team_id.label("team_id"))
+            .execution_options(synchronize_session=False)
+        ).first()
+        if deleted is None:
+            db.rollback()
+            _require_task_member(_get_task_access(db, task_id, current_user_id))
+            raise ForbiddenException("You do not have permission to delete this task")
+        _record_task_deleted(db, deleted.id, deleted.project_id)
+        bump_content_version(db, [deleted.team_id])
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        raise
+
+
+def _check_bulk_operation(operation, *, tasks: dict, projects: dict, users: set, members: set, current_user_id: int):
+    """Apply the single-task permission rules to one bulk item, raising like the single endpoints."""
+
+    def require_assignee(team_id: int, user_id: int) -> None:
+        if user_id not in users:
+            raise NotFoundException("Assignee user not found")
+        if (team_id, user_id) not in members:
+            raise BadRequestException("User is not a member of this team")
+
+    if operation.op == "create":
+        project = projects.get(operation.project_id)
+        if project is None:
+            raise NotFoundException("Project not found")
+        if project.role is None:
+            raise ForbiddenException("Only team members can access this team")
+        if operation.assigned_user_id is not None:
+            require_assignee(project.team_id, operation.assigned_user_id)
+        return
+
+    access = tasks.get(operation.task_id)
+    if access is None:
+        raise NotFoundException("Task not found")
+    if operation.op == "status":
+        if access.assigned_user_id != current_user_id:
+            raise ForbiddenException("Only assigned user can update task status")
+        return
+
+    _require_task_member(access)
+    if operation.op == "assign":
+        if not _can_manage_task(access, current_user_id):
+            raise ForbiddenException("Only team owner or project owner can assign task")
+        if operation.assigned_user_id is not None:
+            require_assignee(access.team_id, operation.assigned_user_id)
+    elif not _can_manage_task(access, current_user_id):
         raise ForbiddenException("You do not have permission to delete this task")
 
-    db.delete(task)
-    db.commit()
 
+_BULK_EVENT_TYPES = {"create": "task.created", "status": "task.status", "assign": "task.assigned"}
 
-def get_my_tasks_summary(db: Session, current_user_id: int) -> MyTasksSummaryResponse:
-    rows = db.execute(
-        select(Task, Project.name, User)
-        .select_from(Task)
-        .join(Project, Task.project_id == Project.id)
-        .outerjoin(User, Task.assigned_user_id == User.id)
-        .where(Task.assigned_user_id == current_user_id)
-        .order_by(Task.due_date.asc().nulls_last(), Task.created_at.desc())
-    ).all()
-
-    tasks = [
-        _serialize_task(
-            row[0],
-            project_name=row[1],
-            assigned_user=row[2],
-            current_user_id=current_user_id,
-        )
-        for row in rows
-    ]
 
-    status_counts = {
-        TaskStatus.TODO: 0,
-        TaskStatus.IN_PROGRESS: 0,
-        TaskStatus.DONE: 0,
+def bulk_task_operations(db: Session, payload: TaskBulkRequest, current_user_id: int) -> TaskBulkResponse:
+    """Validate and apply a batch of create/status/assign/delete operations.
+
+    Task access, project access and assignee memberships for the whole batch are
+    loaded with one query each, and each operation type is applied with a single
+    statement, so the cost does not grow with the number of round trips. Valid
+    operations commit together; invalid ones are reported in their result, or
+    fail the whole request when `atomic` is set. With `atomic`, an operation
+    that no longer applies (its task changed after validation) also rolls the
+    batch back and fails it with 409.
+    """
+    operations = payload.operations
+    task_ids = {operation.task_id for operation in operations if operation.op != "create"}
+    project_ids = {operation.project_id for operation in operations if operation.op == "create"}
+
+    loader = get_loader(db)
+    tasks = loader.task_accesses(task_ids, current_user_id)
+    projects = loader.project_accesses(project_ids, current_user_id)
+
+    assignee_ids = {
+        operation.assigned_user_id
+        for operation in operations
+        if operation.op in ("create", "assign") and operation.assigned_user_id is not None
     }
+    team_ids = {row.team_id for row in (*tasks.values(), *projects.values())}
+    users: set[int] = set()
+    members: set[tuple[int, int]] = set()
+    if assignee_ids and team_ids:
+        for user_id, team_id in db.execute(
+            TEAM_MEMBER_USERS, {"user_ids": list(assignee_ids), "team_ids": list(team_ids)}
+        ):
+            users.add(user_id)
+            if team_id is not None:
+                members.add((team_id, user_id))
+
+    results: list[TaskBulkResult | None] = [None] * len(operations)
+    valid = []
+    seen_task_ids: set[int] = set()
+    for index, operation in enumerate(operations):
+        task_id = getattr(operation, "task_id", None)
+        try:
+            if task_id is not None:
+                if task_id in seen_task_ids:
+                    raise BadRequestException("Task appears more than once in this batch")
+                seen_task_ids.add(task_id)
+            _check_bulk_operation(
+                operation,
+                tasks=tasks,
+                projects=projects,
+                users=users,
+                members=members,
+                current_user_id=current_user_id,
+            )
+        except AppException as exc:
+            results[index] = TaskBulkResult(
+                index=index, op=operation.op, status_code=exc.status_code, task_id=task_id, error=exc.message
+            )
+        else:
+            valid.append((index, operation))
+
+    failed = [result for result in results if result is not None]
+    if payload.atomic and failed:
+        raise BadRequestException(
+            "No operations were applied because some failed validation",
+            errors=[{"field": f"operations.{result.index}", "message": result.error} for result in failed],
+        )
+
+    by_op: dict[str, list] = {"create": [], "status": [], "assign": [], "delete": []}
+    for index, operation in valid:
+        by_op[operation.op].append((index, operation))
+
+    def conflict(index: int, operation) -> None:
+        exc = ConflictException("Task changed while the batch was applied")
+        results[index] = TaskBulkResult(
+            index=index, op=operation.op, status_code=exc.status_code, task_id=operation.task_id, error=exc.message
+        )
+
+    try:
+        result_task_ids: dict[int, int] = {}
+        if by_op["create"]:
+            created = db.execute(
+                insert(Task).returning(Task.id, sort_by_parameter_order=True),
+                [
+                    {
+                        "project_id": operation.project_id,
+                        "title": operation.title.strip(),
+                        "description": operation.description.strip() if operation.description else None,
+                        "status": TaskStatus.TODO.value,
+                        "assigned_user_id": operation.assigned_user_id,
+                        "due_date": operation.due_date,
+                        "created_by": current_user_id,
+                    }
+                    for _index, operation in by_op["create"]
+                ],
+            ).scalars().all()
+            for (index, _operation), task_id in zip(by_op["create"], created):
+                result_task_ids[index] = task_id
+
+        if by_op["status"]:
+            new_status = {operation.task_id: operation.status.value for _index, operation in by_op["status"]}
+            updated = set(
+                db.execute(
+                    update(Task)
+                    .where(Task.id.in_(new_status), Task.assigned_user_id == current_user_id)
+                    .values(status=case(new_status, value=Task.id))
+                    .returning(Task.id)
+                    .execution_options(synchronize_session=False)
+                ).scalars()
+            )
+            for index, operation in by_op["status"]:
+                if operation.task_id in updated:
+                    result_task_ids[index] = operation.task_id
+                else:
+                    conflict(index, operation)
+
+        if by_op["assign"]:
+            new_assignee = {operation.task_id: operation.assigned_user_id for _index, operation in by_op["assign"]}
+            updated = set(
+                db.execute(
+                    update(Task)
+                    .where(Task.id.in_(new_assignee))
+                    # The cast keeps PostgreSQL from typing an all-NULL CASE as text.
+                    .values(assigned_user_id=cast(case(new_assignee, value=Task.id), Task.assigned_user_id.type))
+                    .returning(Task.id)
+                    .execution_options(synchronize_session=False)
+                ).scalars()
+            )
+            for index, operation in by_op["assign"]:
+                if operation.task_id in updated:
+                    result_task_ids[index] = operation.task_id
+                else:
+                    conflict(index, operation)
+
+        deleted: dict[int, int] = {}
+        if by_op["delete"]:
+            deleted = dict(
+                db.execute(
+                    delete(Task)
+                    .where(Task.id.in_([operation.task_id for _index, operation in by_op["delete"]]))
+                    .returning(Task.id, Task.project_id)
+                    .execution_options(synchronize_session=False)
+                ).all()
+            )
+            for index, operation in by_op["delete"]:
+                if operation.task_id not in deleted:
+                    conflict(index, operation)
+
+        conflicts = [result for result in results if result is not None]
+        if payload.atomic and conflicts:
+            db.rollback()
+            raise ConflictException(
+                "No operations were applied because some tasks changed while the batch was applied",
+                errors=[{"field": f"operations.{result.index}", "message": result.error} for result in conflicts],
+            )
+
+        responses = {}
+        if result_task_ids:
+            rows = db.execute(
+                select(*_TASK_RESPONSE_COLUMNS).where(Task.id.in_(set(result_task_ids.values())))
+            ).all()
+            responses = {row.id: _serialize_task_row(row, current_user_id) for row in rows}
+        for index, operation in valid:
+            if index in result_task_ids:
+                _record_task_event(db, _BULK_EVENT_TYPES[operation.op], responses[result_task_ids[index]])
+        for task_id, project_id in deleted.items():
+            _record_task_deleted(db, task_id, project_id)
+        bump_content_version(
+            db,
+            {
+                projects[operation.project_id].team_id if operation.op == "create" else tasks[operation.task_id].team_id
+                for _index, operation in valid
+            },
+        )
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        raise
+
+    for index, operation in valid:
+        if results[index] is not None:
+            continue
+        task_id = result_task_ids.get(index, getattr(operation, "task_id", None))
+        results[index] = TaskBulkResult(
+            index=index,
+            op=operation.op,
+            status_code=201 if operation.op == "create" else 200,
+            task_id=task_id,
+            task=responses.get(task_id),
+        )
+
+    failed_count = sum(1 for result in results if result.error is not None)
+    return TaskBulkResponse(results=results, applied=len(results) - failed_count, failed=failed_count)
 
-    for task in tasks:
-        status_counts[task.status] = status_counts[task.status] + 1
 
-    total_projects = db.execute(
-        select(func.count(func.distinct(Task.project_id))).where(Task.assigned_user_id == current_user_id)
-    ).scalar_one()
+def get_my_tasks_summary(
+    db: Session,
+    current_user_id: int,
+    *,
+    include_tasks: bool = True,
+    task_limit: int | None = None,
+) -> MyTasksSummaryResponse:
+    """Counts for the caller's assigned tasks, plus the tasks themselves unless disabled.
+
+    The per-status counts and the distinct project total come from a single
+    aggregate, so `include_tasks=False` costs one query regardless of task count.
+    """
+    counts = db.execute(
+        select(
+            *(func.count().filter(Task.status == status.value) for status in TaskStatus),
+            func.count(func.distinct(Task.project_id)),
+        ).where(Task.assigned_user_id == current_user_id)
+    ).one()
+    *per_status, total_projects = counts
+
+    tasks: list[TaskResponse] = []
+    if include_tasks:
+        rows = db.execute(
+            select(*_TASK_RESPONSE_COLUMNS)
+            .where(Task.assigned_user_id == current_user_id)
+            .order_by(Task.due_date.asc().nulls_last(), Task.created_at.desc())
+            .limit(task_limit)
+        ).all()
+        tasks = [_serialize_task_row(row, current_user_id) for row in rows]
 
     return MyTasksSummaryResponse(
         tasks=tasks,
-        status_counts=status_counts,
+        status_counts=dict(zip(TaskStatus, per_status)),
         total_projects=total_projects,
     )
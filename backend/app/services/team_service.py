@@ -1,12 +1,22 @@
 from __future__ import annotations
 
-from sqlalchemy import or_, select
-from sqlalchemy.exc import SQLAlchemyError
+from collections.abc import Iterable
+
+from sqlalchemy import event, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import is_unique_violation
 from app.core.exceptions import BadRequestException, ForbiddenException, NotFoundException
+from app.core.metrics import register_metrics_source
+from app.core.pagination import Page, PageParams, paginate
+from app.core.security import TeamMembership, get_claimed_membership, invalidate_principal
 from app.models.team import Team, team_members
 from app.models.user import User
+from app.repositories.loader import get_loader
+from app.repositories.statements import USER_CONTENT_VERSION
 from app.schemas.team import (
     TeamCreate,
     TeamMemberCreate,
@@ -18,26 +28,102 @@ from app.schemas.team import (
 )
 
 
-def _get_team_or_404(db: Session, team_id: int) -> Team:
-    team = db.query(Team).filter(Team.id == team_id).first()
-    if not team:
-        raise NotFoundException("Team not found")
-    return team
+_MEMBER_USER_COLUMNS = (User.id, User.username, User.email, User.first_name, User.last_name)
+
+# (team_id, user_id) -> role, for callers whose token carries no usable
+# membership claims. Only existing memberships are cached: a "not a member"
+# answer read from a lagging replica must not lock out a user just added.
+# Other workers see membership changes after at most the TTL.
+membership_cache = TTLCache(
+    maxsize=settings.MEMBERSHIP_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.MEMBERSHIP_CACHE_TTL_SECONDS,
+)
+register_metrics_source("membership_cache", membership_cache.stats)
+
+
+def get_team_roles(db: Session, user_id: int) -> dict[int, str]:
+    rows = db.execute(
+        select(team_members.c.team_id, team_members.c.role).where(team_members.c.user_id == user_id)
+    ).all()
+    return {row.team_id: row.role for row in rows}
+
+
+def bump_membership_version(db: Session, user_id: int) -> None:
+    """Invalidate membership claims in the user's outstanding tokens.
+
+    Must be called in the same transaction as any membership insert, removal
+    or role change for `user_id`, together with `invalidate_memberships`.
+    """
+    db.execute(
+        update(User)
+        .where(User.id == user_id)
+        # Keep updated_at: only membership changed, not the profile.
+        .values(membership_version=User.membership_version + 1, updated_at=User.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def invalidate_memberships(db: Session, team_id: int, user_ids: Iterable[int]) -> None:
+    """Drop cached roles of these users in the team, now and again when `db` commits.
+
+    Must be called in the transaction of any membership insert, removal or
+    role change; the second drop keeps a concurrent lookup between the write
+    and the commit from re-caching the old role.
+    """
+    stale = db.info.setdefault("stale_memberships", set())
+    for user_id in user_ids:
+        membership_cache.invalidate((team_id, user_id))
+        stale.add((team_id, user_id))
+
+
+@event.listens_for(Session, "after_commit")
+def _flush_stale_memberships(session: Session) -> None:
+    for key in session.info.pop("stale_memberships", ()):
+        membership_cache.invalidate(key)
+
 
+def bump_content_version(db: Session, team_ids: Iterable[int]) -> None:
+    """Mark the teams' projects or tasks as changed in this transaction.
 
-def _get_membership(db: Session, team_id: int, user_id: int):
-    return db.execute(
-        select(team_members).where(
-            (team_members.c.team_id == team_id) & (team_members.c.user_id == user_id)
+    Must be called in the transaction of any project or task write. Each team's
+    `content_version` is bumped once, just before `db` commits, so concurrent
+    writers to a team only queue on its row for the commit itself.
+    """
+    db.info.setdefault("changed_teams", set()).update(team_ids)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_changed_teams(session: Session) -> None:
+    # Ascending id order, so transactions touching several teams cannot deadlock.
+    for team_id in sorted(session.info.pop("changed_teams", ())):
+        session.execute(
+            update(Team)
+            .where(Team.id == team_id)
+            .values(content_version=Team.content_version + 1, updated_at=Team.updated_at)
+            .execution_options(synchronize_session=False)
         )
-    ).first()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_changed_teams(session: Session, previous_transaction) -> None:
+    session.info.pop("changed_teams", None)
 
 
 def require_team_member(db: Session, team_id: int, user_id: int):
-    _get_team_or_404(db, team_id)
-    membership = _get_membership(db, team_id, user_id)
+    claimed = get_claimed_membership(db, team_id, user_id)
+    if claimed is not None:
+        return claimed
+
+    role = membership_cache.get((team_id, user_id))
+    if role is not None:
+        return TeamMembership(team_id=team_id, user_id=user_id, role=role)
+
+    membership = get_loader(db).team_membership(team_id, user_id)
     if not membership:
+        raise NotFoundException("Team not found")
+    if membership.role is None:
         raise ForbiddenException("Only team members can access this team")
+    membership_cache.set((team_id, user_id), membership.role)
     return membership
 
 
@@ -48,96 +134,110 @@ def require_team_owner(db: Session, team_id: int, user_id: int):
     return membership
 
 
-def _insert_membership(db: Session, team_id: int, user_id: int, role: TeamRole):
+def _insert_membership(db: Session, team_id: int, user, role: TeamRole) -> TeamMemberResponse:
     try:
-        db.execute(
-            team_members.insert().values(
-                team_id=team_id,
-                user_id=user_id,
-                role=role.value,
-            )
-        )
+        row = db.execute(
+            insert(team_members)
+            .values(team_id=team_id, user_id=user.id, role=role.value)
+            .returning(team_members.c.id, team_members.c.joined_at)
+        ).one()
+        bump_membership_version(db, user.id)
+        invalidate_memberships(db, team_id, (user.id,))
         db.commit()
+    except IntegrityError as exc:
+        db.rollback()
+        if is_unique_violation(exc):
+            raise BadRequestException("User is already a team member") from exc
+        raise
     except SQLAlchemyError:
         db.rollback()
         raise
-
-    row = db.execute(
-        select(
-            team_members.c.id,
-            team_members.c.team_id,
-            team_members.c.user_id,
-            team_members.c.role,
-            team_members.c.joined_at,
-            User.username,
-            User.email,
-            User.first_name,
-            User.last_name,
-        )
-        .select_from(team_members.join(User, team_members.c.user_id == User.id))
-        .where((team_members.c.team_id == team_id) & (team_members.c.user_id == user_id))
-    ).first()
-
-    if not row:
-        raise NotFoundException("Team membership not found")
+    invalidate_principal(user.id)
 
     return TeamMemberResponse(
         id=row.id,
-        team_id=row.team_id,
-        user_id=row.user_id,
-        role=TeamRole(row.role),
+        team_id=team_id,
+        user_id=user.id,
+        role=role,
         joined_at=row.joined_at,
-        username=row.username,
-        email=row.email,
-        first_name=row.first_name,
-        last_name=row.last_name,
+        username=user.username,
+        email=user.email,
+        first_name=user.first_name,
+        last_name=user.last_name,
     )
 
 
 def create_team(db: Session, payload: TeamCreate, current_user_id: int) -> TeamResponse:
-    existing_team = db.query(Team).filter(Team.name == payload.name.strip()).first()
-    if existing_team:
-        raise BadRequestException("Team name already exists")
-
-    team = Team(
-        name=payload.name.strip(),
-        description=payload.description.strip() if payload.description else None,
-        created_by=current_user_id,
-    )
     try:
-        db.add(team)
+        team = db.execute(
+            insert(Team)
+            .values(
+                name=payload.name.strip(),
+                description=payload.description.strip() if payload.description else None,
+                created_by=current_user_id,
+            )
+            .returning(Team.id, Team.name, Team.description, Team.created_by, Team.created_at, Team.updated_at)
+        ).one()
+        db.execute(
+            insert(team_members).values(team_id=team.id, user_id=current_user_id, role=TeamRole.OWNER.value)
+        )
+        bump_membership_version(db, current_user_id)
+        invalidate_memberships(db, team.id, (current_user_id,))
         db.commit()
-        db.refresh(team)
+    except IntegrityError as exc:
+        db.rollback()
+        if is_unique_violation(exc):
+            raise BadRequestException("Team name already exists") from exc
+        raise
     except SQLAlchemyError:
         db.rollback()
         raise
-
-    _insert_membership(db, team.id, current_user_id, TeamRole.OWNER)
+    invalidate_principal(current_user_id)
 
     return TeamResponse.model_validate(team).model_copy(update={"current_user_role": TeamRole.OWNER})
 
 
-def get_user_teams(db: Session, current_user_id: int) -> list[TeamResponse]:
-    rows = db.execute(
-        select(Team, team_members.c.role)
+def get_user_teams(db: Session, current_user_id: int, page: PageParams = PageParams()) -> Page:
+    """One page of the caller's teams as TeamResponse-shaped dicts (see `page_response`)."""
+    result = paginate(
+        db,
+        select(
+            Team.name,
+            Team.description,
+            Team.id,
+            Team.created_by,
+            Team.created_at,
+            Team.updated_at,
+            team_members.c.role.label("current_user_role"),
+        )
         .join(team_members, team_members.c.team_id == Team.id)
-        .where(team_members.c.user_id == current_user_id)
-        .order_by(Team.created_at.desc(), Team.id.desc())
-    ).all()
+        .where(team_members.c.user_id == current_user_id),
+        sort_column=Team.created_at,
+        id_column=Team.id,
+        page=page,
+        row_key=lambda row: (row.created_at, row.id),
+    )
+    return result._replace(items=[row._asdict() for row in result.items])
+
 
-    teams: list[TeamResponse] = []
-    for row in rows:
-        team = TeamResponse.model_validate(row[0])
-        teams.append(team.model_copy(update={"current_user_role": TeamRole(row.role)}))
+def get_teams_content_version(db: Session, current_user_id: int) -> tuple:
+    """A change marker for everything the caller reads across their teams, in one indexed query.
 
-    return teams
+    The caller's membership_version plus the sum of their teams' content_versions.
+    """
+    return tuple(db.execute(USER_CONTENT_VERSION, {"user_id": current_user_id}).one())
 
 
-def get_team_members(db: Session, team_id: int, current_user_id: int) -> list[TeamMemberDetailResponse]:
-    _get_team_or_404(db, team_id)
+def get_team_members(
+    db: Session,
+    team_id: int,
+    current_user_id: int,
+    page: PageParams = PageParams(),
+) -> Page:
     require_team_member(db, team_id, current_user_id)
 
-    rows = db.execute(
+    result = paginate(
+        db,
         select(
             team_members.c.id,
             team_members.c.team_id,
@@ -150,11 +250,15 @@ def get_team_members(db: Session, team_id: int, current_user_id: int) -> list[Te
             User.last_name,
         )
         .select_from(team_members.join(User, team_members.c.user_id == User.id))
-        .where(team_members.c.team_id == team_id)
-        .order_by(team_members.c.joined_at.asc(), team_members.c.id.asc())
-    ).all()
+        .where(team_members.c.team_id == team_id),
+        sort_column=team_members.c.joined_at,
+        id_column=team_members.c.id,
+        page=page,
+        descending=False,
+        row_key=lambda row: (row.joined_at, row.id),
+    )
 
-    return [
+    members = [
         TeamMemberDetailResponse(
             id=row.id,
             team_id=row.team_id,
@@ -166,46 +270,39 @@ def get_team_members(db: Session, team_id: int, current_user_id: int) -> list[Te
             role=TeamRole(row.role),
             joined_at=row.joined_at,
         )
-        for row in rows
+        for row in result.items
     ]
+    return result._replace(items=members)
 
 
 def add_member(db: Session, team_id: int, payload: TeamMemberCreate, current_user_id: int) -> TeamMemberResponse:
-    _get_team_or_404(db, team_id)
     require_team_owner(db, team_id, current_user_id)
 
-    user = db.query(User).filter(User.id == payload.user_id).first()
+    user = db.execute(select(*_MEMBER_USER_COLUMNS).where(User.id == payload.user_id)).first()
     if not user:
         raise NotFoundException("User not found")
 
-    existing_member = _get_membership(db, team_id, payload.user_id)
-    if existing_member:
-        raise BadRequestException("User is already a team member")
-
-    return _insert_membership(db, team_id, payload.user_id, payload.role)
+    return _insert_membership(db, team_id, user, payload.role)
 
 
 def invite_member(db: Session, team_id: int, payload: TeamMemberInvite, current_user_id: int) -> TeamMemberResponse:
-    _get_team_or_404(db, team_id)
     require_team_owner(db, team_id, current_user_id)
 
     identifier = payload.identifier.strip()
-    user = db.query(User).filter(or_(User.username == identifier, User.email == identifier)).first()
+    user = db.execute(
+        select(*_MEMBER_USER_COLUMNS).where(or_(User.username == identifier, User.email == identifier)).limit(1)
+    ).first()
     if not user:
         raise NotFoundException("User not found. Use an existing username or email")
 
-    existing_member = _get_membership(db, team_id, user.id)
-    if existing_member:
-        raise BadRequestException("User is already a team member")
-
-    return _insert_membership(db, team_id, user.id, payload.role)
+    return _insert_membership(db, team_id, user, payload.role)
 
 
-def ensure_user_in_team(db: Session, team_id: int, user_id: int) -> None:
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+def ensure_user_in_team(db: Session, team_id: int, user_id: int):
+    """Check that `user_id` exists and belongs to the team; returns the user's public fields."""
+    row = get_loader(db).team_member_user(team_id, user_id)
+    if not row:
         raise NotFoundException("Assignee user not found")
-
-    membership = _get_membership(db, team_id, user_id)
-    if not membership:
+    if row.membership_id is None:
         raise BadRequestException("User is not a member of this team")
+    return row
@@ -0,0 +1,431 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import logging
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from enum import Enum
+from typing import BinaryIO
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import (
+    Column,
+    DateTime,
+    MetaData,
+    String,
+    Table,
+    Text,
+    and_,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, aliased
+
+from app.core.exceptions import AppException, BadRequestException
+from app.core.responses import dump_json
+from app.core.security import invalidate_principal
+from app.models.project import Project
+from app.models.task import Task
+from app.models.team import team_members
+from app.models.user import User
+from app.schemas.transfer import (
+    MemberRecord,
+    ProjectRecord,
+    TaskRecord,
+    TeamImportCounts,
+    TeamImportResponse,
+    TransferEntity,
+    TransferFormat,
+)
+from app.services.team_service import bump_content_version, invalidate_memberships, require_team_owner
+
+logger = logging.getLogger("app.transfer")
+
+EXPORT_BATCH_SIZE = 1000
+IMPORT_BATCH_SIZE = 1000
+
+# NDJSON `type` and record model per entity; the model's field order is also
+# the CSV header and the staging table's column order.
+_RECORDS: dict[TransferEntity, tuple[str, type[BaseModel]]] = {
+    TransferEntity.MEMBERS: ("member", MemberRecord),
+    TransferEntity.PROJECTS: ("project", ProjectRecord),
+    TransferEntity.TASKS: ("task", TaskRecord),
+}
+_ENTITY_BY_TYPE = {record_type: entity for entity, (record_type, _model) in _RECORDS.items()}
+
+_staging_metadata = MetaData()
+_STAGING = {
+    TransferEntity.MEMBERS: Table(
+        "import_members",
+        _staging_metadata,
+        Column("username", String(40)),
+        Column("role", String(20)),
+        Column("joined_at", DateTime(timezone=True)),
+        prefixes=["TEMPORARY"],
+        postgresql_on_commit="DROP",
+    ),
+    TransferEntity.PROJECTS: Table(
+        "import_projects",
+        _staging_metadata,
+        Column("name", String(120)),
+        Column("description", Text),
+        Column("created_by", String(40)),
+        Column("created_at", DateTime(timezone=True)),
+        prefixes=["TEMPORARY"],
+        postgresql_on_commit="DROP",
+    ),
+    TransferEntity.TASKS: Table(
+        "import_tasks",
+        _staging_metadata,
+        Column("project", String(120)),
+        Column("title", String(200)),
+        Column("description", Text),
+        Column("status", String(20)),
+        Column("assignee", String(40)),
+        Column("due_date", DateTime(timezone=True)),
+        Column("created_by", String(40)),
+        Column("created_at", DateTime(timezone=True)),
+        prefixes=["TEMPORARY"],
+        postgresql_on_commit="DROP",
+    ),
+}
+
+
+def _fields(entity: TransferEntity) -> tuple[str, ...]:
+    return tuple(_RECORDS[entity][1].model_fields)
+
+
+def _require_entity_for_csv(fmt: TransferFormat, entity: TransferEntity | None) -> None:
+    if fmt is TransferFormat.CSV and entity is None:
+        raise BadRequestException("CSV transfers hold one entity; pass `entity`")
+
+
+def _export_statement(entity: TransferEntity, team_id: int):
+    creator = aliased(User)
+    if entity is TransferEntity.MEMBERS:
+        return (
+            select(User.username, team_members.c.role, team_members.c.joined_at)
+            .join(team_members, team_members.c.user_id == User.id)
+            .where(team_members.c.team_id == team_id)
+            .order_by(team_members.c.joined_at, team_members.c.id)
+        )
+    if entity is TransferEntity.PROJECTS:
+        return (
+            select(Project.name, Project.description, creator.username, Project.created_at)
+            .join(creator, creator.id == Project.created_by)
+            .where(Project.team_id == team_id)
+            .order_by(Project.created_at, Project.id)
+        )
+    assignee = aliased(User)
+    return (
+        select(
+            Project.name,
+            Task.title,
+            Task.description,
+            Task.status,
+            assignee.username,
+            Task.due_date,
+            creator.username,
+            Task.created_at,
+        )
+        .join(Project, Project.id == Task.project_id)
+        .outerjoin(assignee, assignee.id == Task.assigned_user_id)
+        .join(creator, creator.id == Task.created_by)
+        .where(Project.team_id == team_id)
+        .order_by(Task.project_id, Task.created_at, Task.id)
+    )
+
+
+def _export_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _encode_ndjson(record_type: str, fields: tuple[str, ...], rows) -> bytes:
+    return b"".join(dump_json({"type": record_type, **dict(zip(fields, row))}) + b"\n" for row in rows)
+
+
+def _encode_csv(rows) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([_export_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode()
+
+
+def stream_team_export(
+    db: Session, team_id: int, fmt: TransferFormat, entity: TransferEntity | None = None
+) -> Iterator[bytes]:
+    """Return an iterator of a team's members, projects and tasks as NDJSON or CSV chunks.
+
+    Rows come from a server-side cursor (`yield_per`) and each fetched batch is
+    encoded as one chunk, so memory stays flat however large the team is. Takes
+    ownership of `db`, a standalone session (`open_read_session`), since a
+    streamed body outlives the request's session dependency; check access
+    before calling.
+    """
+    try:
+        _require_entity_for_csv(fmt, entity)
+    except BaseException:
+        db.close()
+        raise
+    return _export_chunks(db, team_id, fmt, entity)
+
+
+def _export_chunks(db: Session, team_id: int, fmt: TransferFormat, entity: TransferEntity | None) -> Iterator[bytes]:
+    entities = [entity] if entity is not None else list(TransferEntity)
+    with db:
+        for current in entities:
+            record_type, _model = _RECORDS[current]
+            fields = _fields(current)
+            if fmt is TransferFormat.CSV:
+                yield _encode_csv([fields])
+            result = db.execute(_export_statement(current, team_id).execution_options(yield_per=EXPORT_BATCH_SIZE))
+            for rows in result.partitions():
+                if fmt is TransferFormat.NDJSON:
+                    yield _encode_ndjson(record_type, fields, rows)
+                else:
+                    yield _encode_csv(rows)
+
+
+def _invalid_record(location: str, exc: Exception) -> BadRequestException:
+    if isinstance(exc, ValidationError):
+        error = exc.errors()[0]
+        message = f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+    else:
+        message = str(exc)
+    return BadRequestException("Invalid import file", errors=[{"field": location, "message": message}])
+
+
+def _read_records(
+    stream: BinaryIO,
+    fmt: TransferFormat,
+    entity: TransferEntity | None,
+) -> Iterator[tuple[TransferEntity, BaseModel]]:
+    lines = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    line_number = 0
+    try:
+        if fmt is TransferFormat.NDJSON:
+            for line_number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                if not isinstance(data, dict) or data.get("type") not in _ENTITY_BY_TYPE:
+                    raise ValueError("Expected an object with type member, project or task")
+                current = _ENTITY_BY_TYPE[data["type"]]
+                if entity is None or current is entity:
+                    yield current, _RECORDS[current][1].model_validate(data)
+        else:
+            model = _RECORDS[entity][1]
+            for line_number, row in enumerate(csv.DictReader(lines), start=2):
+                yield entity, model.model_validate({key: value for key, value in row.items() if value != ""})
+    except (ValueError, csv.Error) as exc:
+        raise _invalid_record(f"line {line_number}", exc) from exc
+    finally:
+        lines.detach()
+
+
+def _staging_row(record: BaseModel) -> tuple:
+    values = (getattr(record, field) for field in type(record).model_fields)
+    return tuple(value.value if isinstance(value, Enum) else value for value in values)
+
+
+def _stage(db: Session, entity: TransferEntity, rows: list[tuple]) -> None:
+    table = _STAGING[entity]
+    connection = db.connection()
+    if connection.dialect.driver == "psycopg2":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        columns = ", ".join(column.name for column in table.columns)
+        cursor = connection.connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {table.name} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+        finally:
+            cursor.close()
+    else:
+        connection.execute(table.insert(), [dict(zip(table.columns.keys(), row)) for row in rows])
+
+
+def _team_member_id(team_id: int, username_column):
+    """The id of the team member with that username, or NULL."""
+    return (
+        select(User.id)
+        .join(team_members, (team_members.c.user_id == User.id) & (team_members.c.team_id == team_id))
+        .where(User.username == username_column)
+        .scalar_subquery()
+    )
+
+
+def _merge_members(db: Session, team_id: int) -> list[int]:
+    staged = _STAGING[TransferEntity.MEMBERS]
+    new_members = (
+        select(
+            literal(team_id),
+            User.id,
+            func.max(staged.c.role),
+            func.coalesce(func.min(staged.c.joined_at), func.now()),
+        )
+        .join(staged, staged.c.username == User.username)
+        .where(~exists().where(team_members.c.team_id == team_id, team_members.c.user_id == User.id))
+        .group_by(User.id)
+    )
+    added = list(
+        db.execute(
+            insert(team_members)
+            .from_select(["team_id", "user_id", "role", "joined_at"], new_members)
+            .returning(team_members.c.user_id)
+        ).scalars()
+    )
+    if added:
+        db.execute(
+            update(User)
+            .where(User.id.in_(added))
+            .values(membership_version=User.membership_version + 1, updated_at=User.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        invalidate_memberships(db, team_id, added)
+    return added
+
+
+def _merge_projects(db: Session, team_id: int, current_user_id: int) -> int:
+    staged = _STAGING[TransferEntity.PROJECTS]
+    deduped = (
+        select(
+            staged.c.name,
+            func.max(staged.c.description).label("description"),
+            func.max(staged.c.created_by).label("created_by"),
+            func.min(staged.c.created_at).label("created_at"),
+        )
+        .group_by(staged.c.name)
+        .subquery()
+    )
+    new_projects = select(
+        literal(team_id),
+        deduped.c.name,
+        deduped.c.description,
+        func.coalesce(_team_member_id(team_id, deduped.c.created_by), current_user_id),
+        func.coalesce(deduped.c.created_at, func.now()),
+    ).where(~exists().where(Project.team_id == team_id, Project.name == deduped.c.name))
+    return db.execute(
+        insert(Project).from_select(["team_id", "name", "description", "created_by", "created_at"], new_projects)
+    ).rowcount
+
+
+def _merge_tasks(db: Session, team_id: int, current_user_id: int) -> int:
+    staged = _STAGING[TransferEntity.TASKS]
+    existing_created, staged_created = Task.created_at, staged.c.created_at
+    if db.get_bind().dialect.name == "sqlite":
+        # Server-default timestamps are stored without microseconds; compare as julian days.
+        existing_created, staged_created = func.julianday(existing_created), func.julianday(staged_created)
+    # A task already present with the same project, title and creation time is
+    # treated as imported before, so re-running an import does not duplicate it.
+    new_tasks = (
+        select(
+            Project.id,
+            staged.c.title,
+            staged.c.description,
+            staged.c.status,
+            _team_member_id(team_id, staged.c.assignee),
+            staged.c.due_date,
+            func.coalesce(_team_member_id(team_id, staged.c.created_by), current_user_id),
+            func.coalesce(staged.c.created_at, func.now()),
+        )
+        .select_from(staged)
+        .join(Project, and_(Project.team_id == team_id, Project.name == staged.c.project))
+        .where(
+            ~exists().where(
+                Task.project_id == Project.id,
+                Task.title == staged.c.title,
+                existing_created == staged_created,
+            )
+        )
+        .distinct()
+    )
+    columns = ["project_id", "title", "description", "status", "assigned_user_id", "due_date", "created_by", "created_at"]
+    return db.execute(insert(Task).from_select(columns, new_tasks)).rowcount
+
+
+def _log_progress(stage: str, count: int) -> None:
+    logger.info("team import %s: %d", stage, count)
+
+
+def import_team_data(
+    db: Session,
+    *,
+    team_id: int,
+    current_user_id: int,
+    stream: BinaryIO,
+    fmt: TransferFormat,
+    entity: TransferEntity | None = None,
+    progress: Callable[[str, int], None] | None = None,
+) -> TeamImportResponse:
+    """Load an export into a team: stage the records, then merge them set-based.
+
+    Records are parsed as a stream and staged in batches into temporary tables
+    (with COPY on psycopg2), so memory stays flat. Members are matched to
+    existing users by username; projects by name within the team. Assignees and
+    creators that are not team members become unassigned and the importing
+    user respectively. Everything merges in one transaction.
+    """
+    require_team_owner(db, team_id, current_user_id)
+    _require_entity_for_csv(fmt, entity)
+    report = progress or _log_progress
+
+    counts = {current: TeamImportCounts() for current in TransferEntity}
+    batches: dict[TransferEntity, list[tuple]] = {current: [] for current in TransferEntity}
+    added_members: list[int] = []
+    try:
+        connection = db.connection()
+        for table in _STAGING.values():
+            table.create(connection)
+
+        def flush(current: TransferEntity) -> None:
+            _stage(db, current, batches[current])
+            batches[current].clear()
+            report(f"staged {current.value}", counts[current].read)
+
+        for current, record in _read_records(stream, fmt, entity):
+            counts[current].read += 1
+            batches[current].append(_staging_row(record))
+            if len(batches[current]) >= IMPORT_BATCH_SIZE:
+                flush(current)
+        for current in TransferEntity:
+            if batches[current]:
+                flush(current)
+
+        added_members = _merge_members(db, team_id)
+        counts[TransferEntity.MEMBERS].inserted = len(added_members)
+        report("merged members", len(added_members))
+        counts[TransferEntity.PROJECTS].inserted = _merge_projects(db, team_id, current_user_id)
+        report("merged projects", counts[TransferEntity.PROJECTS].inserted)
+        counts[TransferEntity.TASKS].inserted = _merge_tasks(db, team_id, current_user_id)
+        report("merged tasks", counts[TransferEntity.TASKS].inserted)
+        if counts[TransferEntity.PROJECTS].inserted or counts[TransferEntity.TASKS].inserted:
+            bump_content_version(db, [team_id])
+        db.commit()
+    except (AppException, SQLAlchemyError):
+        db.rollback()
+        raise
+    finally:
+        # PostgreSQL drops the staging tables with the transaction; SQLite keeps
+        # temporary tables for the life of the pooled connection.
+        if db.get_bind().dialect.name != "postgresql":
+            for table in _STAGING.values():
+                db.execute(text(f"DROP TABLE IF EXISTS temp.{table.name}"))
+            db.commit()
+
+    for user_id in added_members:
+        invalidate_principal(user_id)
+    for current_counts in counts.values():
+        current_counts.skipped = current_counts.read - current_counts.inserted
+    return TeamImportResponse(
+        members=counts[TransferEntity.MEMBERS],
+        projects=counts[TransferEntity.PROJECTS],
+        tasks=counts[TransferEntity.TASKS],
+    )
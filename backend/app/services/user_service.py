@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import sys
+
+from sqlalchemy import func, select, union
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.metrics import register_metrics_source
+from app.models.team import team_members
+from app.models.user import User
+from app.services.team_service import require_team_member
+
+LOOKUP_DEFAULT_RESULTS = 10
+LOOKUP_MAX_RESULTS = 20
+# Directory-wide lookups need this many characters; team lookups need one.
+LOOKUP_MIN_PREFIX = 2
+
+# Answers for the same prefix are shared by every caller, so a debounced
+# typeahead mostly hits memory. Membership is still checked per request.
+user_lookup_cache = TTLCache(
+    maxsize=settings.USER_LOOKUP_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.USER_LOOKUP_CACHE_SECONDS,
+)
+register_metrics_source("user_lookup_cache", user_lookup_cache.stats)
+
+_LOOKUP_COLUMNS = (User.id, User.username, User.first_name, User.last_name)
+
+
+def _prefix_key(db: Session, column):
+    # Must match the expression indexes on users (see app.models.user).
+    if db.get_bind().dialect.name == "postgresql":
+        return func.lower(column).collate("C")
+    return func.lower(column)
+
+
+def _prefix_range(key, prefix: str):
+    # In byte order, everything starting with `prefix` sorts between it and the
+    # prefix with its last character bumped, so the match is one index range.
+    # The highest code point cannot be bumped: drop it and bump the one before,
+    # and leave the range open-ended when nothing is left.
+    stem = prefix.rstrip(chr(sys.maxunicode))
+    if not stem:
+        return key >= prefix
+    upper = stem[:-1] + chr(ord(stem[-1]) + 1)
+    return (key >= prefix) & (key < upper)
+
+
+def lookup_users(
+    db: Session,
+    *,
+    current_user_id: int,
+    prefix: str,
+    team_id: int | None = None,
+    limit: int = LOOKUP_DEFAULT_RESULTS,
+) -> list[dict]:
+    """Active users whose username or email starts with `prefix`, case-insensitively.
+
+    With `team_id`, only that team's members are searched and the caller must
+    be one of them. At most `limit` users are returned, ordered by username.
+    """
+    if team_id is not None:
+        require_team_member(db, team_id, current_user_id)
+
+    prefix = prefix.strip().lower()
+    if len(prefix) < (1 if team_id is not None else LOOKUP_MIN_PREFIX):
+        return []
+
+    cache_key = (team_id, prefix, limit)
+    cached = user_lookup_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    username_key = _prefix_key(db, User.username)
+    email_key = _prefix_key(db, User.email)
+    if team_id is not None:
+        # Teams are small: walk the members and filter them.
+        stmt = (
+            select(*_LOOKUP_COLUMNS)
+            .join(team_members, team_members.c.user_id == User.id)
+            .where(
+                team_members.c.team_id == team_id,
+                User.is_active,
+                _prefix_range(username_key, prefix) | _prefix_range(email_key, prefix),
+            )
+            .order_by(username_key)
+            .limit(limit)
+        )
+    else:
+        # One bounded index range per column, merged: neither side reads more
+        # than `limit` rows however common the prefix is.
+        matches = union(
+            *(
+                select(
+                    select(*_LOOKUP_COLUMNS, username_key.label("sort_key"))
+                    .where(User.is_active, _prefix_range(key, prefix))
+                    .order_by(key)
+                    .limit(limit)
+                    .subquery()
+                )
+                for key in (username_key, email_key)
+            )
+        ).subquery()
+        stmt = (
+            select(matches.c.id, matches.c.username, matches.c.first_name, matches.c.last_name)
+            .order_by(matches.c.sort_key)
+            .limit(limit)
+        )
+
+    users = [row._asdict() for row in db.execute(stmt)]
+    user_lookup_cache.set(cache_key, users)
+    return users
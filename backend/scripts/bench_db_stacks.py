@@ -0,0 +1,150 @@
+"""Compare the sync and async route stacks under concurrent board reads.
+
+Starts one uvicorn worker per stack (DB_STACK=sync / DB_STACK=async) against the
+database configured in backend/.env, seeds a user, team, project and tasks
+through the public API, then fires concurrent `GET /tasks/` requests.
+
+Usage (from backend/, requires `pip install httpx`):
+
+    python scripts/bench_db_stacks.py --concurrency 200 --requests 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+import httpx
+
+
+def _start_server(stack: str, port: int) -> subprocess.Popen:
+    env = {**os.environ, "DB_STACK": stack}
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+
+
+async def _wait_until_ready(client: httpx.AsyncClient, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            response = await client.get("/openapi.json")
+            if response.status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("Server did not become ready in time")
+
+
+async def _seed(client: httpx.AsyncClient, tasks: int) -> dict[str, str]:
+    suffix = uuid.uuid4().hex[:8]
+    username = f"bench_{suffix}"
+    password = "bench-password"
+    response = await client.post(
+        "/auth/register",
+        json={
+            "username": username,
+            "email": f"{username}@example.com",
+            "first_name": "Bench",
+            "last_name": "User",
+            "password": password,
+        },
+    )
+    response.raise_for_status()
+    response = await client.post("/auth/login", data={"username": username, "password": password})
+    response.raise_for_status()
+    headers = {"Authorization": f"Bearer {response.json()['data']['token']['access_token']}"}
+
+    response = await client.post("/teams/", json={"name": f"Bench {suffix}"}, headers=headers)
+    response.raise_for_status()
+    team_id = response.json()["data"]["id"]
+    response = await client.post(f"/teams/{team_id}/projects", json={"name": "Board"}, headers=headers)
+    response.raise_for_status()
+    project_id = response.json()["data"]["id"]
+
+    for index in range(tasks):
+        response = await client.post(
+            "/tasks/",
+            json={"project_id": project_id, "title": f"Task {index}"},
+            headers=headers,
+        )
+        response.raise_for_status()
+    return headers
+
+
+async def _load(client: httpx.AsyncClient, headers: dict[str, str], *, requests: int, concurrency: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                response = await client.get("/tasks/", headers=headers)
+                if response.status_code != 200:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "errors": errors,
+    }
+
+
+async def _bench_stack(stack: str, port: int, args: argparse.Namespace) -> dict:
+    server = _start_server(stack, port)
+    try:
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=60) as client:
+            await _wait_until_ready(client)
+            headers = await _seed(client, args.tasks)
+            await _load(client, headers, requests=min(args.requests, 200), concurrency=args.concurrency)
+            return await _load(client, headers, requests=args.requests, concurrency=args.concurrency)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--tasks", type=int, default=50)
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args()
+
+    results = {
+        stack: asyncio.run(_bench_stack(stack, args.port + offset, args))
+        for offset, stack in enumerate(("sync", "async"))
+    }
+
+    print(f"{'stack':<8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for stack, result in results.items():
+        print(
+            f"{stack:<8}{result['rps']:>10.1f}{result['p50_ms']:>10.1f}"
+            f"{result['p95_ms']:>10.1f}{result['p99_ms']:>10.1f}{result['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
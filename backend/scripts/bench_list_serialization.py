@@ -0,0 +1,219 @@
+"""Benchmark the list endpoints' row-to-JSON path in rows per second.
+
+Compares the previous path, where ORM entities are hydrated, turned into
+response models and then re-validated and serialized through the route's
+`response_model`, with the current one: column projections encoded straight to
+JSON by `page_response`. Both run the same full-size page against in-memory
+SQLite and end with the response body bytes.
+
+Usage (from backend/):
+
+    python scripts/bench_list_serialization.py --pages 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("REQUIRE_POSTGRES", "false")
+os.environ.setdefault("SECRET_KEY", "bench-list-serialization-secret-key")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import create_engine, insert, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.core.database import Base  # noqa: E402
+from app.core.pagination import MAX_PAGE_SIZE, PageParams, paginate  # noqa: E402
+from app.core.responses import page_response  # noqa: E402
+from app.models import Project, Task, Team, User, team_members  # noqa: E402
+from app.schemas.common import PaginatedResponse  # noqa: E402
+from app.schemas.task import TaskResponse, TaskStatus  # noqa: E402
+from app.schemas.team import TeamResponse, TeamRole  # noqa: E402
+from app.services.task_service import list_tasks  # noqa: E402
+from app.services.team_service import get_user_teams  # noqa: E402
+
+STATUSES = [status.value for status in TaskStatus]
+TASK_PAGE = TypeAdapter(PaginatedResponse[list[TaskResponse]])
+TEAM_PAGE = TypeAdapter(PaginatedResponse[list[TeamResponse]])
+
+
+def _seed(db: Session) -> None:
+    started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    db.execute(
+        insert(User),
+        [
+            {
+                "id": user_id,
+                "username": f"user{user_id}",
+                "email": f"user{user_id}@example.com",
+                "first_name": "Bench",
+                "last_name": "User",
+                "hashed_password": "x",
+            }
+            for user_id in (1, 2)
+        ],
+    )
+    db.execute(
+        insert(Team),
+        [
+            {"id": team_id, "name": f"team{team_id}", "description": "Bench team", "created_by": 1,
+             "created_at": started + timedelta(minutes=team_id)}
+            for team_id in range(1, MAX_PAGE_SIZE + 1)
+        ],
+    )
+    db.execute(
+        insert(team_members),
+        [{"team_id": team_id, "user_id": 1, "role": "owner" if team_id % 2 else "member"}
+         for team_id in range(1, MAX_PAGE_SIZE + 1)],
+    )
+    db.execute(insert(Project), [{"id": 1, "team_id": 1, "name": "bench", "created_by": 1}])
+    db.execute(
+        insert(Task),
+        [
+            {
+                "project_id": 1,
+                "title": f"Task number {index}",
+                "description": "A task description of a typical length for a board card.",
+                "status": STATUSES[index % len(STATUSES)],
+                "assigned_user_id": 1 + index % 2,
+                "due_date": started + timedelta(days=index) if index % 3 else None,
+                "created_by": 1,
+                "created_at": started + timedelta(minutes=index),
+            }
+            for index in range(MAX_PAGE_SIZE)
+        ],
+    )
+    db.commit()
+
+
+def _envelope_body(adapter: TypeAdapter, message: str, page) -> bytes:
+    # What FastAPI does with a returned model: validate against response_model,
+    # dump to JSON-compatible data, then json.dumps in JSONResponse.
+    content = adapter.validate_python(
+        PaginatedResponse(message=message, data=page.items, limit=page.limit, next_cursor=page.next_cursor),
+        from_attributes=True,
+    )
+    return json.dumps(adapter.dump_python(content, mode="json"), separators=(",", ":")).encode()
+
+
+def _legacy_tasks(db: Session) -> bytes:
+    page = paginate(
+        db,
+        select(Task, Project.name, User)
+        .select_from(Task)
+        .join(Project, Task.project_id == Project.id)
+        .join(team_members, team_members.c.team_id == Project.team_id)
+        .outerjoin(User, Task.assigned_user_id == User.id)
+        .where(team_members.c.user_id == 1),
+        sort_column=Task.created_at,
+        id_column=Task.id,
+        page=PageParams(limit=MAX_PAGE_SIZE),
+        row_key=lambda row: (row[0].created_at, row[0].id),
+    )
+    items = [
+        TaskResponse(
+            id=task.id,
+            project_id=task.project_id,
+            project_name=project_name,
+            title=task.title,
+            description=task.description,
+            status=TaskStatus(task.status),
+            due_date=task.due_date,
+            assigned_user_id=task.assigned_user_id,
+            assigned_username=user.username if user else None,
+            assigned_first_name=user.first_name if user else None,
+            assigned_last_name=user.last_name if user else None,
+            created_by=task.created_by,
+            created_at=task.created_at,
+            updated_at=task.updated_at,
+            can_update=task.assigned_user_id == 1,
+        )
+        for task, project_name, user in page.items
+    ]
+    db.expunge_all()
+    return _envelope_body(TASK_PAGE, "Tasks fetched successfully", page._replace(items=items))
+
+
+def _legacy_teams(db: Session) -> bytes:
+    page = paginate(
+        db,
+        select(Team, team_members.c.role)
+        .join(team_members, team_members.c.team_id == Team.id)
+        .where(team_members.c.user_id == 1),
+        sort_column=Team.created_at,
+        id_column=Team.id,
+        page=PageParams(limit=MAX_PAGE_SIZE),
+        row_key=lambda row: (row[0].created_at, row[0].id),
+    )
+    items = [
+        TeamResponse.model_validate(row[0]).model_copy(update={"current_user_role": TeamRole(row.role)})
+        for row in page.items
+    ]
+    db.expunge_all()
+    return _envelope_body(TEAM_PAGE, "Teams fetched successfully", page._replace(items=items))
+
+
+def _current_tasks(db: Session) -> bytes:
+    page = list_tasks(
+        db,
+        current_user_id=1,
+        project_id=None,
+        status=None,
+        assigned_user_id=None,
+        page=PageParams(limit=MAX_PAGE_SIZE),
+    )
+    return page_response("Tasks fetched successfully", page).body
+
+
+def _current_teams(db: Session) -> bytes:
+    return page_response("Teams fetched successfully", get_user_teams(db, 1, PageParams(limit=MAX_PAGE_SIZE))).body
+
+
+def _rows_per_second(fn: Callable[[], bytes], pages: int, repeats: int) -> float:
+    for _ in range(min(pages, 10)):
+        fn()
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(pages):
+            fn()
+        samples.append(pages * MAX_PAGE_SIZE / (time.perf_counter() - started))
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=100, help=f"pages of {MAX_PAGE_SIZE} rows per sample")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        _seed(db)
+        cases = {
+            "list_tasks": (lambda: _legacy_tasks(db), lambda: _current_tasks(db)),
+            "get_user_teams": (lambda: _legacy_teams(db), lambda: _current_teams(db)),
+        }
+
+        print(f"{'endpoint':<16} {'before rows/s':>14} {'after rows/s':>13} {'speedup':>8}")
+        for name, (legacy_fn, current_fn) in cases.items():
+            if json.loads(legacy_fn()) != json.loads(current_fn()):
+                raise SystemExit(f"{name}: the two paths produce different JSON")
+            before = _rows_per_second(legacy_fn, args.pages, args.repeats)
+            after = _rows_per_second(current_fn, args.pages, args.repeats)
+            print(f"{name:<16} {before:>14,.0f} {after:>13,.0f} {after / before:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Micro-benchmark the hot per-request lookups.
+
+Compares the previous per-call query construction (`db.query(...)` and inline
+`select(...)`) with the prebuilt statements in `app.repositories`. It runs
+against in-memory SQLite, where the database work is tiny and the same for
+both variants, so the difference is Python overhead on the request path.
+
+Usage (from backend/):
+
+    python scripts/bench_statements.py --calls 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections.abc import Callable
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("REQUIRE_POSTGRES", "false")
+os.environ.setdefault("SECRET_KEY", "bench-statements-secret-key")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.core.database import Base  # noqa: E402
+from app.models import Project, Task, Team, User, team_members  # noqa: E402
+from app.repositories.statements import (  # noqa: E402
+    PROJECT_ACCESS,
+    PROJECT_COLUMNS,
+    TASK_ACCESS,
+    TEAM_MEMBERSHIP,
+)
+from app.repositories.users import USER_BY_ID, USER_BY_USERNAME  # noqa: E402
+
+
+def _seed(db: Session) -> None:
+    db.add(User(id=1, username="bench", email="bench@example.com", first_name="B", last_name="U", hashed_password="x"))
+    db.add(Team(id=1, name="bench", created_by=1))
+    db.flush()
+    db.execute(team_members.insert().values(team_id=1, user_id=1, role="owner"))
+    db.add(Project(id=1, team_id=1, name="bench", created_by=1))
+    db.flush()
+    db.add(Task(id=1, project_id=1, title="bench", created_by=1))
+    db.commit()
+
+
+def _legacy_cases(db: Session) -> dict[str, Callable[[], object]]:
+    return {
+        "user_by_id": lambda: db.query(User).filter(User.id == 1).first(),
+        "user_by_username": lambda: db.query(User).filter(User.username == "bench").first(),
+        "team_membership": lambda: db.execute(
+            select(team_members).where((team_members.c.team_id == 1) & (team_members.c.user_id == 1))
+        ).first(),
+        "project_access": lambda: db.execute(
+            select(*PROJECT_COLUMNS, team_members.c.role)
+            .outerjoin(team_members, (team_members.c.team_id == Project.team_id) & (team_members.c.user_id == 1))
+            .where(Project.id == 1)
+        ).first(),
+        "task_access": lambda: db.execute(
+            select(Task.id, Task.created_by, Task.assigned_user_id, Project.team_id, team_members.c.role)
+            .join(Project, Project.id == Task.project_id)
+            .outerjoin(team_members, (team_members.c.team_id == Project.team_id) & (team_members.c.user_id == 1))
+            .where(Task.id == 1)
+        ).first(),
+    }
+
+
+def _prebuilt_cases(db: Session) -> dict[str, Callable[[], object]]:
+    return {
+        "user_by_id": lambda: db.execute(USER_BY_ID, {"user_id": 1}).scalar_one_or_none(),
+        "user_by_username": lambda: db.execute(USER_BY_USERNAME, {"username": "bench"}).scalar_one_or_none(),
+        "team_membership": lambda: db.execute(TEAM_MEMBERSHIP, {"team_id": 1, "user_id": 1}).first(),
+        "project_access": lambda: db.execute(PROJECT_ACCESS, {"project_id": 1, "user_id": 1}).first(),
+        "task_access": lambda: db.execute(TASK_ACCESS, {"task_id": 1, "user_id": 1}).first(),
+    }
+
+
+def _per_call_us(fn: Callable[[], object], calls: int, repeats: int) -> float:
+    for _ in range(min(calls, 500)):
+        fn()
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        samples.append((time.perf_counter() - started) / calls * 1_000_000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        _seed(db)
+        legacy = _legacy_cases(db)
+        prebuilt = _prebuilt_cases(db)
+
+        print(f"{'lookup':<18} {'legacy us':>10} {'prebuilt us':>12} {'saved us':>9} {'saved':>7}")
+        for name, legacy_fn in legacy.items():
+            before = _per_call_us(legacy_fn, args.calls, args.repeats)
+            after = _per_call_us(prebuilt[name], args.calls, args.repeats)
+            saved = before - after
+            print(f"{name:<18} {before:>10.1f} {after:>12.1f} {saved:>9.1f} {saved / before:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""Guard the query plans of the service read paths.
+
+Seeds an empty database, runs each list/summary/access service function,
+captures the SQL it emits and runs EXPLAIN on every SELECT with the same
+parameters. Exits non-zero if any plan reads one of the large tables with a
+full scan instead of an index.
+
+On PostgreSQL the plans are taken with `enable_seqscan = off`, so a sequential
+scan only shows up when no usable index exists. Refuses to touch a database
+that already has tables, and drops what it created afterwards.
+
+Usage (from backend/):
+
+    python scripts/check_query_plans.py                       # temporary SQLite file
+    python scripts/check_query_plans.py --database-url postgresql+psycopg2://.../plan_check
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import shutil
+import sys
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+_SCRATCH_DIR = tempfile.mkdtemp(prefix="plan-check-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_SCRATCH_DIR}/plans.db")
+os.environ.setdefault("REQUIRE_POSTGRES", "false")
+os.environ.setdefault("SECRET_KEY", "check-query-plans-secret-key")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, inspect, insert  # noqa: E402
+from sqlalchemy.engine import Connection, Engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.core.database import Base  # noqa: E402
+from app.core.pagination import PageParams  # noqa: E402
+from app.models import Project, Task, Team, User, team_members  # noqa: E402
+from app.schemas.task import TaskStatus  # noqa: E402
+from app.services.project_service import get_project_access, list_team_projects  # noqa: E402
+from app.services.task_service import (  # noqa: E402
+    get_my_tasks_summary,
+    get_task_content_version,
+    list_tasks,
+    search_tasks,
+)
+from app.services.team_service import (  # noqa: E402
+    ensure_user_in_team,
+    get_team_members,
+    get_user_teams,
+    membership_cache,
+    require_team_member,
+)
+from app.services.user_service import lookup_users, user_lookup_cache  # noqa: E402
+
+GUARDED_TABLES = {"tasks", "projects", "team_members", "users", "teams"}
+
+USERS = 400
+TEAMS = 80
+MEMBERS_PER_TEAM = 12
+PROJECTS_PER_TEAM = 6
+TASKS_PER_PROJECT = 40
+STATUSES = [status.value for status in TaskStatus]
+
+
+def _seed(connection: Connection) -> None:
+    started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    connection.execute(
+        insert(User),
+        [
+            {
+                "id": user_id,
+                "username": f"user{user_id}",
+                "email": f"user{user_id}@example.com",
+                "first_name": "Plan",
+                "last_name": "Check",
+                "hashed_password": "x",
+                "created_at": started,
+            }
+            for user_id in range(1, USERS + 1)
+        ],
+    )
+    connection.execute(
+        insert(Team),
+        [
+            {"id": team_id, "name": f"team{team_id}", "created_by": team_id, "created_at": started + timedelta(hours=team_id)}
+            for team_id in range(1, TEAMS + 1)
+        ],
+    )
+    connection.execute(
+        insert(team_members),
+        [
+            {
+                "team_id": team_id,
+                "user_id": (team_id * 5 + offset) % USERS + 1,
+                "role": "owner" if offset == 0 else "member",
+                "joined_at": started + timedelta(minutes=offset),
+            }
+            for team_id in range(1, TEAMS + 1)
+            for offset in range(MEMBERS_PER_TEAM)
+        ],
+    )
+    projects = [
+        {
+            "id": (team_id - 1) * PROJECTS_PER_TEAM + index + 1,
+            "team_id": team_id,
+            "name": f"project{index}",
+            "created_by": team_id % USERS + 1,
+            "created_at": started + timedelta(hours=team_id, minutes=index),
+        }
+        for team_id in range(1, TEAMS + 1)
+        for index in range(PROJECTS_PER_TEAM)
+    ]
+    connection.execute(insert(Project), projects)
+    connection.execute(
+        insert(Task),
+        [
+            {
+                "project_id": project["id"],
+                "title": f"task{index}",
+                "status": STATUSES[index % len(STATUSES)],
+                "assigned_user_id": (project["id"] + index) % USERS + 1,
+                "due_date": started + timedelta(days=index) if index % 3 else None,
+                "created_by": project["created_by"],
+                "created_at": started + timedelta(minutes=project["id"] * 100 + index),
+            }
+            for project in projects
+            for index in range(TASKS_PER_PROJECT)
+        ],
+    )
+
+
+def _checks(db: Session, user_id: int, team_id: int, project_id: int) -> list[tuple[str, Callable[[], object]]]:
+    first_page = PageParams(limit=5)
+
+    def second_page(fetch: Callable[[PageParams], object]) -> Callable[[], object]:
+        def run() -> object:
+            return fetch(PageParams(limit=5, cursor=fetch(first_page).next_cursor))
+
+        return run
+
+    return [
+        ("require_team_member", lambda: require_team_member(db, team_id, user_id)),
+        ("get_project_access", lambda: get_project_access(db, project_id, user_id)),
+        ("ensure_user_in_team", lambda: ensure_user_in_team(db, team_id, user_id)),
+        ("get_user_teams", lambda: get_user_teams(db, user_id, first_page)),
+        ("get_team_members", lambda: get_team_members(db, team_id, user_id, first_page)),
+        ("get_team_members:page2", second_page(lambda page: get_team_members(db, team_id, user_id, page))),
+        ("list_team_projects", lambda: list_team_projects(db, team_id, user_id, first_page)),
+        ("list_tasks", lambda: _list_tasks(db, user_id, page=first_page)),
+        ("list_tasks:page2", second_page(lambda page: _list_tasks(db, user_id, page=page))),
+        ("list_tasks:project", lambda: _list_tasks(db, user_id, project_id=project_id, page=first_page)),
+        (
+            "list_tasks:project+status",
+            lambda: _list_tasks(db, user_id, project_id=project_id, status=TaskStatus.DONE, page=first_page),
+        ),
+        ("list_tasks:assignee", lambda: _list_tasks(db, user_id, assigned_user_id=user_id, page=first_page)),
+        ("get_my_tasks_summary", lambda: get_my_tasks_summary(db, user_id)),
+        ("get_task_content_version", lambda: get_task_content_version(db, user_id)),
+        ("get_task_content_version:project", lambda: get_task_content_version(db, user_id, project_id)),
+        ("search_tasks", lambda: search_tasks(db, current_user_id=user_id, query="task7", page=first_page)),
+        (
+            "search_tasks:page2",
+            second_page(lambda page: search_tasks(db, current_user_id=user_id, query="task7", page=page)),
+        ),
+        ("lookup_users", lambda: lookup_users(db, current_user_id=user_id, prefix="user1")),
+        ("lookup_users:team", lambda: lookup_users(db, current_user_id=user_id, prefix="user", team_id=team_id)),
+    ]
+
+
+def _list_tasks(db: Session, user_id: int, *, project_id=None, status=None, assigned_user_id=None, page: PageParams):
+    return list_tasks(
+        db,
+        current_user_id=user_id,
+        project_id=project_id,
+        status=status,
+        assigned_user_id=assigned_user_id,
+        page=page,
+    )
+
+
+@contextmanager
+def _capture(engine: Engine) -> Iterator[list[tuple[str, object]]]:
+    captured: list[tuple[str, object]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def _postgres_scans(connection: Connection, statement: str, parameters) -> tuple[list[str], list[str]]:
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar_one()
+    lines: list[str] = []
+    bad: list[str] = []
+
+    def walk(node: dict, depth: int) -> None:
+        relation = node.get("Relation Name")
+        label = node["Node Type"] + (f" on {relation}" if relation else "")
+        if node.get("Index Name"):
+            label += f" using {node['Index Name']}"
+        lines.append("  " * depth + label)
+        if node["Node Type"] == "Seq Scan" and relation in GUARDED_TABLES:
+            bad.append(label)
+        for child in node.get("Plans", []):
+            walk(child, depth + 1)
+
+    walk(plan[0]["Plan"], 0)
+    return lines, bad
+
+
+_SQLITE_FULL_SCAN = re.compile(r"^SCAN (\w+)(?! USING (?:COVERING )?INDEX)")
+
+
+def _sqlite_scans(connection: Connection, statement: str, parameters) -> tuple[list[str], list[str]]:
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    lines = [row[3] for row in rows]
+    bad = [line for line in lines if (match := _SQLITE_FULL_SCAN.match(line)) and match.group(1) in GUARDED_TABLES]
+    return lines, bad
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=os.environ["DATABASE_URL"])
+    parser.add_argument("--verbose", action="store_true", help="print every plan, not only regressions")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    if inspect(engine).get_table_names():
+        print(f"Refusing to run: {engine.url.render_as_string()} already has tables.", file=sys.stderr)
+        return 2
+
+    is_postgres = engine.dialect.name == "postgresql"
+    Base.metadata.create_all(engine)
+    failures = 0
+    try:
+        with engine.begin() as connection:
+            _seed(connection)
+        if is_postgres:
+            with engine.begin() as connection:
+                connection.exec_driver_sql("ANALYZE")
+
+        with Session(engine) as db, engine.connect() as explain_connection:
+            if is_postgres:
+                explain_connection.exec_driver_sql("SET enable_seqscan = off")
+            explain = _postgres_scans if is_postgres else _sqlite_scans
+
+            # User 16 owns team 3 and is a member of teams 1 and 2.
+            for name, check in _checks(db, user_id=16, team_id=3, project_id=13):
+                # Start cold so every check reaches the database; the rollback
+                # also drops the session's request loader.
+                db.rollback()
+                membership_cache.clear()
+                user_lookup_cache.clear()
+                with _capture(engine) as statements:
+                    check()
+                check_failures = 0
+                for index, (statement, parameters) in enumerate(statements, start=1):
+                    lines, bad = explain(explain_connection, statement, parameters)
+                    if bad or args.verbose:
+                        print(f"[{'FAIL' if bad else 'ok'}] {name} #{index}")
+                        for line in lines:
+                            print(f"    {line}")
+                    if bad:
+                        check_failures += 1
+                        print(f"    full scan: {', '.join(bad)}")
+                if not check_failures and not args.verbose:
+                    print(f"[ok] {name} ({len(statements)} statements)")
+                failures += check_failures
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+        shutil.rmtree(_SCRATCH_DIR, ignore_errors=True)
+
+    if failures:
+        print(f"\n{failures} statement(s) regressed to a full table scan.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Measure cold-start cost of one API worker.
+
+Spawns `uvicorn app.main:app`, polls until the first request succeeds and
+prints the time to first response, then reads the worker's own startup
+report (import time, lifespan time, first-request latency) from
+`/admin/metrics`.
+
+Usage (from backend/):
+
+    python scripts/measure_startup.py --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import secrets
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+
+def _get(url: str, headers: dict[str, str]) -> dict | None:
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=2) as response:
+            return json.loads(response.read())
+    except (urllib.error.URLError, ConnectionError):
+        return None
+
+
+def _measure_once(port: int, headers: dict[str, str]) -> dict[str, float]:
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=os.environ.copy(),
+    )
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        while _get(f"{base_url}/openapi.json", headers) is None:
+            if server.poll() is not None:
+                raise RuntimeError("Server exited during startup")
+            time.sleep(0.02)
+        ready_seconds = time.perf_counter() - started
+
+        payload = _get(f"{base_url}/admin/metrics", headers) or {}
+        report = (payload.get("data") or {}).get("startup") or {}
+        return {
+            "process_to_first_response_ms": ready_seconds * 1000,
+            "import_ms": report.get("import_ms") or 0.0,
+            "lifespan_startup_ms": report.get("lifespan_startup_ms") or 0.0,
+            "first_request_ms": report.get("first_request_ms") or 0.0,
+        }
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--port", type=int, default=8200)
+    args = parser.parse_args()
+
+    # The spawned server inherits the environment; give it a token if none is set.
+    token = os.environ.setdefault("ADMIN_METRICS_TOKEN", secrets.token_urlsafe(24))
+    headers = {"X-Admin-Token": token}
+
+    runs = [_measure_once(args.port, headers) for _ in range(args.runs)]
+    for key in runs[0]:
+        values = [run[key] for run in runs]
+        print(f"{key:<32} median={statistics.median(values):8.1f}  max={max(values):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Repair drift in the per-project task counters.
+
+Recounts `project_task_stats` from the tasks table and rewrites every row that
+disagrees. The triggers keep the table exact in normal operation; run this after
+restoring a backup, editing tasks by hand with the triggers disabled, or when
+`GET /teams/{id}/projects` shows counts that do not match the board.
+
+Usage (from backend/, uses DATABASE_URL from .env):
+
+    python scripts/reconcile_task_stats.py --dry-run
+    python scripts/reconcile_task_stats.py [--project-id 42]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.database import SessionLocal, init_engines  # noqa: E402
+from app.services.project_service import reconcile_task_stats  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--project-id", type=int, help="only reconcile this project")
+    parser.add_argument("--dry-run", action="store_true", help="report drift without fixing it")
+    args = parser.parse_args()
+
+    init_engines()
+    with SessionLocal() as db:
+        drift = reconcile_task_stats(db, project_id=args.project_id, dry_run=args.dry_run)
+
+    for project_id, status, stored, actual in drift:
+        print(f"project {project_id} {status}: stored {'-' if stored is None else stored}, actual {actual}")
+    verb = "found" if args.dry_run else "fixed"
+    print(f"{verb} {len(drift)} drifted row(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
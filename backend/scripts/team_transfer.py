@@ -0,0 +1,76 @@
+"""Export a team to NDJSON/CSV, or import such a file into a team.
+
+Uses the same streaming export and staged, set-based import as
+`GET /teams/{id}/export` and `POST /teams/{id}/import`, with progress on stderr.
+Imports run as `--as-user`, who must own the target team.
+
+Usage (from backend/, uses DATABASE_URL from .env):
+
+    python scripts/team_transfer.py export --team-id 3 > team-3.ndjson
+    python scripts/team_transfer.py export --team-id 3 --format csv --entity tasks > tasks.csv
+    python scripts/team_transfer.py import --team-id 7 --as-user alice team-3.ndjson
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select  # noqa: E402
+
+from app.core.database import SessionLocal, init_engines  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.schemas.transfer import TransferEntity, TransferFormat  # noqa: E402
+from app.services.transfer_service import import_team_data, stream_team_export  # noqa: E402
+
+
+def _progress(started: float):
+    def report(stage: str, count: int) -> None:
+        print(f"[{time.perf_counter() - started:7.1f}s] {stage}: {count}", file=sys.stderr)
+
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("action", choices=["export", "import"])
+    parser.add_argument("path", nargs="?", help="file to import (default: stdin)")
+    parser.add_argument("--team-id", type=int, required=True)
+    parser.add_argument("--format", type=TransferFormat, default=TransferFormat.NDJSON)
+    parser.add_argument("--entity", type=TransferEntity)
+    parser.add_argument("--as-user", help="username of a team owner (import only)")
+    args = parser.parse_intermixed_args()
+
+    init_engines()
+    if args.action == "export":
+        for chunk in stream_team_export(SessionLocal(), args.team_id, args.format, args.entity):
+            sys.stdout.buffer.write(chunk)
+        return 0
+
+    if not args.as_user:
+        parser.error("import needs --as-user")
+    with SessionLocal() as db:
+        user_id = db.execute(select(User.id).where(User.username == args.as_user)).scalar_one_or_none()
+        if user_id is None:
+            parser.error(f"unknown user {args.as_user!r}")
+        with open(args.path, "rb") if args.path else sys.stdin.buffer as stream:
+            result = import_team_data(
+                db,
+                team_id=args.team_id,
+                current_user_id=user_id,
+                stream=stream,
+                fmt=args.format,
+                entity=args.entity,
+                progress=_progress(time.perf_counter()),
+            )
+    for name, counts in result:
+        print(f"{name}: read {counts.read}, inserted {counts.inserted}, skipped {counts.skipped}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,7 +14,7 @@ import { useWorkspace } from "../hooks/useWorkspace";
 import {
   createProject,
   deleteProject,
-  listProjects,
+  listProjectPage,
   updateProject,
   type Project,
 } from "../services/projectService";
@@ -22,10 +22,12 @@ import {
   assignTask,
   createTask,
   deleteTask,
-  listTasks,
+  listTaskPage,
+  subscribeProjectEvents,
   updateTask,
   updateTaskStatus,
   type Task,
+  type TaskEvent,
   type TaskStatus,
 } from "../services/taskService";
 import { listTeamMembers, type TeamMember } from "../services/teamService";
@@ -46,6 +48,38 @@ function fromDateInput(value: string): string | null {
   return parsed.toISOString();
 }
 
+// Wait before reopening a dropped event stream.
+const EVENT_RETRY_MS = 5_000;
+
+// Fold a task event from the project's stream into the loaded tasks.
+function applyTaskEvent(tasks: Task[], event: TaskEvent, currentUserId: number | null): Task[] {
+  switch (event.type) {
+    case "task.created":
+      if (tasks.some((task) => task.id === event.data.id)) return tasks;
+      return [{ ...event.data, can_update: event.data.assigned_user_id === currentUserId }, ...tasks];
+    case "task.assigned":
+      return tasks.map((task) =>
+        task.id === event.data.id
+          ? { ...task, ...event.data, can_update: event.data.assigned_user_id === currentUserId }
+          : task
+      );
+    case "task.updated":
+    case "task.status":
+      return tasks.map((task) => (task.id === event.data.id ? { ...task, ...event.data } : task));
+    case "task.deleted":
+      return tasks.filter((task) => task.id !== event.data.id);
+    default:
+      return tasks;
+  }
+}
+
+// Items created locally since the first page was loaded can show up again on a
+// later page; keep the copy already on screen.
+function appendNew<T extends { id: number }>(current: T[], next: T[]): T[] {
+  const seen = new Set(current.map((item) => item.id));
+  return [...current, ...next.filter((item) => !seen.has(item.id))];
+}
+
 type TaskModalState = {
   open: boolean;
   mode: "create" | "edit";
@@ -57,18 +91,22 @@ export default function ProjectPage() {
   const { teamId } = useParams();
   const parsedTeamId = Number(teamId);
 
-  const { token } = useAuth();
+  const { token, user } = useAuth();
+  const currentUserId = user?.id ?? null;
   const { teams } = useWorkspace();
 
   const currentTeam = teams.find((team) => team.id === parsedTeamId) ?? null;
 
   const [projects, setProjects] = useState<Project[]>([]);
+  const [projectsCursor, setProjectsCursor] = useState<string | null>(null);
   const [members, setMembers] = useState<TeamMember[]>([]);
   const [tasks, setTasks] = useState<Task[]>([]);
+  const [tasksCursor, setTasksCursor] = useState<string | null>(null);
   const [selectedProjectId, setSelectedProjectId] = useState<number | null>(null);
 
   const [loadingPage, setLoadingPage] = useState(true);
   const [loadingTasks, setLoadingTasks] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [pageError, setPageError] = useState("");
 
   const [projectName, setProjectName] = useState("");
@@ -107,17 +145,18 @@ export default function ProjectPage() {
     setPageError("");
 
     try {
-      const [projectResponse, memberResponse] = await Promise.all([
-        listProjects(token, parsedTeamId),
+      const [projectPage, memberResponse] = await Promise.all([
+        listProjectPage(token, parsedTeamId),
         listTeamMembers(token, parsedTeamId),
       ]);
 
-      setProjects(projectResponse);
+      setProjects(projectPage.items);
+      setProjectsCursor(projectPage.nextCursor);
       setMembers(memberResponse);
       setSelectedProjectId((prev) => {
-        if (!projectResponse.length) return null;
-        if (prev && projectResponse.some((project) => project.id === prev)) return prev;
-        return projectResponse[0].id;
+        if (!projectPage.items.length) return null;
+        if (prev && projectPage.items.some((project) => project.id === prev)) return prev;
+        return projectPage.items[0].id;
       });
     } catch (error) {
       setPageError(error instanceof Error ? error.message : "Failed to load project workspace");
@@ -129,14 +168,16 @@ export default function ProjectPage() {
   const loadProjectTasks = useCallback(async () => {
     if (!token || !selectedProjectId) {
       setTasks([]);
+      setTasksCursor(null);
       return;
     }
 
     setLoadingTasks(true);
     setPageError("");
     try {
-      const response = await listTasks(token, { projectId: selectedProjectId });
-      setTasks(response);
+      const page = await listTaskPage(token, { projectId: selectedProjectId });
+      setTasks(page.items);
+      setTasksCursor(page.nextCursor);
     } catch (error) {
       setPageError(error instanceof Error ? error.message : "Failed to load tasks");
     } finally {
@@ -144,6 +185,36 @@ export default function ProjectPage() {
     }
   }, [token, selectedProjectId]);
 
+  async function loadMoreProjects() {
+    if (!token || !projectsCursor) return;
+
+    setLoadingMore(true);
+    try {
+      const page = await listProjectPage(token, parsedTeamId, projectsCursor);
+      setProjects((current) => appendNew(current, page.items));
+      setProjectsCursor(page.nextCursor);
+    } catch (error) {
+      setPageError(error instanceof Error ? error.message : "Failed to load projects");
+    } finally {
+      setLoadingMore(false);
+    }
+  }
+
+  async function loadMoreTasks() {
+    if (!token || !selectedProjectId || !tasksCursor) return;
+
+    setLoadingMore(true);
+    try {
+      const page = await listTaskPage(token, { projectId: selectedProjectId }, tasksCursor);
+      setTasks((current) => appendNew(current, page.items));
+      setTasksCursor(page.nextCursor);
+    } catch (error) {
+      setPageError(error instanceof Error ? error.message : "Failed to load tasks");
+    } finally {
+      setLoadingMore(false);
+    }
+  }
+
   useEffect(() => {
     if (!Number.isInteger(parsedTeamId) || parsedTeamId <= 0) {
       setPageError("Invalid team id in URL");
@@ -158,6 +229,41 @@ export default function ProjectPage() {
     void loadProjectTasks();
   }, [loadProjectTasks]);
 
+  // Live board: apply the project's task events as they arrive instead of
+  // re-listing. Each (re)connect re-lists the first page once the stream is
+  // open, so nothing written while it was down is missed; a server `resync`
+  // does the same.
+  useEffect(() => {
+    if (!token || !selectedProjectId) return;
+
+    const controller = new AbortController();
+    const onEvent = (event: TaskEvent) => {
+      if (event.type === "resync") {
+        void loadProjectTasks();
+        return;
+      }
+      if (event.project_id !== selectedProjectId) return;
+      setTasks((current) => applyTaskEvent(current, event, currentUserId));
+    };
+
+    void (async () => {
+      while (!controller.signal.aborted) {
+        try {
+          await subscribeProjectEvents(token, selectedProjectId, onEvent, {
+            signal: controller.signal,
+            onOpen: () => void loadProjectTasks(),
+          });
+        } catch {
+          // Reconnect below.
+        }
+        if (controller.signal.aborted) return;
+        await new Promise((resolve) => setTimeout(resolve, EVENT_RETRY_MS));
+      }
+    })();
+
+    return () => controller.abort();
+  }, [token, selectedProjectId, currentUserId, loadProjectTasks]);
+
   function resetTaskForm() {
     setTaskTitle("");
     setTaskDescription("");
@@ -455,6 +561,12 @@ export default function ProjectPage() {
               ))}
             </ul>
           )}
+
+          {projectsCursor && (
+            <Button variant="secondary" size="sm" onClick={() => void loadMoreProjects()} disabled={loadingMore}>
+              {loadingMore ? "Loading..." : "Load more projects"}
+            </Button>
+          )}
         </Card>
 
         <Card>
@@ -492,6 +604,12 @@ export default function ProjectPage() {
               onDelete={setDeletingTask}
             />
           )}
+
+          {!loadingTasks && selectedProject && tasksCursor && (
+            <Button variant="secondary" size="sm" onClick={() => void loadMoreTasks()} disabled={loadingMore}>
+              {loadingMore ? "Loading..." : "Load more tasks"}
+            </Button>
+          )}
         </Card>
       </section>
 
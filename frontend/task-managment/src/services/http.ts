@@ -10,6 +10,18 @@ type ApiEnvelope<T> = {
   errors?: ApiFieldError[];
 };
 
+type PageEnvelope<T> = ApiEnvelope<T[]> & {
+  limit: number;
+  next_cursor: string | null;
+};
+
+export type Page<T> = {
+  items: T[];
+  nextCursor: string | null;
+};
+
+type QueryParams = Record<string, string | number | undefined | null>;
+
 type RequestOptions = Omit<RequestInit, "body"> & {
   body?: BodyInit | Record<string, unknown> | null;
   token?: string | null;
@@ -19,9 +31,31 @@ type RequestOptions = Omit<RequestInit, "body"> & {
 
 const ENV_API_BASE = (import.meta.env.VITE_API_URL as string | undefined)?.trim();
 const API_BASE = (ENV_API_BASE || "/api").replace(/\/+$/, "");
+// Matches the backend's maximum `limit` for list endpoints.
+const PAGE_SIZE = 200;
+// Matches the backend's READ_YOUR_WRITES_SECONDS. The backend's read_primary
+// cookie is not sent cross-origin, so after a write the client asks for primary
+// reads itself until replicas have caught up.
+const READ_YOUR_WRITES_MS = 5_000;
+const SAFE_METHODS = new Set(["GET", "HEAD", "OPTIONS"]);
 const NETWORK_ERROR_MESSAGE =
   `Cannot reach server at ${API_BASE}. Ensure backend is running. For local dev, run backend on port 8000 and restart frontend dev server.`;
 
+let readPrimaryUntil = 0;
+
+function pinReadsAfterWrite(method: string | undefined): void {
+  if (!SAFE_METHODS.has((method || "GET").toUpperCase())) {
+    readPrimaryUntil = Date.now() + READ_YOUR_WRITES_MS;
+  }
+}
+
+function withReadConsistency(headers: Headers): Headers {
+  if (Date.now() < readPrimaryUntil) {
+    headers.set("X-Read-Consistency", "primary");
+  }
+  return headers;
+}
+
 export class ApiClientError extends Error {
   status: number;
   details?: ApiFieldError[];
@@ -71,15 +105,15 @@ function parseErrorMessage(payload: unknown, fallback: string): { message: strin
   return { message: fallback };
 }
 
-export async function httpRequest<T>(
+async function sendRequest(
   path: string,
   { token = null, auth = true, fallbackError = "Request failed", headers, body, ...rest }: RequestOptions = {}
-): Promise<T> {
+): Promise<unknown> {
   if (auth && !token) {
     throw new ApiClientError("You are not signed in", 401);
   }
 
-  const requestHeaders = new Headers(headers);
+  const requestHeaders = withReadConsistency(new Headers(headers));
   if (auth && token) {
     requestHeaders.set("Authorization", `Bearer ${token}`);
   }
@@ -114,6 +148,12 @@ export async function httpRequest<T>(
     throw new ApiClientError(parsed.message, response.status, parsed.details);
   }
 
+  pinReadsAfterWrite(rest.method);
+  return payloadBody;
+}
+
+export async function httpRequest<T>(path: string, options: RequestOptions = {}): Promise<T> {
+  const payloadBody = await sendRequest(path, options);
   if (!payloadBody || typeof payloadBody !== "object") {
     return undefined as T;
   }
@@ -126,7 +166,37 @@ export async function httpRequest<T>(
   return payloadBody as T;
 }
 
-export function buildQuery(params: Record<string, string | number | undefined | null>): string {
+export async function httpRequestPage<T>(path: string, options: RequestOptions = {}): Promise<Page<T>> {
+  const payloadBody = (await sendRequest(path, options)) as Partial<PageEnvelope<T>> | null;
+  const data = payloadBody?.data;
+  return {
+    items: Array.isArray(data) ? data : [],
+    nextCursor: payloadBody?.next_cursor ?? null,
+  };
+}
+
+// List endpoints are cursor-paginated; follow `next_cursor` until the last page.
+// Only for lists the client needs in full (the team switcher, the assignee
+// picker) and exports. Screens show one page and fetch more on demand.
+export async function httpRequestAllPages<T>(
+  path: string,
+  params: QueryParams,
+  options: RequestOptions = {}
+): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const page: Page<T> = await httpRequestPage<T>(
+      `${path}${buildQuery({ ...params, limit: PAGE_SIZE, cursor })}`,
+      options
+    );
+    items.push(...page.items);
+    cursor = page.nextCursor;
+  } while (cursor);
+  return items;
+}
+
+export function buildQuery(params: QueryParams): string {
   const searchParams = new URLSearchParams();
 
   Object.entries(params).forEach(([key, value]) => {
@@ -137,3 +207,53 @@ export function buildQuery(params: Record<string, string | number | undefined |
   const query = searchParams.toString();
   return query ? `?${query}` : "";
 }
+
+// Server-sent events over fetch, because EventSource cannot send the Authorization
+// header. `onOpen` runs once the server's `: connected` comment arrives, when no
+// later event can be missed. Resolves when the server ends the stream or
+// `signal` aborts it.
+export async function streamEvents(
+  path: string,
+  onData: (data: string) => void,
+  { token, signal, onOpen }: { token: string; signal?: AbortSignal; onOpen?: () => void }
+): Promise<void> {
+  let response: Response;
+  try {
+    response = await fetch(`${API_BASE}${path}`, {
+      headers: withReadConsistency(new Headers({ Authorization: `Bearer ${token}`, Accept: "text/event-stream" })),
+      signal,
+    });
+  } catch {
+    if (signal?.aborted) return;
+    throw new ApiClientError(NETWORK_ERROR_MESSAGE, 0);
+  }
+
+  if (!response.ok || !response.body) {
+    const parsed = parseErrorMessage(await response.json().catch(() => null), "Failed to open event stream");
+    throw new ApiClientError(parsed.message, response.status, parsed.details);
+  }
+
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = "";
+  try {
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) return;
+      buffer += value;
+      let end = buffer.indexOf("\n\n");
+      while (end >= 0) {
+        const lines = buffer.slice(0, end).split("\n");
+        const data = lines
+          .filter((line) => line.startsWith("data: "))
+          .map((line) => line.slice("data: ".length))
+          .join("\n");
+        buffer = buffer.slice(end + 2);
+        if (lines.includes(": connected")) onOpen?.();
+        if (data) onData(data);
+        end = buffer.indexOf("\n\n");
+      }
+    }
+  } catch (error) {
+    if (!signal?.aborted) throw error;
+  }
+}
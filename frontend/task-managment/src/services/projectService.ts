@@ -1,4 +1,5 @@
-import { httpRequest } from "./http";
+import { buildQuery, httpRequest, httpRequestPage, type Page } from "./http";
+import type { TaskStatus } from "./taskService";
 
 export type Project = {
   id: number;
@@ -9,6 +10,8 @@ export type Project = {
   created_at: string;
   updated_at: string | null;
   can_delete: boolean;
+  task_counts: Record<TaskStatus, number>;
+  overdue_tasks: number;
 };
 
 export type ProjectInput = {
@@ -16,8 +19,9 @@ export type ProjectInput = {
   description?: string;
 };
 
-export async function listProjects(token: string, teamId: number): Promise<Project[]> {
-  return httpRequest<Project[]>(`/teams/${teamId}/projects`, {
+// One page of the team's projects; pass `nextCursor` back for the next page.
+export async function listProjectPage(token: string, teamId: number, cursor: string | null = null): Promise<Page<Project>> {
+  return httpRequestPage<Project>(`/teams/${teamId}/projects${buildQuery({ cursor })}`, {
     token,
     fallbackError: "Failed to load projects",
   });
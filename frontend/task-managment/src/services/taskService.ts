@@ -1,4 +1,4 @@
-import { buildQuery, httpRequest } from "./http";
+import { buildQuery, httpRequest, httpRequestPage, streamEvents, type Page } from "./http";
 
 export type TaskStatus = "todo" | "in-progress" | "done";
 
@@ -40,17 +40,19 @@ export type TaskSummary = {
   total_projects: number;
 };
 
-export async function listTasks(
+// One page of tasks, newest first; pass `nextCursor` back for the next page.
+export async function listTaskPage(
   token: string,
-  filters: { projectId?: number; status?: TaskStatus; assignedUserId?: number } = {}
-): Promise<Task[]> {
+  filters: { projectId?: number; status?: TaskStatus; assignedUserId?: number } = {},
+  cursor: string | null = null
+): Promise<Page<Task>> {
   const query = buildQuery({
     project_id: filters.projectId,
     status: filters.status,
     assigned_user_id: filters.assignedUserId,
+    cursor,
   });
-
-  return httpRequest<Task[]>(`/tasks/${query}`, {
+  return httpRequestPage<Task>(`/tasks/${query}`, {
     token,
     fallbackError: "Failed to load tasks",
   });
@@ -106,3 +108,45 @@ export async function getMyTaskSummary(token: string): Promise<TaskSummary> {
     fallbackError: "Failed to load my task summary",
   });
 }
+
+type TaskEventTask = Omit<Task, "can_update">;
+
+// Compact deltas from GET /projects/{project_id}/events. `resync` means the
+// client fell behind and should re-list the project's tasks.
+export type TaskEvent =
+  | { type: "task.created"; project_id: number; data: TaskEventTask }
+  | {
+      type: "task.updated";
+      project_id: number;
+      data: Pick<Task, "id" | "project_id" | "title" | "description" | "due_date" | "updated_at">;
+    }
+  | { type: "task.status"; project_id: number; data: Pick<Task, "id" | "project_id" | "status" | "updated_at"> }
+  | {
+      type: "task.assigned";
+      project_id: number;
+      data: Pick<
+        Task,
+        | "id"
+        | "project_id"
+        | "assigned_user_id"
+        | "assigned_username"
+        | "assigned_first_name"
+        | "assigned_last_name"
+        | "updated_at"
+      >;
+    }
+  | { type: "task.deleted"; project_id: number; data: Pick<Task, "id" | "project_id"> }
+  | { type: "resync"; project_id?: number };
+
+export async function subscribeProjectEvents(
+  token: string,
+  projectId: number,
+  onEvent: (event: TaskEvent) => void,
+  { signal, onOpen }: { signal?: AbortSignal; onOpen?: () => void } = {}
+): Promise<void> {
+  return streamEvents(`/projects/${projectId}/events`, (data) => onEvent(JSON.parse(data) as TaskEvent), {
+    token,
+    signal,
+    onOpen,
+  });
+}
@@ -1,4 +1,4 @@
-import { httpRequest } from "./http";
+import { httpRequest, httpRequestAllPages } from "./http";
 
 export type TeamRole = "owner" | "member";
 
@@ -35,7 +35,7 @@ export type InviteMemberInput = {
 };
 
 export async function listTeams(token: string): Promise<Team[]> {
-  return httpRequest<Team[]>("/teams/", {
+  return httpRequestAllPages<Team>("/teams/", {}, {
     token,
     fallbackError: "Failed to load teams",
   });
@@ -51,7 +51,7 @@ export async function createTeam(token: string, input: CreateTeamInput): Promise
 }
 
 export async function listTeamMembers(token: string, teamId: number): Promise<TeamMember[]> {
-  return httpRequest<TeamMember[]>(`/teams/${teamId}/members`, {
+  return httpRequestAllPages<TeamMember>(`/teams/${teamId}/members`, {}, {
     token,
     fallbackError: "Failed to load team members",
   });